@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.08
+# Updated:    2026.10.18
 #
 # This is the file for the hackerbot package. It imports
 # and initialized the sub components
@@ -22,12 +22,79 @@ from .head import Head
 from .arm import Arm
 from .utils.hackerbot_helper import HackerbotHelper
 
+# Subsystems each model is built with, every subsystem when model is None or unknown
+MODEL_SUBSYSTEMS = {
+    "lite": ("base",),
+    "ai_pro": ("base", "head"),
+    "ai_elite": ("base", "head", "arm"),
+}
+
 class Hackerbot(HackerbotHelper):
-    def __init__(self, port=None, board=None, model=None,verbose_mode=False):
-        super().__init__(port, board, verbose_mode)
-        # Share self (which is a HackerbotHelper) with subsystems
-        self.core = Core(controller=self)
-        self.base = Base(controller=self)
-        self.head = Head(controller=self)
-        self.arm = Arm(controller=self)
-        # TODO based on model decide which subsystems to initialize
\ No newline at end of file
+    def __init__(self, port=None, board=None, model=None,verbose_mode=False, metrics_port=None, command_policies=None,
+                 serial_number=None, shared=False):
+        self.model = model
+        # Robot shared with other programs, e.g. through the daemon: no B_INIT, H_IDLE or B_KILL on
+        # setup and destroy, so the others are not interrupted
+        self.shared = shared
+        # e.g. {"B_MAPDATA": {"deadline": 12.0}}, see utils/command_policy.py for the defaults
+        self._startup_policies = command_policies or {}
+        self._ping_response = None
+        self._head = None
+        self._arm = None
+        self._skipped_subsystems = set()  # Subsystems already warned about
+
+        # serial_number picks one of several boards when the port is found automatically
+        super().__init__(port, board, verbose_mode, serial_number)
+        if model is not None and model not in MODEL_SUBSYSTEMS:
+            self.log_warning(f"Unknown model: {model}, building every subsystem. Known models: {', '.join(MODEL_SUBSYSTEMS)}")
+        if metrics_port is not None:
+            # Prometheus text format on http://127.0.0.1:<metrics_port>/metrics
+            self.start_metrics_server(metrics_port)
+        # Share self (which is a HackerbotHelper) with subsystems. Head and Arm are created on first access
+        self.core = Core(controller=self, ping_response=self._ping_response)
+        self.base = Base(controller=self, shared=shared)
+
+    def _handshake(self):
+        for command, policy in self._startup_policies.items():
+            self.set_command_policy(command, **policy)
+        try:
+            # JSON mode and the component ping go out in one write, one round trip instead of two
+            _, self._ping_response = self.send_commands_and_wait([("JSON, 1", "json"), ("PING", "ping")])
+            self._json_mode = True
+        except ConnectionError:
+            raise
+        except Exception:
+            # Fall back to the sequential handshake with the usual retries, Core pings on its own
+            self._ping_response = None
+            self.set_json_mode(True)
+
+    def _subsystem_available(self, name, attached):
+        subsystems = MODEL_SUBSYSTEMS.get(self.model)  # None without a model or for an unknown one
+        if subsystems is not None and name not in subsystems:
+            reason = f"not part of the {self.model} model"
+        elif not attached:
+            reason = "not attached"  # Checked again on the next access, a later ping may find it
+        else:
+            return True
+        if name not in self._skipped_subsystems:
+            self._skipped_subsystems.add(name)
+            self.log_warning(f"{name.capitalize()} {reason}, skipping it.")
+        return False
+
+    @property
+    def head(self):
+        """Head component, created on first access. None if the model has no head or it is not attached."""
+        if self._head is None:
+            if not self._subsystem_available("head", self._dynamixel_controller_attached or self._audio_mouth_eyes_attached):
+                return None
+            self._head = Head(controller=self, shared=self.shared)
+        return self._head
+
+    @property
+    def arm(self):
+        """Arm component, created on first access. None if the model has no arm or it is not attached."""
+        if self._arm is None:
+            if not self._subsystem_available("arm", self._arm_attached):
+                return None
+            self._arm = Arm(controller=self)
+        return self._arm
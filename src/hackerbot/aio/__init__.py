@@ -0,0 +1,143 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This is the asyncio version of the hackerbot package. AsyncHackerbot runs on
+# an AsyncConnection, so one event loop can drive several robots:
+#
+#     bot = await AsyncHackerbot.connect(port="/dev/ttyACM0")
+#     await bot.base.drive(100, 0)
+#     await bot.close()
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import logging
+from .connection import AsyncConnection
+from .core import AsyncCore
+from .base import AsyncBase, AsyncMaps
+from .head import AsyncHead, AsyncEyes
+from .arm import AsyncArm, AsyncGripper
+
+class AsyncHackerbot():
+    def __init__(self, connection, verbose_mode=False):
+        """
+        Use AsyncHackerbot.connect to create an AsyncHackerbot.
+
+        :param connection: Open AsyncConnection
+        :param verbose_mode: Log errors and warnings
+        """
+        self.connection = connection
+        self._error_msg = ""
+        self._warning_msg = ""
+        self._v_mode = verbose_mode
+        self._main_controller_init = True
+        self._json_mode = False
+
+        self._main_controller_attached = False
+        self._temperature_sensor_attached = False
+        self._left_tof_attached = False
+        self._right_tof_attached = False
+        self._base_init = False
+        self._driver_mode = False
+        self._audio_mouth_eyes_attached = False
+        self._dynamixel_controller_attached = False
+        self._arm_attached = False
+
+        self.core = AsyncCore(controller=self)
+        self.base = AsyncBase(controller=self)
+        self.head = AsyncHead(controller=self)
+        self.arm = AsyncArm(controller=self)
+
+    @classmethod
+    async def connect(cls, port=None, board="adafruit:samd:adafruit_qt_py_m0", verbose_mode=False, command_policies=None,
+                      serial_number=None):
+        """
+        Connect to a robot and run the same setup as Hackerbot: JSON mode, ping, base init and head idle.
+
+        :param port: Device path, "tcp://host:port" or "unix:///path". Found automatically if None
+        :param command_policies: Overrides of the default command policies,
+            e.g. {"B_MAPDATA": {"deadline": 12.0}}, see utils/command_policy.py
+        :param serial_number: USB serial number of the board to find when several are plugged in
+        :return: The ready AsyncHackerbot
+        """
+        connection = await AsyncConnection.open(port, board, command_policies=command_policies,
+                                                serial_number=serial_number)
+        bot = cls(connection, verbose_mode)
+        try:
+            await bot.set_json_mode(True)
+            await bot.core.ping()
+            await bot.base.initialize()
+            await bot.head.setup()
+            bot.arm.setup()
+        except Exception:
+            connection.close()
+            raise
+        return bot
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def set_json_mode(self, mode):
+        try:
+            if mode:
+                await self.connection.request("JSON, 1", "json")
+            else:
+                self.connection.send("JSON, 0")
+            self._json_mode = mode
+        except Exception as e:
+            raise Exception(f"Error in set_json_mode: {e}")
+
+    def send_raw_command(self, command):
+        self.connection.send(command)
+
+    async def request(self, command, command_filter, timeout=None, retries=None):
+        """Send a command and await its JSON response, see AsyncConnection.request."""
+        return await self.connection.request(command, command_filter, timeout, retries)
+
+    def get_command_policy(self, command):
+        return self.connection.get_command_policy(command)
+
+    def set_command_policy(self, command, deadline=None, retries=None, backoff=None, settle=None):
+        return self.connection.set_command_policy(command, deadline, retries, backoff, settle)
+
+    def get_board_and_port(self):
+        return self.connection.board, self.connection.port
+
+    def get_error(self):
+        # Serial error should be priority
+        if self.connection.ser_error is not None:
+            return self.connection.ser_error
+        return self._error_msg
+
+    def log_error(self, error):
+        if self._v_mode:
+            logging.error(error)
+        self._error_msg = error
+
+    def log_warning(self, warning):
+        if self._v_mode:
+            logging.warning(warning)
+        self._warning_msg = warning
+
+    def check_controller_init(self):
+        if not self._main_controller_init:
+            raise Exception("Main controller not initialized.")
+        if not self._json_mode:
+            raise Exception("JSON mode not enabled.")
+
+    async def close(self):
+        """Close the connection to the robot."""
+        self.connection.close()
+        self._main_controller_init = False
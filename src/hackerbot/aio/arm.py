@@ -0,0 +1,52 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the AsyncArm and AsyncGripper components of the
+# AsyncHackerbot, the awaitable counterparts of hackerbot.arm.Arm and
+# hackerbot.arm.gripper.Gripper.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+from hackerbot.arm import Arm
+from hackerbot.arm.gripper import Gripper
+
+class AsyncArm(Arm):
+    def __init__(self, controller):
+        """
+        Initialize AsyncArm component with AsyncHackerbot object. Unlike Arm it does not
+        set up, AsyncHackerbot.connect calls setup().
+
+        :param controller: AsyncHackerbot object
+        """
+        self._controller = controller
+        self.idle_mode = True
+        self.gripper = AsyncGripper(self._controller)
+
+    # The arm commands have no response, so these send right away like the Arm methods
+
+    async def move_joint(self, joint_id, angle, speed):
+        return super().move_joint(joint_id, angle, speed)
+
+    async def move_joints(self, j_agl_1, j_agl_2, j_agl_3, j_agl_4, j_agl_5, j_agl_6, speed):
+        return super().move_joints(j_agl_1, j_agl_2, j_agl_3, j_agl_4, j_agl_5, j_agl_6, speed)
+
+
+class AsyncGripper(Gripper):
+    async def calibrate(self):
+        return super().calibrate()
+
+    async def open(self):
+        return super().open()
+
+    async def close(self):
+        return super().close()
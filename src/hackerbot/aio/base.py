@@ -0,0 +1,334 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the AsyncBase and AsyncMaps components of the
+# AsyncHackerbot, the awaitable counterparts of hackerbot.base.Base and
+# hackerbot.base.maps.Maps. Waits are asyncio.sleep and awaited responses,
+# so they never block the event loop. Entries are interpreted by the Base and
+# Maps helpers, settle times come from the command policies.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import asyncio
+from hackerbot.base import Base
+from hackerbot.base.maps import Maps
+from hackerbot.base.motion import POLL_MIN, POLL_MAX
+
+class AsyncMotionWait():
+    def __init__(self, controller, command, response, name):
+        """
+        Awaitable counterpart of hackerbot.base.motion.MotionWait. AsyncConnection has no
+        subscriptions, so every entry comes from a poll.
+
+        :param controller: AsyncHackerbot object
+        :param command: Poll command, e.g. "B_STATUS"
+        :param response: Response name of the poll command, e.g. "status"
+        :param name: Motion name for the timeout warning, e.g. "Base motion"
+        """
+        self._controller = controller
+        self._name = name
+        self._command = command
+        self._response = response
+        self._event = asyncio.Event()  # Set by cancel() to wake the wait
+        self._cancelled = False
+
+    def reset(self):
+        """Forget an earlier cancel(). Call when the public call starts."""
+        self._cancelled = False
+        self._event.clear()
+
+    def cancel(self):
+        """End the current wait from another task, it returns False."""
+        self._cancelled = True
+        self._event.set()
+
+    async def wait(self, completed, progress=None, timeout=None, poll_min=POLL_MIN, poll_max=POLL_MAX):
+        """
+        Poll until an entry completes the motion. The interval doubles up to poll_max while
+        progress(entry) stays the same, see MotionWait.wait.
+
+        :param completed: completed(entry) -> True once the motion is done
+        :param progress: progress(entry) -> value that stays the same while the motion is steady.
+            None to back off on every entry
+        :param timeout: Seconds to wait, None to wait until completed
+        :return: True if completed, False on timeout or cancel() since the last reset()
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = poll_min
+        state = None
+        while not self._cancelled:
+            entry = await self._poll(deadline)
+            if self._cancelled:
+                break
+            if entry is not None:
+                if completed(entry):
+                    return True
+                new_state = None if progress is None else progress(entry)
+                interval = min(interval * 2, poll_max) if new_state == state else poll_min
+                state = new_state
+            wait = interval if deadline is None else min(interval, deadline - loop.time())
+            try:
+                await asyncio.wait_for(self._event.wait(), max(wait, 0))
+            except asyncio.TimeoutError:
+                pass
+            if not self._cancelled and deadline is not None and loop.time() >= deadline:
+                self._controller.log_warning(f"{self._name} not completed after {timeout} seconds")
+                return False
+        return False
+
+    async def _poll(self, deadline):
+        """Latest entry, or None if the poll got no answer before its policy deadline or the wait deadline."""
+        request = self._controller.request(self._command, self._response)
+        try:
+            if deadline is None:
+                return await request
+            return await asyncio.wait_for(request, max(deadline - asyncio.get_running_loop().time(), 0))
+        except asyncio.TimeoutError:
+            return None
+
+
+class AsyncBase():
+    MOTION_POLL_MIN = Base.MOTION_POLL_MIN # Seconds between B_STATUS polls while the set speeds are changing
+    MOTION_POLL_MAX = Base.MOTION_POLL_MAX # Longest poll interval, reached while the set speeds stay the same
+
+    def __init__(self, controller):
+        """
+        Initialize AsyncBase component with AsyncHackerbot object
+
+        :param controller: AsyncHackerbot object
+        """
+        self._controller = controller
+        self.maps = AsyncMaps(controller)
+
+        self._future_completed = False
+        self._docked = True # Default to true, assume always start from charger
+
+        self._motion = AsyncMotionWait(controller, "B_STATUS", "status", "Base motion")
+
+    async def initialize(self):
+        try:
+            self._controller.send_raw_command("B_INIT")
+            self._controller._base_init = True
+            return True
+        except Exception as e:
+            self._controller.log_error(f"Error in base:initialize: {e}")
+            raise Exception(f"Error in initialize: {e}")
+
+    async def status(self, deadline=None, retries=None):
+        """
+        Get the wheel encoders, speeds and wall distance of the base.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the B_STATUS policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_STATUS policy
+        :return: Dict of the status fields if successful, None otherwise.
+        """
+        try:
+            response = await self._controller.request("B_STATUS", "status", deadline, retries)
+            self._future_completed = Base._set_speeds(response) == (0, 0)
+            return Base._parse_status(response)
+        except Exception as e:
+            self._controller.log_error(f"Error in base:status: {e}")
+            return None
+
+    async def start(self, block=True, timeout=None):
+        self._motion.reset()
+        return await self._start(block, timeout)
+
+    async def _start(self, block, timeout):
+        try:
+            self._controller.send_raw_command("B_START")
+            self._controller._driver_mode = True
+            if self._docked:
+                await asyncio.sleep(self._controller.get_command_policy("B_START").settle) # Time to leave the dock
+                self._docked = False
+            return await self._wait_until_completed(block=block, timeout=timeout)
+        except Exception as e:
+            self._controller.log_error(f"Error in base:start: {e}")
+            return False
+
+    async def dock(self, block=True, timeout=None):
+        """
+        Dock the base to the docking station.
+
+        :param timeout: Seconds to wait when blocking, None to wait until docked.
+        :return: True if docked (or the command sent when not blocking), False otherwise.
+        """
+        self._motion.reset()
+        try:
+            self._controller.send_raw_command("B_DOCK")
+            await asyncio.sleep(self._controller.get_command_policy("B_DOCK").settle)
+            completed = await self._wait_until_completed(block=block, timeout=timeout)
+            if completed:
+                self._docked = True
+                self._controller._driver_mode = False
+            return completed
+        except Exception as e:
+            self._controller.log_error(f"Error in base:dock: {e}")
+            return False
+
+    async def kill(self):
+        try:
+            self._controller.send_raw_command("B_KILL")
+            self._controller._base_init = False
+            return True
+        except Exception as e:
+            self._controller.log_error(f"Error in base:kill: {e}")
+            return False
+
+    async def drive(self, l_vel, a_vel, block=True, timeout=None):
+        """
+        Set the base velocity.
+
+        :param l_vel: Linear velocity in mm/s. Positive is forward, negative is backward.
+        :param a_vel: Angular velocity in degrees/s. Positive is counterclockwise, negative is clockwise.
+        :param block: Wait until the base has stopped.
+        :param timeout: Seconds to wait when blocking, None to wait until stopped. Includes the
+            implicit start when the base is not in driver mode yet.
+        :return: True if the command is successful, False if it fails, times out or is cancelled.
+        """
+        self._motion.reset()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            if not self._controller._driver_mode:
+                if not await self._start(block=True, timeout=timeout):
+                    self._controller.log_error("Error in base:drive: start did not complete, not driving")
+                    return False
+            await self._controller.request(f"B_DRIVE,{l_vel},{a_vel}", "drive")
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            return await self._wait_until_completed(block=block, timeout=remaining)
+        except Exception as e:
+            self._controller.log_error(f"Error in base:drive: {e}")
+            return False
+
+    def cancel(self):
+        """
+        Stop waiting for the current blocking start, dock or drive, which then returns
+        False. Call from another task. The base keeps moving, use kill() to stop it.
+        """
+        self._motion.cancel()
+
+    async def _wait_until_completed(self, block=True, timeout=None):
+        """
+        Wait until the base reports zero set speeds, B_STATUS polls back off up to
+        MOTION_POLL_MAX while the set speeds stay the same.
+
+        :param timeout: Seconds to wait, None to wait until completed
+        :return: True if completed, False on timeout or cancel()
+        """
+        if not block:
+            return True
+        return await self._motion.wait(lambda entry: Base._set_speeds(entry) == (0, 0), progress=Base._set_speeds,
+                                       timeout=timeout, poll_min=self.MOTION_POLL_MIN, poll_max=self.MOTION_POLL_MAX)
+
+
+class AsyncMaps(Maps):
+    def __init__(self, controller):
+        """
+        Initialize AsyncMaps component with AsyncHackerbot object. Poses are interpreted and
+        goals checked by the Maps helpers.
+
+        :param controller: AsyncHackerbot object
+        """
+        super().__init__(controller)
+        self._goto_wait = AsyncMotionWait(controller, "B_POSE", "pose", "Goto")
+
+    async def fetch(self, map_id, deadline=None, retries=None):
+        """
+        Fetch the map data for a given map id.
+
+        :param map_id: The id of the map to fetch
+        :param deadline: Seconds to wait for each attempt, defaults to the B_MAPDATA policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_MAPDATA policy
+        :return: The compressed map data as a string if successful, None otherwise.
+        """
+        try:
+            map_data_json = await self._controller.request(f"B_MAPDATA,{map_id}", "mapdata", deadline, retries)
+            return map_data_json.get("compressedmapdata")
+        except Exception as e:
+            self._controller.log_error(f"Error in maps:fetch: {e}")
+            return None
+
+    async def list(self, deadline=None, retries=None):
+        """
+        Get a list of available maps.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the B_MAPLIST policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_MAPLIST policy
+        :return: A list of map ids if successful, None otherwise.
+        """
+        try:
+            map_list_json = await self._controller.request("B_MAPLIST", "maplist", deadline, retries)
+            return map_list_json.get("map_ids")
+        except Exception as e:
+            self._controller.log_error(f"Error in maps:list: {e}")
+            return None
+
+    async def goto(self, x, y, angle, speed, block=True, timeout=None):
+        """
+        Move the robot to the specified location on the map.
+
+        Args:
+            x (float): The x coordinate of the location to move to, in meters.
+            y (float): The y coordinate of the location to move to, in meters.
+            angle (float): The angle of the location to move to, in degrees.
+            speed (float): The speed at which to move to the location, in meters per second.
+            block (bool): Wait until the location is reached.
+            timeout (float): Seconds to wait when blocking, None to wait until reached.
+
+        Returns:
+            bool: True if the command was successfully sent (and the location reached when
+            blocking), False if an error occurred, the wait timed out or was cancelled.
+        """
+        self._goto_wait.reset()
+        try:
+            self._controller.send_raw_command(f"B_GOTO,{x},{y},{angle},{speed}")
+            self._goal_x = x
+            self._goal_y = y
+            self._goal_angle = angle
+            if self._docked == True:
+                await asyncio.sleep(self._controller.get_command_policy("B_GOTO").settle) # Some time to leave the base
+                self._docked = False
+            if block:
+                return await self._wait_until_reach_pose(timeout)
+            return True
+        except Exception as e:
+            self._controller.log_error(f"Error in maps:goto: {e}")
+            return False
+
+    async def position(self, deadline=None, retries=None):
+        """
+        Get the current position of the robot on the map.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the B_POSE policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_POSE policy
+        :return: Dict with "x", "y" and "angle" if successful, False otherwise.
+        """
+        try:
+            pose = await self._controller.request("B_POSE", "pose", deadline, retries)
+            self._update_pose(pose)
+            return {"x": self._x, "y": self._y, "angle": self._angle}
+        except Exception as e:
+            self._controller.log_error(f"Error in base:position: {e}")
+            return False
+
+    async def _wait_until_reach_pose(self, timeout=None):
+        """
+        Poll the pose until it is at the goal, backing off up to GOTO_POLL_MAX.
+
+        :param timeout: Seconds to wait, None to wait until reached
+        :return: True if reached, False on timeout or cancel()
+        """
+        return await self._goto_wait.wait(self._reached_pose, timeout=timeout,
+                                          poll_min=self.GOTO_POLL_MIN, poll_max=self.GOTO_POLL_MAX)
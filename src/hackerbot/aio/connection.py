@@ -0,0 +1,270 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the AsyncConnection class, the asyncio counterpart of
+# SerialHelper. Serial ports are non-blocking and watched with loop.add_reader
+# and loop.add_writer, "tcp://" and "unix://" ports use asyncio socket
+# transports. Everything runs on the event loop, only port discovery and
+# opening the serial port run in the default executor. Requests wait and retry
+# according to the same command policies as SerialHelper.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import json
+import asyncio
+import serial
+from collections import deque
+from hackerbot.utils.serial_helper import SerialHelper
+from hackerbot.utils.port_discovery import discover_port, PORT_CACHE_PATH
+from hackerbot.utils.command_policy import CommandPolicies, DEFAULT_COMMAND_POLICIES, command_name
+
+class AsyncConnection(asyncio.Protocol, CommandPolicies):
+    RESPONSE_TIMEOUT = SerialHelper.RESPONSE_TIMEOUT # Seconds to wait for a JSON response to a command without a policy
+    MAX_LINE_SIZE = SerialHelper.MAX_LINE_SIZE # Bytes buffered without a newline before they are dropped
+
+    PORT_CACHE_PATH = PORT_CACHE_PATH # Last auto-detected port, shared with SerialHelper
+
+    def __init__(self, port=None, board="adafruit:samd:adafruit_qt_py_m0", baudrate=230400, command_policies=None,
+                 serial_number=None):
+        self.port = port
+        self.board = board
+        self.baudrate = baudrate
+        self.serial_number = serial_number  # USB serial number port discovery requires, to pick one of several boards
+        self.ser = None  # serial.Serial for device paths
+        self.transport = None  # asyncio transport for socket ports
+        self.ser_error = None
+
+        self._loop = None
+        self._rx_buffer = bytearray()
+        self._tx_buffer = bytearray()  # Serial bytes the port did not take yet, flushed by _write_serial
+        self._responses = {}  # "command" name -> latest JSON entry
+        self._waiters = {}  # "command" name -> deque of asyncio futures, oldest first
+        self._closed = False
+
+        self._command_policies = dict(DEFAULT_COMMAND_POLICIES)  # command name -> CommandPolicy
+        # e.g. {"B_MAPDATA": {"deadline": 12.0}}, see utils/command_policy.py for the defaults
+        for command, policy in (command_policies or {}).items():
+            self.set_command_policy(command, **policy)
+
+    @classmethod
+    async def open(cls, port=None, board="adafruit:samd:adafruit_qt_py_m0", baudrate=230400, command_policies=None,
+                   serial_number=None):
+        """
+        Open a connection to the main controller.
+
+        :param port: Device path, "tcp://host:port" or "unix:///path". Found automatically if None
+        :param command_policies: Overrides of the default command policies, see set_command_policy
+        :param serial_number: USB serial number of the board to find when several are plugged in
+        :return: The open AsyncConnection
+        """
+        connection = cls(port, board, baudrate, command_policies, serial_number)
+        await connection._open()
+        return connection
+
+    async def _open(self):
+        self._loop = asyncio.get_running_loop()
+        if self.port is None:
+            # Enumerating USB devices blocks, keep it off the loop
+            self.port = await self._loop.run_in_executor(
+                None, lambda: discover_port(self.board, self.serial_number, cache_path=self.PORT_CACHE_PATH))
+        if not isinstance(self.port, str):
+            raise ValueError(f"Unsupported port for AsyncConnection: {self.port!r}")
+
+        if self.port.startswith("tcp://"):
+            host, _, tcp_port = self.port[len("tcp://"):].rpartition(":")
+            if not host or not tcp_port.isdigit():
+                raise ValueError(f"Invalid TCP port: {self.port}, expected tcp://host:port")
+            await self._loop.create_connection(lambda: self, host.strip("[]"), int(tcp_port))
+        elif self.port.startswith("unix://"):
+            await self._loop.create_unix_connection(lambda: self, self.port[len("unix://"):])
+        else:
+            try:
+                # timeout=0 and write_timeout=0 make reads and writes return right away
+                self.ser = await self._loop.run_in_executor(
+                    None, lambda: serial.Serial(port=self.port, baudrate=self.baudrate, timeout=0, write_timeout=0))
+            except serial.SerialException as e:
+                raise ConnectionError(f"Serial connection error: {self.port}. {e}")
+            self._loop.add_reader(self.ser.fileno(), self._read_serial)
+
+    ##### asyncio.Protocol callbacks, used by socket ports
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self._handle_rx_data(data)
+
+    def connection_lost(self, exc):
+        self._connection_lost(exc or ConnectionError("Connection closed by the remote end"))
+
+    #####
+
+    def _read_serial(self):
+        try:
+            data = self.ser.read(self.ser.in_waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            self._loop.remove_reader(self.ser.fileno())
+            self._connection_lost(e)
+            return
+        if data:
+            self._handle_rx_data(data)
+
+    def _write_serial(self):
+        # Writable again, send what the port did not take before
+        try:
+            written = self.ser.write(self._tx_buffer)
+        except (serial.SerialException, OSError) as e:
+            self._loop.remove_writer(self.ser.fileno())
+            self._tx_buffer.clear()
+            self._connection_lost(e)
+            return
+        del self._tx_buffer[:written]
+        if not self._tx_buffer:
+            self._loop.remove_writer(self.ser.fileno())
+
+    def _connection_lost(self, error):
+        if not self._closed:
+            self.ser_error = f"Serial read error: {error}"
+        self._fail_waiters(ConnectionError(f"Serial link lost: {error}"))
+
+    def _handle_rx_data(self, data):
+        buffer = self._rx_buffer
+        buffer += data
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line = bytes(buffer[start:end])
+            start = end + 1
+            if b'"command"' in line:
+                self._handle_line(line)
+        if start:
+            del buffer[:start]
+        if len(buffer) > self.MAX_LINE_SIZE:
+            buffer.clear()
+
+    def _handle_line(self, line):
+        try:
+            json_entry = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(json_entry, dict) or not json_entry.get("command"):
+            return
+        command = json_entry["command"]
+        self._responses[command] = json_entry
+
+        waiters = self._waiters.get(command)
+        while waiters:
+            future = waiters.popleft()
+            if future.done():
+                continue  # Cancelled after its caller timed out
+            if json_entry.get("success") == "true":
+                future.set_result(json_entry)
+            else:
+                future.set_exception(Exception(f"Fail to fetch {command}..."))
+            break
+        if waiters is not None and not waiters:
+            del self._waiters[command]
+
+    def _fail_waiters(self, error):
+        waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+
+    def send(self, command):
+        """Write a command, without waiting for a response."""
+        data = command.encode("utf-8") + b"\r\n"
+        if self.transport is not None:
+            if self.transport.is_closing():
+                raise ConnectionError("Connection is closed")
+            self.transport.write(data)
+        elif self.ser is not None and self.ser.is_open:
+            if self._tx_buffer:
+                self._tx_buffer += data  # Queued behind bytes _write_serial has not flushed yet
+                return
+            try:
+                written = self.ser.write(data)
+            except serial.SerialException as e:
+                raise IOError(f"Error writing to serial port: {e}")
+            if written < len(data):
+                self._tx_buffer += data[written:]
+                self._loop.add_writer(self.ser.fileno(), self._write_serial)
+        else:
+            raise ConnectionError("Connection is closed")
+
+    async def request(self, command, command_filter, timeout=None, retries=None):
+        """
+        Send a command and wait for the JSON response whose "command" is command_filter.
+
+        If no response arrives within the deadline, the command is resent up to retries
+        times, waiting the policy backoff (doubled each time) in between. A late response
+        to an earlier attempt still completes the request.
+
+        :param command: Raw command string, e.g. "B_STATUS"
+        :param command_filter: "command" value of the response, e.g. "status"
+        :param timeout: Seconds to wait for each attempt, defaults to the command's policy deadline
+        :param retries: Times to resend after a timeout, defaults to the command's policy
+        :return: The JSON response as a dict
+        """
+        policy = self.get_command_policy(command_name(command))
+        if timeout is None:
+            timeout = policy.deadline
+        if retries is None:
+            retries = policy.retries
+        future = self._loop.create_future()
+        self._waiters.setdefault(command_filter, deque()).append(future)
+        try:
+            self.send(command)
+            for attempt in range(retries + 1):
+                if attempt:
+                    self.send(command)
+                # Shielded, a timed out attempt must not cancel the future a late response completes
+                try:
+                    return await asyncio.wait_for(asyncio.shield(future), timeout)
+                except asyncio.TimeoutError:
+                    if attempt == retries:
+                        raise TimeoutError(f"No {command_filter} response to {command} after {retries + 1} x {timeout}s")
+                try:
+                    return await asyncio.wait_for(asyncio.shield(future), policy.backoff * 2 ** attempt)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            future.cancel()  # No-op once completed
+            waiters = self._waiters.get(command_filter)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[command_filter]
+
+    def get_latest_response(self, command_filter):
+        """Latest JSON entry received for a "command" name, or None."""
+        return self._responses.get(command_filter)
+
+    def close(self):
+        """Close the port and fail pending requests."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.ser is not None:
+            try:
+                self._loop.remove_reader(self.ser.fileno())
+                self._loop.remove_writer(self.ser.fileno())
+            except (ValueError, OSError):
+                pass  # Port already gone
+            self.ser.close()
+        if self.transport is not None:
+            self.transport.close()
+        self._fail_waiters(ConnectionError("Serial connection closed"))
@@ -0,0 +1,64 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the AsyncCore component of the AsyncHackerbot, the
+# awaitable counterpart of hackerbot.core.Core. Responses are interpreted by
+# the Core helpers.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+from hackerbot.core import Core
+
+class AsyncCore(Core):
+    def __init__(self, controller):
+        """
+        Initialize AsyncCore component with AsyncHackerbot object. Unlike Core it does not
+        ping, AsyncHackerbot.connect awaits ping() during setup.
+
+        :param controller: AsyncHackerbot object
+        """
+        self._controller = controller
+
+    async def ping(self, deadline=None, retries=None):
+        """
+        Pings the main controller to check component statuses.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the PING policy deadline
+        :param retries: Times to resend after a timeout, defaults to the PING policy
+        :return: JSON-style string of component statuses or None if there is an error
+        """
+        try:
+            self._controller.check_controller_init()
+            response = await self._controller.request("PING", "ping", deadline, retries)
+            return self._update_components(response)
+
+        except Exception as e:
+            self._controller.log_error(f"Error in core:ping: {e}")
+            return None
+
+    async def version(self, deadline=None, retries=None):
+        """
+        Get the version numbers of the main controller, audio mouth eyes, dynamixel controller, and arm controller.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the VERSION policy deadline
+        :param retries: Times to resend after a timeout, defaults to the VERSION policy
+        :return: A JSON string containing the version numbers of the components.
+        """
+        try:
+            self._controller.check_controller_init()
+            response = await self._controller.request("VERSION", "version", deadline, retries)
+            return self._version_info(response)
+
+        except Exception as e:
+            self._controller.log_error(f"Error in core:versions: {e}")
+            return None
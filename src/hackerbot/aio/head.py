@@ -0,0 +1,50 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the AsyncHead and AsyncEyes components of the
+# AsyncHackerbot, the awaitable counterparts of hackerbot.head.Head and
+# hackerbot.head.eyes.Eyes.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+from hackerbot.head import Head
+from hackerbot.head.eyes import Eyes
+
+class AsyncHead(Head):
+    def __init__(self, controller):
+        """
+        Initialize AsyncHead component with AsyncHackerbot object. Unlike Head it does not
+        set up, AsyncHackerbot.connect awaits setup().
+
+        :param controller: AsyncHackerbot object
+        """
+        self._controller = controller
+        self.idle_mode = True
+        self._shared = False
+        self.eyes = AsyncEyes(self._controller)
+
+    # The head commands have no response, so these send right away like the Head methods
+
+    async def setup(self):
+        super().setup()
+
+    async def look(self, yaw, pitch, speed):
+        return super().look(yaw, pitch, speed)
+
+    async def set_idle_mode(self, mode):
+        return super().set_idle_mode(mode)
+
+
+class AsyncEyes(Eyes):
+    async def gaze(self, x, y):
+        return super().gaze(x, y)
@@ -6,9 +6,11 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.08
+# Updated:    2026.10.18
 #
-# This module contains the Base component of the hackerbot
+# This module contains the Base component of the hackerbot. Status history
+# can be recorded in the background with start_telemetry, see telemetry.py,
+# and the pose estimated from the encoders with start_odometry, see odometry.py.
 #
 # Special thanks to the following for their code contributions to this codebase:
 # Allen Chien - https://github.com/AllenChienXXX
@@ -17,28 +19,129 @@
 
 from hackerbot.utils.hackerbot_helper import HackerbotHelper
 from hackerbot.utils.tts_helper import TTSHelper
+from hackerbot.utils.lazy_import import lazy_import
 from .maps import Maps
+from .motion import MotionWait, POLL_MIN, POLL_MAX
 import time
-import sounddevice as sd
-from piper.voice import PiperVoice
-import numpy as np
+
+# The audio stack is only imported by the first speak() call
+_LAZY_IMPORTS = {
+    "sd": ("sounddevice", None),
+    "PiperVoice": ("piper.voice", "PiperVoice"),
+    "np": ("numpy", None),
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return lazy_import(globals(), _LAZY_IMPORTS, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Base():    
-    def __init__(self, controller: HackerbotHelper):
+    MOTION_POLL_MIN = POLL_MIN # Seconds between B_STATUS polls while the set speeds are changing
+    MOTION_POLL_MAX = POLL_MAX # Longest poll interval, reached while the set speeds stay the same
+
+    def __init__(self, controller: HackerbotHelper, shared=False):
         """
         Initialize Core component with HackerbotHelper object
         
         :param controller: HackerbotHelper object
+        :param shared: The base is shared with other programs, e.g. through the daemon. Skips
+            B_INIT here and B_KILL in destroy, so others keep driving
         """
         self._controller = controller
-        self.initialize() # Call before any action is done on the base
+        self._shared = shared
+        if not shared:
+            self.initialize() # Call before any action is done on the base
 
-        self.maps = Maps(controller)
+        self._maps = None
 
         self._future_completed = False
         self._docked = True # Default to true, assume always start from charger
 
-      
+        self._motion = MotionWait(controller, "B_STATUS", "status", "Base motion")
+
+        self._telemetry_sampler = None  # TelemetrySampler while start_telemetry is active
+        self._odometry = None  # Odometry while start_odometry is active
+        self._odometry_subscription = None
+
+    @property
+    def maps(self):
+        """Maps component, created on first access."""
+        if self._maps is None:
+            self._maps = Maps(self._controller)
+        return self._maps
+
+    @property
+    def telemetry(self):
+        """TelemetryRing with the status history while start_telemetry is active, else None."""
+        if self._telemetry_sampler is None:
+            return None
+        return self._telemetry_sampler.ring
+
+    def start_telemetry(self, rate=20.0, capacity=3000):
+        """
+        Record status history in the background, queried through telemetry, e.g.
+        base.telemetry.mean_speed(2.0) or base.telemetry.window(5.0)["wall_tof"].
+
+        :param rate: Samples per second, B_STATUS is only polled when no status is streamed
+        :param capacity: Samples kept, the oldest are overwritten
+        :return: True if successful, False otherwise.
+        """
+        try:
+            if self._telemetry_sampler is not None:
+                raise Exception("Telemetry is already running")
+            # Needs NumPy, only imported when telemetry is used
+            from .telemetry import TelemetrySampler
+            sampler = TelemetrySampler(self._controller, rate, capacity)
+            sampler.start()
+            self._telemetry_sampler = sampler
+            return True
+        except Exception as e:
+            self._controller.log_error(f"Error in base:start_telemetry: {e}")
+            return False
+
+    def stop_telemetry(self):
+        """Stop recording status history. The history is dropped."""
+        sampler, self._telemetry_sampler = self._telemetry_sampler, None
+        if sampler is not None:
+            sampler.stop()
+
+    @property
+    def odometry(self):
+        """Odometry with the encoder pose estimate while start_odometry is active, else None."""
+        return self._odometry
+
+    def start_odometry(self, wheel_base_mm=None, ticks_per_mm=None):
+        """
+        Estimate the pose from the encoders of every status entry, read with odometry.pose().
+        It starts at 0, 0, 0, use odometry.reset(**maps.position()) to align it with the map.
+        Status only arrives while something asks for it, e.g. start_telemetry or a blocking drive.
+
+        :param wheel_base_mm: Distance between the wheels, see odometry.py for the default
+        :param ticks_per_mm: Encoder ticks per millimetre of wheel travel, see odometry.py for the default
+        :return: True if successful, False otherwise.
+        """
+        try:
+            if self._odometry is not None:
+                raise Exception("Odometry is already running")
+            # Needs NumPy, only imported when odometry is used
+            from . import odometry
+            estimator = odometry.Odometry(wheel_base_mm or odometry.WHEEL_BASE_MM,
+                                          ticks_per_mm or odometry.TICKS_PER_MM)
+            self._odometry_subscription = self._controller.subscribe("status", callback=estimator.update)
+            self._odometry = estimator
+            return True
+        except Exception as e:
+            self._controller.log_error(f"Error in base:start_odometry: {e}")
+            return False
+
+    def stop_odometry(self):
+        """Stop updating the pose estimate."""
+        subscription, self._odometry_subscription = self._odometry_subscription, None
+        self._odometry = None
+        if subscription is not None:
+            subscription.close()
+
     def initialize(self):
         try:
             self._controller.send_raw_command("B_INIT")
@@ -58,51 +161,61 @@ class Base():
             self._controller.log_error(f"Error in base:set_mode: {e}")
             return False
         
-    def status(self):
+    def status(self, deadline=None, retries=None):
+        """
+        Get the wheel encoders, speeds and wall distance of the base.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the B_STATUS policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_STATUS policy
+        :return: Dict of the status fields if successful, None otherwise.
+        """
         try:
-            self._controller.send_raw_command("B_STATUS")
-            time.sleep(0.1)
-            response = self._controller.get_json_from_command("status")
+            response = self._controller.send_command_and_wait("B_STATUS", "status", timeout=deadline, retries=retries)
             if response is None:
                 raise Exception("Status command failed")
             
-            if response.get("left_set_speed") == 0 and response.get("right_set_speed") == 0:
-                self._future_completed = True
-            else:
-                self._future_completed = False
-
-                        # Parse and return relevant fields
-            parsed_data = {
-                "timestamp": response.get("timestamp"),
-                "left_encoder": response.get("left_encoder"),
-                "right_encoder": response.get("right_encoder"),
-                "left_speed": response.get("left_speed"),
-                "right_speed": response.get("right_speed"),
-                "left_set_speed": response.get("left_set_speed"),
-                "right_set_speed": response.get("right_set_speed"),
-                "wall_tof": response.get("wall_tof"),
-            }
-            return parsed_data
+            self._future_completed = self._set_speeds(response) == (0, 0)
+            return self._parse_status(response)
         except Exception as e:
             self._controller.log_error(f"Error in base:status: {e}")
             return None
+
+    @staticmethod
+    def _parse_status(response):
+        # Parse and return relevant fields
+        return {
+            "timestamp": response.get("timestamp"),
+            "left_encoder": response.get("left_encoder"),
+            "right_encoder": response.get("right_encoder"),
+            "left_speed": response.get("left_speed"),
+            "right_speed": response.get("right_speed"),
+            "left_set_speed": response.get("left_set_speed"),
+            "right_set_speed": response.get("right_set_speed"),
+            "wall_tof": response.get("wall_tof"),
+        }
+
+    @staticmethod
+    def _set_speeds(entry):
+        return (entry.get("left_set_speed"), entry.get("right_set_speed"))
         
-    def start(self, block=True):
+    def start(self, block=True, timeout=None):
+        self._motion.reset()
+        return self._start(block, timeout)
+
+    def _start(self, block, timeout):
         try:
             self._controller.send_raw_command("B_START")
             # Not fetching json response since machine mode not implemented
             self._controller._driver_mode = True
             if self._docked:
-                time.sleep(2)
+                time.sleep(self._controller.get_command_policy("B_START").settle) # Time to leave the dock
                 self._docked = False
-            self._wait_until_completed(block=block)
-
-            return True
+            return self._wait_until_completed(block=block, timeout=timeout)
         except Exception as e:
             self._controller.log_error(f"Error in base:start: {e}")
             return False
         
-    def quickmap(self, block=True):
+    def quickmap(self, block=True, timeout=None):
         """
         Start the quick mapping process.
 
@@ -111,19 +224,20 @@ class Base():
         the quick mapping command is successfully sent, the function returns True.
         In case of any errors, it logs the error message and returns False.
 
+        :param timeout: Seconds to wait when blocking, None to wait until the mapping is done.
         :return: True if the quick mapping command is successful, False otherwise.
         """
+        self._motion.reset()
         try:
             self._controller.send_raw_command("B_QUICKMAP")
-            time.sleep(0.1)
+            time.sleep(self._controller.get_command_policy("B_QUICKMAP").settle)
             # Not fetching json response since machine mode not implemented
-            self._wait_until_completed(block=block)
-            return True
+            return self._wait_until_completed(block=block, timeout=timeout)
         except Exception as e:
             self._controller.log_error(f"Error in base:quickmap: {e}")
             return False
         
-    def dock(self, block=True):
+    def dock(self, block=True, timeout=None):
         """
         Dock the base to the docking station.
 
@@ -132,16 +246,19 @@ class Base():
         the docking command is successfully sent, the function returns True.
         In case of any errors, it logs the error message and returns False.
 
+        :param timeout: Seconds to wait when blocking, None to wait until docked.
         :return: True if the docking command is successful, False otherwise.
         """
+        self._motion.reset()
         try:
             self._controller.send_raw_command("B_DOCK")
-            time.sleep(3)
+            time.sleep(self._controller.get_command_policy("B_DOCK").settle)
             # Not fetching json response since machine mode not implemented
-            self._wait_until_completed(block=block)
-            self._docked = True
-            self._controller._driver_mode = False
-            return True
+            completed = self._wait_until_completed(block=block, timeout=timeout)
+            if completed:
+                self._docked = True
+                self._controller._driver_mode = False
+            return completed
         except Exception as e:
             self._controller.log_error(f"Error in base:dock: {e}")
             return False
@@ -180,35 +297,52 @@ class Base():
             self._controller.log_error(f"Error in base:trigger_bump: {e}")
             return False
         
-    def drive(self, l_vel, a_vel, block=True):
+    def drive(self, l_vel, a_vel, block=True, timeout=None):
         """
         Set the base velocity.
 
         :param l_vel: Linear velocity in mm/s. Positive is forward, negative is backward.
         :param a_vel: Angular velocity in degrees/s. Positive is counterclockwise, negative is clockwise.
-        :return: True if the command is successful, False if it fails.
+        :param block: Wait until the base has stopped.
+        :param timeout: Seconds to wait when blocking, None to wait until stopped. Includes the
+            implicit start when the base is not in driver mode yet.
+        :return: True if the command is successful, False if it fails, times out or is cancelled.
         """
+        self._motion.reset()
+        deadline = None if timeout is None else time.monotonic() + timeout
         try:
             if not self._controller._driver_mode:
-                self.start()
-            self._controller.send_raw_command(f"B_DRIVE,{l_vel},{a_vel}")
-            time.sleep(0.1)
-            response = self._controller.get_json_from_command("drive")
+                if not self._start(block=True, timeout=timeout):
+                    self._controller.log_error("Error in base:drive: start did not complete, not driving")
+                    return False
+            response = self._controller.send_command_and_wait(f"B_DRIVE,{l_vel},{a_vel}", "drive")
             if response is None:
                 raise Exception("Drive command failed")
-            self._wait_until_completed(block=block)
-            return True
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            return self._wait_until_completed(block=block, timeout=remaining)
         except Exception as e:
             self._controller.log_error(f"Error in base:drive: {e}")
             return False
         
-    def _wait_until_completed(self, block=True):
+    def cancel(self):
+        """
+        Stop waiting for the current blocking start, quickmap, dock or drive, which then
+        returns False. Call from another thread. The base keeps moving, use kill() to stop it.
+        """
+        self._motion.cancel()
+
+    def _wait_until_completed(self, block=True, timeout=None):
+        """
+        Wait until the base reports zero set speeds, see MotionWait. B_STATUS polls back
+        off up to MOTION_POLL_MAX while the set speeds stay the same.
+
+        :param timeout: Seconds to wait, None to wait until completed
+        :return: True if completed, False on timeout or cancel()
+        """
         if not block:
-            return
-        while not self._future_completed:
-            self.status()
-            # print(self.status())
-        self._future_completed = False
+            return True
+        return self._motion.wait(lambda entry: self._set_speeds(entry) == (0, 0), progress=self._set_speeds,
+                                 timeout=timeout, poll_min=self.MOTION_POLL_MIN, poll_max=self.MOTION_POLL_MAX)
         
     def destroy(self, auto_dock=False):
         """
@@ -220,9 +354,13 @@ class Base():
 
         :param auto_dock: If True, the base will dock before being destroyed. Defaults to False.
         """
-        self.kill()
+        self.stop_telemetry()
+        self.stop_odometry()
+        if not self._shared:
+            self.kill()
+            if auto_dock:
+                time.sleep(self._controller.get_command_policy("B_KILL").settle) # Time to stop before docking
         if auto_dock:
-            time.sleep(3.0)
             self.dock(block=False)
         self._controller.destroy()
 
@@ -251,12 +389,15 @@ class Base():
                 return
 
             try:
+                PiperVoice = lazy_import(globals(), _LAZY_IMPORTS, "PiperVoice")
                 voice = PiperVoice.load(model_path)
             except Exception as e:
                 self._controller.log_error(f"Failed to load voice model: {e}")
                 return
 
             try:
+                sd = lazy_import(globals(), _LAZY_IMPORTS, "sd")
+                np = lazy_import(globals(), _LAZY_IMPORTS, "np")
                 stream = sd.OutputStream(
                     samplerate=voice.config.sample_rate,
                     channels=1,
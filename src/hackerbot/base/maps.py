@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.07
+# Updated:    2026.10.18
 #
 # This module contains the Maps component of the hackerbot
 #
@@ -16,12 +16,17 @@
 
 
 from hackerbot.utils.hackerbot_helper import HackerbotHelper
+from .motion import MotionWait, POLL_MIN, POLL_MAX
 import time
 
 class Maps():
+    GOTO_POLL_MIN = POLL_MIN # Seconds between B_POSE polls at the start of a goto
+    GOTO_POLL_MAX = POLL_MAX # Longest poll interval, reached while the robot travels
+
     def __init__(self, controller: HackerbotHelper):
         self._controller = controller
         self._goto_completed = False
+        self._goto_wait = MotionWait(controller, "B_POSE", "pose", "Goto")
 
         self.map_id = None
         self._x = None
@@ -35,7 +40,7 @@ class Maps():
         self._docked = True
 
     # Returns a string of map data
-    def fetch(self, map_id):
+    def fetch(self, map_id, deadline=None, retries=None):
         """
         Fetch the map data for a given map id.
 
@@ -46,14 +51,15 @@ class Maps():
         errors, it logs the error message and returns None.
 
         :param map_id: The id of the map to fetch
+        :param deadline: Seconds to wait for each attempt, defaults to the B_MAPDATA policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_MAPDATA policy
         :return: The compressed map data as a string if successful, None otherwise.
         """
         try:
             # Check if controller and driver are initialized and in machine mode
-            command = f"B_MAPDATA,{map_id}"
-            self._controller.send_raw_command(command)
-            time.sleep(5)  # Wait for map to be generated
-            map_data_json = self._controller.get_json_from_command("mapdata")
+            # Waits only until the map is generated, up to the B_MAPDATA policy deadline
+            map_data_json = self._controller.send_command_and_wait(f"B_MAPDATA,{map_id}", "mapdata",
+                                                                   timeout=deadline, retries=retries)
             if map_data_json is None:
                 raise Exception("No map {map_id} found")
             return map_data_json.get("compressedmapdata")
@@ -62,7 +68,7 @@ class Maps():
             return None
     
     # Returns a list of map ids
-    def list(self):
+    def list(self, deadline=None, retries=None):
         """
         Get a list of available maps.
 
@@ -71,13 +77,13 @@ class Maps():
         the command is successfully sent, the function returns a list of map ids.
         In case of any errors, it logs the error message and returns None.
 
+        :param deadline: Seconds to wait for each attempt, defaults to the B_MAPLIST policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_MAPLIST policy
         :return: A list of map ids if successful, None otherwise.
         """
         try:
             # Check if controller and driver are initialized and in machine mode
-            self._controller.send_raw_command("B_MAPLIST")
-            time.sleep(2)  # Wait for map list to be generated
-            map_list_json = self._controller.get_json_from_command("maplist")
+            map_list_json = self._controller.send_command_and_wait("B_MAPLIST", "maplist", timeout=deadline, retries=retries)
             if map_list_json is None:
                 raise Exception("No maps found")
             return map_list_json.get("map_ids")
@@ -85,7 +91,7 @@ class Maps():
             self._controller.log_error(f"Error in maps:list: {e}")
             return None
         
-    def goto(self, x, y, angle, speed, block=True):
+    def goto(self, x, y, angle, speed, block=True, timeout=None):
         """
         Move the robot to the specified location on the map.
 
@@ -94,10 +100,14 @@ class Maps():
             y (float): The y coordinate of the location to move to, in meters.
             angle (float): The angle of the location to move to, in degrees.
             speed (float): The speed at which to move to the location, in meters per second.
+            block (bool): Wait until the location is reached.
+            timeout (float): Seconds to wait when blocking, None to wait until reached.
 
         Returns:
-            bool: True if the command was successfully sent, False if an error occurred.
+            bool: True if the command was successfully sent (and the location reached when
+            blocking), False if an error occurred, the wait timed out or was cancelled.
         """
+        self._goto_wait.reset()
         try:
             command = f"B_GOTO,{x},{y},{angle},{speed}"
             self._controller.send_raw_command(command)
@@ -106,37 +116,63 @@ class Maps():
             self._goal_angle = angle
             # Not fetching json response since machine mode not implemented
             if self._docked == True:
-                time.sleep(2) # Some time to leave the base
+                time.sleep(self._controller.get_command_policy("B_GOTO").settle) # Some time to leave the base
                 self._docked = False
             if block:
-                self._wait_until_reach_pose()
+                return self._wait_until_reach_pose(timeout)
             return True
         except Exception as e:
             self._controller.log_error(f"Error in maps:goto: {e}")
             return False
         
-    def position(self):
+    def position(self, deadline=None, retries=None):
+        """
+        Get the current position of the robot on the map.
+
+        :param deadline: Seconds to wait for each attempt, defaults to the B_POSE policy deadline
+        :param retries: Times to resend after a timeout, defaults to the B_POSE policy
+        :return: Dict with "x", "y" and "angle" if successful, False otherwise.
+        """
         try:
-            self._controller.send_raw_command("B_POSE")
-            time.sleep(0.1)
-            pose = self._controller.get_json_from_command("pose")
+            pose = self._controller.send_command_and_wait("B_POSE", "pose", timeout=deadline, retries=retries)
             if pose is None:
                 raise Exception("No position found")
-            self.map_id = pose.get("map_id")
-            self._x = pose.get("pose_x")
-            self._y = pose.get("pose_y")
-            self._angle = pose.get("pose_angle")
+            self._update_pose(pose)
             # Not fetching json response since machine mode not implemented
             return {"x": self._x, "y": self._y, "angle": self._angle}
         except Exception as e:
             self._controller.log_error(f"Error in base:position: {e}")
             return False
         
-    def _wait_until_reach_pose(self):
-        while not self._goto_completed:
-            self.position()
-            self._calculate_position_offset()
-        self._goto_completed = False
+    def cancel(self):
+        """
+        Stop waiting for the current blocking goto, which then returns False. Call from
+        another thread. The robot keeps going, use Base.kill() to stop it.
+        """
+        self._goto_wait.cancel()
+
+    def _update_pose(self, pose):
+        self.map_id = pose.get("map_id")
+        self._x = pose.get("pose_x")
+        self._y = pose.get("pose_y")
+        self._angle = pose.get("pose_angle")
+
+    def _reached_pose(self, pose):
+        self._update_pose(pose)
+        self._calculate_position_offset()
+        completed, self._goto_completed = self._goto_completed, False
+        return completed
+
+    def _wait_until_reach_pose(self, timeout=None):
+        """
+        Wait until a pose entry is at the goal, see MotionWait. B_POSE polls back off up
+        to GOTO_POLL_MAX while the robot travels.
+
+        :param timeout: Seconds to wait, None to wait until reached
+        :return: True if reached, False on timeout or cancel()
+        """
+        return self._goto_wait.wait(self._reached_pose, timeout=timeout,
+                                    poll_min=self.GOTO_POLL_MIN, poll_max=self.GOTO_POLL_MAX)
 
     def _calculate_position_offset(self):
         x_offset = self._goal_x - self._x
@@ -0,0 +1,106 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains MotionWait, the blocking wait for a base motion to
+# finish used by Base (status until the set speeds are zero) and Maps (pose
+# until the goal is reached). It listens to the response stream and only polls
+# when nothing arrived recently, backing off while the motion is steady.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import threading
+import time
+
+POLL_MIN = 0.05 # Seconds between polls while the motion is changing
+POLL_MAX = 0.5 # Longest poll interval, reached while the motion is steady
+
+class MotionWait:
+    def __init__(self, controller, command, response, name):
+        """
+        :param controller: HackerbotHelper object
+        :param command: Poll command, e.g. "B_STATUS"
+        :param response: Response name of the poll command, e.g. "status"
+        :param name: Motion name for the timeout warning, e.g. "Base motion"
+        """
+        self._controller = controller
+        self._name = name
+        self._command = command
+        self._response = response
+        self._event = threading.Event()  # Set by entries and cancel() to wake the wait
+        self._cancelled = False
+
+    def reset(self):
+        """
+        Forget an earlier cancel(). Call when the public call starts, so a cancel() while it
+        sends its command or settles still ends the wait that follows.
+        """
+        self._cancelled = False
+        self._event.clear()
+
+    def cancel(self):
+        """End the current wait from another thread, it returns False."""
+        self._cancelled = True
+        self._event.set()
+
+    def wait(self, completed, progress=None, timeout=None, poll_min=POLL_MIN, poll_max=POLL_MAX):
+        """
+        Wait until an entry completes the motion.
+
+        Every entry counts, whether it answers our poll, another caller's or is streamed
+        telemetry, and the command is only sent when none arrived within the poll interval.
+        The interval doubles up to poll_max while progress(entry) stays the same, so a long
+        motion costs a handful of polls instead of a busy loop.
+
+        :param completed: completed(entry) -> True once the motion is done
+        :param progress: progress(entry) -> value that stays the same while the motion is steady.
+            None to back off on every entry
+        :param timeout: Seconds to wait, None to wait until completed
+        :return: True if completed, False on timeout or cancel() since the last reset()
+        """
+        if self._cancelled:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        latest = []  # Newest entry of this wait
+
+        def on_entry(entry):
+            latest[:] = [entry]
+            self._event.set()
+
+        subscription = self._controller.subscribe(self._response, callback=on_entry, queue_size=1)
+        try:
+            interval = poll_min
+            state = None
+            next_poll = time.monotonic()
+            while True:
+                now = time.monotonic()
+                if now >= next_poll:
+                    self._controller.send_raw_command(self._command)
+                    next_poll = now + interval
+                wait = next_poll - now if deadline is None else min(next_poll, deadline) - now
+                self._event.wait(max(wait, 0))
+                self._event.clear()
+                if self._cancelled:
+                    return False
+                if latest:
+                    entry = latest.pop()
+                    if completed(entry):
+                        return True
+                    new_state = None if progress is None else progress(entry)
+                    interval = min(interval * 2, poll_max) if new_state == state else poll_min
+                    state = new_state
+                    next_poll = time.monotonic() + interval  # Fresh entry, no need to poll yet
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._controller.log_warning(f"{self._name} not completed after {timeout} seconds")
+                    return False
+        finally:
+            subscription.close()
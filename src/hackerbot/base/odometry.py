@@ -0,0 +1,132 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the client-side differential-drive odometry of the
+# base. Odometry turns the left/right encoder counts of each status entry into
+# an x/y/angle estimate at status rate, between B_POSE round trips, and
+# integrate() does the same for recorded encoder arrays in one NumPy pass.
+# Poses use the units of Maps.position: x and y in meters, angle in degrees,
+# counterclockwise positive.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import math
+import threading
+import numpy as np
+
+WHEEL_BASE_MM = 250.0 # Distance between the wheels, calibrate for your robot
+TICKS_PER_MM = 1.0 # Encoder ticks per millimetre of wheel travel, calibrate for your robot
+
+def integrate(left_encoder, right_encoder, wheel_base_mm=WHEEL_BASE_MM, ticks_per_mm=TICKS_PER_MM,
+              x=0.0, y=0.0, angle=0.0):
+    """
+    Integrate recorded encoder counts in one vectorized pass.
+
+    Each step is taken as an arc of constant curvature (its chord, along the heading
+    halfway through the turn), so sparse samples during smooth turns lose no accuracy.
+
+    :param left_encoder: Left encoder counts, one per sample, e.g. TelemetryRing.latest()["left_encoder"]
+    :param right_encoder: Right encoder counts, same length
+    :param wheel_base_mm: Distance between the wheels
+    :param ticks_per_mm: Encoder ticks per millimetre of wheel travel
+    :param x, y, angle: Pose at the first sample
+    :return: (x, y, angle) arrays with the pose at each sample, the first one being the given pose
+    """
+    left = np.asarray(left_encoder, dtype=np.float64)
+    right = np.asarray(right_encoder, dtype=np.float64)
+    if left.shape != right.shape or left.ndim != 1:
+        raise ValueError("left_encoder and right_encoder must be 1-D arrays of the same length")
+    if len(left) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+
+    left_mm = np.diff(left) / ticks_per_mm
+    right_mm = np.diff(right) / ticks_per_mm
+    turn = (right_mm - left_mm) / wheel_base_mm
+    # Chord of the arc, np.sinc(t / 2pi) is sin(t / 2) / (t / 2)
+    distance_m = (left_mm + right_mm) / 2000.0 * np.sinc(turn / (2 * np.pi))
+
+    heading = np.empty(len(left))
+    heading[0] = math.radians(angle)
+    np.cumsum(turn, out=heading[1:])
+    heading[1:] += heading[0]
+    midpoint = heading[:-1] + turn / 2.0
+
+    xs = np.empty(len(left))
+    ys = np.empty(len(left))
+    xs[0], ys[0] = x, y
+    np.cumsum(distance_m * np.cos(midpoint), out=xs[1:])
+    np.cumsum(distance_m * np.sin(midpoint), out=ys[1:])
+    xs[1:] += x
+    ys[1:] += y
+    return xs, ys, np.degrees(heading)
+
+class Odometry:
+    """
+    Pose estimate updated from each status entry.
+
+    Feed it with update(entry), or let Base.start_odometry subscribe it to status. The
+    first entry after creation or reset() only sets the encoder reference.
+    """
+
+    def __init__(self, wheel_base_mm=WHEEL_BASE_MM, ticks_per_mm=TICKS_PER_MM):
+        if wheel_base_mm <= 0 or ticks_per_mm <= 0:
+            raise ValueError("wheel_base_mm and ticks_per_mm must be positive")
+        self.wheel_base_mm = wheel_base_mm
+        self.ticks_per_mm = ticks_per_mm
+        self._lock = threading.Lock()
+        self._encoders = None  # (left, right) of the last entry
+        self._pose = (0.0, 0.0, 0.0)  # x (m), y (m), heading (radians)
+        self.updates = 0
+
+    def reset(self, x=0.0, y=0.0, angle=0.0):
+        """
+        Set the pose, e.g. from Maps.position(), and take the next entry as encoder reference.
+
+        :param x, y: Position in meters
+        :param angle: Heading in degrees
+        """
+        with self._lock:
+            self._encoders = None
+            self._pose = (x, y, math.radians(angle))
+
+    def update(self, entry):
+        """
+        :param entry: JSON status entry with "left_encoder" and "right_encoder"
+        :return: True if the pose was updated, False for the reference entry or missing encoders
+        """
+        try:
+            encoders = (float(entry["left_encoder"]), float(entry["right_encoder"]))
+        except (KeyError, TypeError, ValueError):
+            return False
+        with self._lock:
+            previous, self._encoders = self._encoders, encoders
+            if previous is None:
+                return False
+            left_mm = (encoders[0] - previous[0]) / self.ticks_per_mm
+            right_mm = (encoders[1] - previous[1]) / self.ticks_per_mm
+            turn = (right_mm - left_mm) / self.wheel_base_mm
+            distance_m = (left_mm + right_mm) / 2000.0
+            if turn:
+                distance_m *= math.sin(turn / 2.0) / (turn / 2.0)  # Chord of the arc
+            x, y, heading = self._pose
+            midpoint = heading + turn / 2.0
+            self._pose = (x + distance_m * math.cos(midpoint), y + distance_m * math.sin(midpoint), heading + turn)
+            self.updates += 1
+            return True
+
+    def pose(self):
+        """
+        :return: Dict with "x", "y" (meters) and "angle" (degrees), like Maps.position()
+        """
+        x, y, heading = self._pose
+        return {"x": x, "y": y, "angle": math.degrees(heading)}
@@ -0,0 +1,181 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the base telemetry history. TelemetrySampler collects
+# status entries (encoders, speeds, set speeds and wall ToF) in the background
+# into a TelemetryRing, a preallocated NumPy structured array, which answers
+# windowed queries on views of the history instead of copies.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import threading
+import time
+import numpy as np
+
+STATUS_FIELDS = ("left_encoder", "right_encoder", "left_speed", "right_speed",
+                 "left_set_speed", "right_set_speed", "wall_tof")
+
+# One sample per status entry. time is time.monotonic() on arrival, timestamp the controller's
+# milliseconds. Missing values are NaN
+TELEMETRY_DTYPE = np.dtype([("time", "f8"), ("timestamp", "f8")] + [(field, "f8") for field in STATUS_FIELDS])
+
+def _value(entry, field):
+    value = entry.get(field)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def _nanmean(values):
+    # np.nanmean warns when every value is NaN
+    count = np.count_nonzero(~np.isnan(values))
+    return float(np.nansum(values)) / count if count else np.nan
+
+class TelemetryRing:
+    """
+    Fixed-size history of telemetry samples.
+
+    Every sample is written twice, at i and i + capacity of a 2 * capacity array, so the
+    latest n samples are always one contiguous slice. Queries return views into that array:
+    they are only valid until capacity - n more samples are added, copy them to keep them.
+    Written by one thread, read by any.
+    """
+
+    def __init__(self, capacity=3000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._buffer = np.full(2 * capacity, np.nan, dtype=TELEMETRY_DTYPE)
+        self._head = 0  # Next write position, below capacity
+        self._count = 0  # Samples written in total
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def append(self, entry, now=None):
+        """
+        Add a status entry.
+
+        :param entry: JSON status entry, e.g. {"command": "status", "left_encoder": 10, ...}
+        :param now: Arrival time, time.monotonic() if None
+        """
+        sample = (time.monotonic() if now is None else now, _value(entry, "timestamp"),
+                  *[_value(entry, field) for field in STATUS_FIELDS])
+        head = self._head
+        self._buffer[head] = sample
+        self._buffer[head + self.capacity] = sample
+        self._head = (head + 1) % self.capacity
+        self._count += 1
+
+    def latest(self, n=None):
+        """
+        :param n: Number of samples, all retained samples if None
+        :return: View of the latest n samples, oldest first
+        """
+        count = len(self)
+        n = count if n is None else max(0, min(n, count))
+        end = self._head + self.capacity
+        return self._buffer[end - n:end]
+
+    def window(self, seconds, now=None):
+        """
+        :param seconds: Length of the window
+        :param now: End of the window, time.monotonic() if None
+        :return: View of the samples that arrived in the last seconds, oldest first
+        """
+        samples = self.latest()
+        start = (time.monotonic() if now is None else now) - seconds
+        return samples[np.searchsorted(samples["time"], start, side="left"):]
+
+    def mean_speed(self, seconds, now=None):
+        """
+        :return: (left, right) mean wheel speed over the last seconds, NaN without samples
+        """
+        samples = self.window(seconds, now)
+        return (_nanmean(samples["left_speed"]), _nanmean(samples["right_speed"]))
+
+    def max_tof_delta(self, seconds, now=None):
+        """
+        :return: Largest change of wall_tof between consecutive samples over the last seconds,
+            NaN with fewer than two samples
+        """
+        tof = self.window(seconds, now)["wall_tof"]
+        if len(tof) < 2:
+            return np.nan
+        deltas = np.abs(np.diff(tof))
+        return np.nan if np.isnan(deltas).all() else float(np.nanmax(deltas))
+
+class TelemetrySampler:
+    """
+    Records base status into a TelemetryRing in the background.
+
+    Every status entry is recorded, whether it answers a poll, another caller or is
+    streamed telemetry. A poll thread sends B_STATUS every 1 / rate seconds without
+    waiting for the reply, so the sample rate is not bound by the round trip, and skips
+    the poll when other status entries arrived since the last one, so a telemetry stream
+    costs no extra traffic.
+    """
+
+    def __init__(self, controller, rate=20.0, capacity=3000):
+        """
+        :param controller: HackerbotHelper object
+        :param rate: Samples per second to poll for
+        :param capacity: Samples kept, e.g. 3000 is 150 s at 20 Hz
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._controller = controller
+        self.interval = 1.0 / rate
+        self.ring = TelemetryRing(capacity)
+        self._stop_event = threading.Event()
+        self._subscription = None
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._subscription = self._controller.subscribe("status", callback=self._on_status, queue_size=100)
+        self._thread = threading.Thread(target=self._poll, name="hackerbot-telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._subscription.close()
+
+    def _on_status(self, entry):
+        # Dispatch worker, the only writer of the ring
+        self.ring.append(entry)
+
+    def _poll(self):
+        next_poll = time.monotonic()
+        seen = self.ring._count
+        polled = False
+        while not self._stop_event.wait(max(0.0, next_poll - time.monotonic())):
+            if self._subscription.closed:
+                return  # Disconnected
+            next_poll = max(next_poll + self.interval, time.monotonic())  # No burst after a stall
+            count = self.ring._count
+            received, seen = count - seen, count
+            if received > (1 if polled else 0):
+                polled = False  # Status is arriving without our polls
+                continue
+            try:
+                self._controller.send_raw_command("B_STATUS")
+                polled = True
+            except Exception:
+                polled = False  # Link down or reconnecting, try again next interval
@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.07
+# Updated:    2026.10.18
 #
 # This module contains the Core component of the hackerbot
 #
@@ -16,105 +16,114 @@
 
 
 from hackerbot.utils.hackerbot_helper import HackerbotHelper
-import time
 import json
 
 class Core():    
-    def __init__(self, controller: HackerbotHelper):
+    def __init__(self, controller: HackerbotHelper, ping_response=None):
         """
         Initialize Core component with HackerbotHelper object
         
         :param controller: HackerbotHelper object
+        :param ping_response: Ping response already received during startup, pings again if None
         """
         self.tofs_enabled = controller._tofs_enabled
         self.json_response = controller._json_mode
 
         self._controller = controller
 
-        self.ping() # Ping to check attached components
+        if ping_response is not None:
+            self._update_components(ping_response)
+        else:
+            self.ping() # Ping to check attached components
 
-    def ping(self):
+    def ping(self, deadline=None, retries=None):
         """
         Pings the main controller to check component statuses and returns a JSON-style string
         indicating the status of the components.
         This is called during set up.
 
+        :param deadline: Seconds to wait for each attempt, defaults to the PING policy deadline
+        :param retries: Times to resend after a timeout, defaults to the PING policy
         :return: JSON-style string of component statuses or None if there is an error
         """
         try:
             self._controller.check_controller_init()
-            self._controller.send_raw_command("PING")
-            time.sleep(0.1)
-            response = self._controller.get_json_from_command("ping")
+            response = self._controller.send_command_and_wait("PING", "ping", timeout=deadline, retries=retries)
             if response is None:
                 raise Exception("No response from main controller")
-
-            # Build JSON-style dict for robot state (excluding warnings)
-            robots_state = {
-                "main_controller_attached": False,
-                "temperature_sensor_attached": False,
-                "audio_mouth_eyes_attached": False,
-                "dynamixel_controller_attached": False,
-                "arm_control_attached": False
-            }
-
-            # Check component statuses
-            self._controller._main_controller_attached = response.get("main_controller") == "attached"
-            self._controller._temperature_sensor_attached = response.get("temperature_sensor") == "attached"
-            self._controller._left_tof_attached = response.get("left_tof") == "attached"
-            self._controller._right_tof_attached = response.get("right_tof") == "attached"
-            self._controller._audio_mouth_eyes_attached = response.get("audio_mouth_eyes") == "attached"
-            self._controller._dynamixel_controller_attached = response.get("dynamixel_controller") == "attached"
-            self._controller._arm_attached = response.get("arm_controller") == "attached"
-
-            if not self._controller._main_controller_attached:
-                self._controller.log_warning("Main controller not attached")
-            if not self._controller._temperature_sensor_attached:
-                self._controller.log_warning("Temperature sensor not attached")
-            if not self._controller._left_tof_attached:
-                self._controller.log_warning("Left TOF not attached")
-            if not self._controller._right_tof_attached:
-                self._controller.log_warning("Right TOF not attached")
-
-            # Update status
-            robots_state["main_controller_attached"] = self._controller._main_controller_attached
-            robots_state["temperature_sensor_attached"] = self._controller._temperature_sensor_attached
-            robots_state["left_tof_attached"] = self._controller._left_tof_attached
-            robots_state["right_tof_attached"] = self._controller._right_tof_attached
-            robots_state["audio_mouth_eyes_attached"] = self._controller._audio_mouth_eyes_attached
-            robots_state["dynamixel_controller_attached"] = self._controller._dynamixel_controller_attached
-            robots_state["arm_control_attached"] = self._controller._arm_attached
-            # Convert to JSON string (excluding warnings) before returning
-            return json.dumps(robots_state, indent=2)
+            return self._update_components(response)
 
         except Exception as e:
             self._controller.log_error(f"Error in core:ping: {e}")
             return None
 
-    def version(self):
+    def _update_components(self, response):
+        """Record the attached components of a ping response on the controller and return them as a JSON string."""
+        # Build JSON-style dict for robot state (excluding warnings)
+        robots_state = {
+            "main_controller_attached": False,
+            "temperature_sensor_attached": False,
+            "audio_mouth_eyes_attached": False,
+            "dynamixel_controller_attached": False,
+            "arm_control_attached": False
+        }
+
+        # Check component statuses
+        self._controller._main_controller_attached = response.get("main_controller") == "attached"
+        self._controller._temperature_sensor_attached = response.get("temperature_sensor") == "attached"
+        self._controller._left_tof_attached = response.get("left_tof") == "attached"
+        self._controller._right_tof_attached = response.get("right_tof") == "attached"
+        self._controller._audio_mouth_eyes_attached = response.get("audio_mouth_eyes") == "attached"
+        self._controller._dynamixel_controller_attached = response.get("dynamixel_controller") == "attached"
+        self._controller._arm_attached = response.get("arm_controller") == "attached"
+
+        if not self._controller._main_controller_attached:
+            self._controller.log_warning("Main controller not attached")
+        if not self._controller._temperature_sensor_attached:
+            self._controller.log_warning("Temperature sensor not attached")
+        if not self._controller._left_tof_attached:
+            self._controller.log_warning("Left TOF not attached")
+        if not self._controller._right_tof_attached:
+            self._controller.log_warning("Right TOF not attached")
+
+        # Update status
+        robots_state["main_controller_attached"] = self._controller._main_controller_attached
+        robots_state["temperature_sensor_attached"] = self._controller._temperature_sensor_attached
+        robots_state["left_tof_attached"] = self._controller._left_tof_attached
+        robots_state["right_tof_attached"] = self._controller._right_tof_attached
+        robots_state["audio_mouth_eyes_attached"] = self._controller._audio_mouth_eyes_attached
+        robots_state["dynamixel_controller_attached"] = self._controller._dynamixel_controller_attached
+        robots_state["arm_control_attached"] = self._controller._arm_attached
+        # Convert to JSON string (excluding warnings) before returning
+        return json.dumps(robots_state, indent=2)
+
+    def version(self, deadline=None, retries=None):
         """
         Get the version numbers of the main controller, audio mouth eyes, dynamixel controller, and arm controller.
 
+        :param deadline: Seconds to wait for each attempt, defaults to the VERSION policy deadline
+        :param retries: Times to resend after a timeout, defaults to the VERSION policy
         :return: A JSON string containing the version numbers of the components.
         """
         try:
             self._controller.check_controller_init()
-            self._controller.send_raw_command("VERSION")
-            time.sleep(0.1)
-            response = self._controller.get_json_from_command("version")
+            response = self._controller.send_command_and_wait("VERSION", "version", timeout=deadline, retries=retries)
             if response is None:
                 raise Exception("No response from main controller")
-
-            # Build response dictionary with all relevant version info
-            version_info = {
-                "main_controller_version": response.get("main_controller"),
-                "audio_mouth_eyes_version": response.get("audio_mouth_eyes"),
-                "dynamixel_controller_version": response.get("dynamixel_controller"),
-                "arm_controller_version": response.get("arm_controller")
-            }
-
-            return json.dumps(version_info, indent=2)
+            return self._version_info(response)
 
         except Exception as e:
             self._controller.log_error(f"Error in core:versions: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _version_info(self, response):
+        """Return the component versions of a version response as a JSON string."""
+        # Build response dictionary with all relevant version info
+        version_info = {
+            "main_controller_version": response.get("main_controller"),
+            "audio_mouth_eyes_version": response.get("audio_mouth_eyes"),
+            "dynamixel_controller_version": response.get("dynamixel_controller"),
+            "arm_controller_version": response.get("arm_controller")
+        }
+
+        return json.dumps(version_info, indent=2)
\ No newline at end of file
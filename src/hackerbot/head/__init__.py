@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.20
+# Updated:    2026.10.18
 #
 # This module contains the Head component of the hackerbot
 #
@@ -19,9 +19,15 @@ from hackerbot.utils.hackerbot_helper import HackerbotHelper
 from .eyes import Eyes
 
 class Head():
-    def __init__(self, controller: HackerbotHelper):
+    def __init__(self, controller: HackerbotHelper, shared=False):
+        """
+        :param controller: HackerbotHelper object
+        :param shared: The head is shared with other programs, e.g. through the daemon. Leaves
+            its idle mode alone until look() or set_idle_mode() is called
+        """
         self._controller = controller
         self.idle_mode = True
+        self._shared = shared
 
         self.setup()
         self.eyes = Eyes(self._controller)
@@ -32,14 +38,15 @@ class Head():
         if not self._controller._audio_mouth_eyes_attached:
             self._controller.log_warning("Audio mouth and eyes not attached, can't control eyes.")
 
-        self.set_idle_mode(True)
+        if not self._shared:
+            self._set_idle_mode(True)
         
     # float: yaw - Unit is in degrees (eg. 180 degrees). Valid values are in the range of 100.0 to 260.0
     # float: pitch - Unit is in degrees (eg. 180 degrees). Valid values are in the range of 150.0 to 250.0
     # int: speed - Unitless. Valid values are integers in the range of 6 (slow) to 70 (fast)
     def look(self, yaw, pitch, speed):
         try:
-            self.set_idle_mode(False)
+            self._set_idle_mode(False)
             self._controller.send_raw_command(f"H_LOOK, {yaw}, {pitch}, {speed}")
             # Not fetching json response since machine mode not implemented
             return True
@@ -48,6 +55,10 @@ class Head():
             return False
         
     def set_idle_mode(self, mode):
+        return self._set_idle_mode(mode)
+
+    def _set_idle_mode(self, mode):
+        # Called by setup and look too, AsyncHead overrides set_idle_mode with a coroutine
         try:
             if mode:
                 self._controller.send_raw_command("H_IDLE, 1")
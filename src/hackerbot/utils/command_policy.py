@@ -0,0 +1,87 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the per-command deadline and retry policies used by
+# SerialHelper.send_command_and_wait, get_json_from_command and
+# AsyncConnection.request. Entries can be overridden per robot with
+# set_command_policy or the command_policies argument of Hackerbot and
+# AsyncHackerbot.connect, and per call with timeout/retries.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+from collections import namedtuple
+
+# deadline: seconds to wait for the response to one attempt
+# retries: times the command is resent after a timeout
+# backoff: seconds before the first resend, doubled before each further one
+# settle: seconds the controller needs to act on a command that has no response, e.g. leaving the dock
+CommandPolicy = namedtuple("CommandPolicy", ["deadline", "retries", "backoff", "settle"])
+
+# Keyed by command name, the part before the first comma. Other commands wait
+# RESPONSE_TIMEOUT once and are not retried
+DEFAULT_COMMAND_POLICIES = {
+    "PING": CommandPolicy(deadline=0.3, retries=2, backoff=0.05, settle=0.0),
+    "VERSION": CommandPolicy(deadline=0.3, retries=2, backoff=0.05, settle=0.0),
+    "JSON": CommandPolicy(deadline=0.6, retries=2, backoff=0.1, settle=0.0),
+    "TOFS": CommandPolicy(deadline=0.3, retries=1, backoff=0.05, settle=0.0),
+    "B_STATUS": CommandPolicy(deadline=0.3, retries=1, backoff=0.0, settle=0.0),
+    "B_POSE": CommandPolicy(deadline=0.3, retries=1, backoff=0.0, settle=0.0),
+    "B_DRIVE": CommandPolicy(deadline=0.5, retries=0, backoff=0.0, settle=0.0),
+    "B_MAPLIST": CommandPolicy(deadline=3.0, retries=1, backoff=0.2, settle=0.0),
+    "B_MAPDATA": CommandPolicy(deadline=8.0, retries=1, backoff=0.5, settle=0.0),
+    "B_START": CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=2.0),
+    "B_GOTO": CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=2.0),
+    "B_DOCK": CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=3.0),
+    "B_KILL": CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=3.0),  # Before docking in destroy
+    "B_QUICKMAP": CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=0.1),
+}
+
+def command_name(command):
+    """Command name of a raw command string, e.g. "B_MAPDATA" for "B_MAPDATA,1"."""
+    return command.split(",", 1)[0].strip()
+
+class CommandPolicies():
+    """
+    Policy lookup shared by SerialHelper and AsyncConnection. The connection keeps its
+    policies in self._command_policies and sets RESPONSE_TIMEOUT for other commands.
+    """
+
+    def get_command_policy(self, command):
+        """
+        Deadline, retry and settle policy of a command.
+
+        :param command: Command name or raw command string, e.g. "B_MAPDATA" or "B_MAPDATA,1"
+        :return: CommandPolicy(deadline, retries, backoff, settle)
+        """
+        policy = self._command_policies.get(command_name(command))
+        if policy is None:
+            return CommandPolicy(deadline=self.RESPONSE_TIMEOUT, retries=0, backoff=0.0, settle=0.0)
+        return policy
+
+    def set_command_policy(self, command, deadline=None, retries=None, backoff=None, settle=None):
+        """
+        Override part of a command's policy for this robot. Arguments left as None are kept.
+
+        :param command: Command name, e.g. "B_MAPDATA"
+        :param deadline: Seconds to wait for the response to one attempt
+        :param retries: Times the command is resent after a timeout
+        :param backoff: Seconds before the first resend, doubled before each further one
+        :param settle: Seconds to give the controller after a command that has no response
+        :return: The new CommandPolicy
+        """
+        changes = {"deadline": deadline, "retries": retries, "backoff": backoff, "settle": settle}
+        policy = self.get_command_policy(command)._replace(**{k: v for k, v in changes.items() if v is not None})
+        if policy.deadline <= 0 or policy.retries < 0 or policy.backoff < 0 or policy.settle < 0:
+            raise ValueError(f"Invalid policy for {command}: {policy}")
+        self._command_policies[command_name(command)] = policy
+        return policy
@@ -0,0 +1,324 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the HackerbotDaemon, which owns the main controller's
+# serial port and shares it with local clients over a Unix socket. Clients
+# speak the same line protocol as the controller, so any number of processes
+# can run the full Hackerbot API on one robot:
+#
+#     hackerbot-daemon --port /dev/ttyACM0
+#     bot = Hackerbot(port=f"unix://{SOCKET_PATH}")
+#
+# Each response goes back to the client that sent the matching command. Lines
+# nobody asked for, such as telemetry, are fanned out to every client.
+#
+# The daemon sets up JSON mode and the base itself and answers the startup
+# commands of every Hackerbot client (JSON, B_INIT, PING, VERSION) locally, so
+# a client connecting does not re-initialize a robot others are driving. Use
+# Hackerbot(shared=True) so clients also skip H_IDLE and B_KILL.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import time
+import socket
+import argparse
+import threading
+from collections import deque
+from .serial_helper import SerialHelper
+from .state_block import STATE_BLOCK_PATH
+
+SOCKET_PATH = os.path.join(SerialHelper.HOME_DIR, "hackerbot/hackerbot.sock")
+
+class HackerbotDaemon(SerialHelper):
+    MAX_CLIENT_BACKLOG = 4096 # Lines queued for a client before the oldest are dropped
+    ACCEPT_TIMEOUT = 0.5 # Seconds accept waits before re-checking the stop event
+    PING_CACHE_AGE = 5.0 # Seconds a PING reply is answered from the cache before the controller is asked again
+
+    def __init__(self, socket_path=SOCKET_PATH, port=None, board="adafruit:samd:adafruit_qt_py_m0", baudrate=230400,
+                 serial_number=None):
+        """
+        Open the main controller and start serving clients on socket_path.
+
+        :param socket_path: Unix socket clients connect to with Hackerbot(port="unix://<socket_path>")
+        :param port: Serial port of the main controller, found automatically if None
+        :param serial_number: USB serial number of the board to find when several are plugged in
+        """
+        self.socket_path = socket_path
+        self._clients = set()
+        self._clients_lock = threading.Lock()
+        self._routes = {}  # response name -> deque of (client, sent time), oldest command first
+        self._routes_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._base_init = False  # B_INIT sent and no B_KILL since
+        self._ping_reply = None  # (line, received time) of the latest PING reply
+        self._version_reply = None  # Line of the latest VERSION reply, versions don't change
+
+        super().__init__(port, board, baudrate, serial_number)
+        try:
+            self._setup_controller()
+
+            os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)  # Left behind by a daemon that did not shut down cleanly
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(socket_path)
+            self._server.listen()
+            self._server.settimeout(self.ACCEPT_TIMEOUT)
+        except Exception:
+            self.disconnect_serial()
+            raise
+
+        self._accept_thread = threading.Thread(target=self._accept_clients, name="hackerbot-daemon", daemon=True)
+        self._accept_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _accept_clients(self):
+        while not self._stop_event.is_set():
+            try:
+                sock, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return  # Server socket closed
+            client = _DaemonClient(self, sock)
+            with self._clients_lock:
+                self._clients.add(client)
+            client.start()
+
+    def _setup_controller(self):
+        # The daemon owns JSON mode, clients can't switch it off for each other
+        self.send_command_and_wait("JSON, 1", "json")
+        self.send_raw_command("B_INIT")
+        self._base_init = True
+        self.send_command_and_wait("PING", "ping")  # Cached by _handle_line for the clients
+
+    def _local_reply(self, name):
+        """Reply line for a client command the daemon answers itself, b"" to drop it, None to forward it."""
+        if name == "JSON":
+            return b'{"command": "json", "success": "true"}\r\n'
+        if name == "B_INIT" and self._base_init:
+            return b""  # No response, the base is already initialized
+        if name == "PING":
+            reply = self._ping_reply
+            if reply is not None and time.monotonic() - reply[1] < self.PING_CACHE_AGE:
+                return reply[0]
+        if name == "VERSION":
+            return self._version_reply
+        return None
+
+    def _handle_client_lines(self, client, lines):
+        # Client reader thread. Local commands are answered here, the rest go to the controller in one write
+        commands = []
+        for line in lines:
+            command = line.decode("utf-8", errors="replace").strip()
+            if not command:
+                continue
+            name = self._command_name(command)
+            reply = self._local_reply(name)
+            if reply is not None:
+                if reply:
+                    client.send(reply)
+                continue
+            if name == "B_INIT":
+                self._base_init = True
+            elif name == "B_KILL":
+                self._base_init = False  # The next B_INIT has to reach the controller
+            commands.append(command)
+
+        if not commands:
+            return
+        now = time.monotonic()
+        with self._routes_lock:
+            for command in commands:
+                routes = self._routes.setdefault(self._response_name(self._command_name(command)), deque(maxlen=self.MAX_INFLIGHT))
+                routes.append((client, now))
+        priority = any(self._command_name(command) in self.PRIORITY_COMMANDS for command in commands)
+        self._write(b"".join(command.encode("utf-8") + b"\r\n" for command in commands), commands, priority)
+        self.state = commands[-1]
+
+    def _handle_line(self, line):
+        super()._handle_line(line)
+        if len(line) < 2:
+            return
+        raw = line.tobytes()
+        command = self._extract_command(raw)
+        if command is None:
+            return
+
+        client = None
+        with self._routes_lock:
+            routes = self._routes.get(command)
+            if routes:
+                expired = time.monotonic() - self.INFLIGHT_TIMEOUT
+                while routes and client is None:
+                    candidate, sent_at = routes.popleft()
+                    if not candidate.closed and sent_at >= expired:
+                        client = candidate
+
+        line_bytes = raw + b"\n"
+        if command == "ping":
+            self._ping_reply = (line_bytes, time.monotonic())
+        elif command == "version":
+            self._version_reply = line_bytes
+        if client is not None:
+            client.send(line_bytes)
+            return
+        # Nobody is waiting for it, fan it out once to every client
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.send(line_bytes)
+
+    def _remove_client(self, client):
+        with self._clients_lock:
+            self._clients.discard(client)
+
+    def _on_reconnect(self):
+        self._base_init = False
+        self._ping_reply = None
+        try:
+            self._setup_controller()
+        except Exception:
+            pass  # Retried on the next reconnect, clients see the serial error meanwhile
+
+    def get_counters(self):
+        """Transport counters, see SerialHelper.get_counters, plus "clients" and "client_drops"."""
+        counters = super().get_counters()
+        with self._clients_lock:
+            clients = list(self._clients)
+        counters["clients"] = len(clients)
+        counters["client_drops"] = sum(client.dropped for client in clients)
+        return counters
+
+    def close(self):
+        """Disconnect every client, remove the socket and release the serial port."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._server.close()
+        self._accept_thread.join()
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        self.stop_metrics_server()
+        self.disconnect_serial()
+
+
+class _DaemonClient:
+    """One connected client: a reader thread for its commands and a writer thread for its lines."""
+
+    def __init__(self, daemon, sock):
+        self.dropped = 0
+        self.closed = False
+        self._daemon = daemon
+        self._sock = sock
+        self._outbox = deque()
+        self._cond = threading.Condition()
+        self._reader = threading.Thread(target=self._read, name="hackerbot-daemon-client", daemon=True)
+        self._writer = threading.Thread(target=self._write, name="hackerbot-daemon-client", daemon=True)
+
+    def start(self):
+        self._reader.start()
+        self._writer.start()
+
+    def send(self, data):
+        """Queue a line for the client. Never blocks, a client that stops reading loses its oldest lines."""
+        with self._cond:
+            if self.closed:
+                return
+            if len(self._outbox) >= self._daemon.MAX_CLIENT_BACKLOG:
+                self._outbox.popleft()
+                self.dropped += 1
+            self._outbox.append(data)
+            self._cond.notify()
+
+    def _read(self):
+        buffer = b""
+        try:
+            while True:
+                data = self._sock.recv(4096)
+                if not data:
+                    break
+                *lines, buffer = (buffer + data).split(b"\n")
+                if lines:
+                    self._daemon._handle_client_lines(self, lines)
+        except Exception:
+            pass  # Client went away or the controller link is down, either way the client is done
+        finally:
+            self.close()
+
+    def _write(self):
+        while True:
+            with self._cond:
+                while not self._outbox and not self.closed:
+                    self._cond.wait()
+                if self.closed:
+                    return
+                data = b"".join(self._outbox)
+                self._outbox.clear()
+            try:
+                self._sock.sendall(data)
+            except OSError:
+                self.close()
+                return
+
+    def close(self):
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            self._cond.notify()
+        self._daemon._remove_client(self)
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Share the Hackerbot main controller with local clients over a Unix socket.")
+    parser.add_argument("--port", default=None, help="Serial port of the main controller, found automatically by default")
+    parser.add_argument("--serial-number", default=None, help="USB serial number of the main controller to find")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path clients connect to")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Serve Prometheus metrics on this port")
+    parser.add_argument("--state-block", nargs="?", const=STATE_BLOCK_PATH, default=None,
+                        help="Publish status, pose and ping to a shared-memory state block")
+    args = parser.parse_args()
+
+    with HackerbotDaemon(socket_path=args.socket, port=args.port, serial_number=args.serial_number) as daemon:
+        if args.metrics_port is not None:
+            daemon.start_metrics_server(args.metrics_port)
+        if args.state_block is not None:
+            daemon.start_state_block(args.state_block)
+        print(f"Hackerbot daemon serving {daemon.port}, connect with Hackerbot(port=\"unix://{args.socket}\")")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
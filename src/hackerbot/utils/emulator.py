@@ -0,0 +1,403 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the HackerbotEmulator class, a local stand-in for the
+# main controller firmware. It serves the Hackerbot serial protocol on a pty so
+# Hackerbot(port=emulator.port) works unchanged, for benchmarks and soak tests
+# without a robot.
+#
+# Usage: python -m hackerbot.utils.emulator [--latency S] [--jitter S] [--telemetry-rate HZ]
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import tty
+import json
+import math
+import heapq
+import random
+import select
+import argparse
+import threading
+import time
+
+class HackerbotEmulator:
+    """
+    Emulates the main controller on a pty.
+
+    Commands are answered with the same JSON shapes the firmware sends once JSON mode
+    is on ("JSON, 1"). Before that, replies are plain text lines like the firmware's
+    console output. Motion is simulated: B_DRIVE runs for drive_duration seconds and
+    B_GOTO reaches its goal after goto_duration seconds, with encoders and pose
+    integrated along the way.
+    """
+
+    WHEEL_BASE_MM = 250.0 # Distance between the wheels used for the drive kinematics
+    TICKS_PER_MM = 1.0 # Encoder ticks per millimetre of wheel travel
+
+    def __init__(self, latency=0.005, jitter=0.0, command_latency=None, telemetry_rate=0.0,
+                 drive_duration=0.5, goto_duration=0.5, attached=None, map_ids=(1, 2), seed=None):
+        """
+        Args:
+            latency (float): Default seconds before a command is answered.
+            jitter (float): Up to this many seconds are randomly added to every reply.
+            command_latency (dict): Per-command latency overrides, e.g. {"B_MAPDATA": 0.5}.
+            telemetry_rate (float): Unsolicited status lines per second, 0 to disable.
+            drive_duration (float): Seconds a B_DRIVE keeps the wheels moving.
+            goto_duration (float): Seconds a B_GOTO takes to reach its goal.
+            attached (dict): Component name to attached flag reported by PING. All attached by default.
+            map_ids (tuple): Map ids reported by B_MAPLIST and accepted by B_MAPDATA.
+            seed (int): Seed for the jitter generator, for repeatable runs.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.command_latency = dict(command_latency or {})
+        self.telemetry_rate = telemetry_rate
+        self.drive_duration = drive_duration
+        self.goto_duration = goto_duration
+        self.attached = {
+            "main_controller": True,
+            "temperature_sensor": True,
+            "left_tof": True,
+            "right_tof": True,
+            "audio_mouth_eyes": True,
+            "dynamixel_controller": True,
+            "arm_controller": True,
+        }
+        self.attached.update(attached or {})
+        self.map_ids = list(map_ids)
+        self.received = []  # Every command line received, in order
+
+        self._random = random.Random(seed)
+        self._lock = threading.Condition()
+        self._outbox = []  # Heap of (due time, sequence, callable producing the reply)
+        self._outbox_seq = 0
+        self._json_mode = False
+        self._started_at = time.monotonic()
+
+        # Simulated base state
+        self._left_set_speed = 0.0
+        self._right_set_speed = 0.0
+        self._motion_until = None
+        self._left_encoder = 0.0
+        self._right_encoder = 0.0
+        self._pose = [0.0, 0.0, 0.0]  # x (m), y (m), angle (degrees)
+        self._goto = None  # (start time, start pose, goal pose)
+        self._last_update = time.monotonic()
+
+        self._master_fd, self._slave_fd = os.openpty()
+        tty.setraw(self._slave_fd)  # No echo or newline translation, like a USB CDC port
+        self.port = os.ttyname(self._slave_fd)
+
+        self._stop_r, self._stop_w = os.pipe()
+        self._stopped = threading.Event()
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._reader.start()
+        self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Stop the emulator and close the pty."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        os.write(self._stop_w, b"x")
+        with self._lock:
+            self._lock.notify_all()
+        self._reader.join()
+        self._writer.join()
+        for fd in (self._master_fd, self._slave_fd, self._stop_r, self._stop_w):
+            os.close(fd)
+
+    ##### Serial side
+
+    def _read_loop(self):
+        buffer = b""
+        while not self._stopped.is_set():
+            ready, _, _ = select.select([self._master_fd, self._stop_r], [], [])
+            if self._stop_r in ready:
+                break
+            try:
+                data = os.read(self._master_fd, 4096)
+            except OSError:
+                break
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line = line.strip().decode("utf-8", "replace")
+                if line:
+                    self._handle_command(line)
+
+    def _write_loop(self):
+        next_telemetry = time.monotonic()
+        while not self._stopped.is_set():
+            with self._lock:
+                now = time.monotonic()
+                due = []
+                while self._outbox and self._outbox[0][0] <= now:
+                    due.append(heapq.heappop(self._outbox)[2])
+                if self.telemetry_rate > 0 and self._json_mode and now >= next_telemetry:
+                    due.append(self._status_reply)
+                    next_telemetry = now + 1.0 / self.telemetry_rate
+                if not due:
+                    wake_at = self._outbox[0][0] if self._outbox else now + 0.1
+                    if self.telemetry_rate > 0 and self._json_mode:
+                        wake_at = min(wake_at, next_telemetry)
+                    self._lock.wait(max(0.0, wake_at - now))
+                    continue
+                payload = b"".join(self._encode(reply()) for reply in due)
+            try:
+                os.write(self._master_fd, payload)
+            except OSError:
+                break
+
+    def _encode(self, reply):
+        if isinstance(reply, dict):
+            return json.dumps(reply).encode("utf-8") + b"\r\n"
+        return reply.encode("utf-8") + b"\r\n"
+
+    def _schedule(self, name, reply):
+        delay = self.command_latency.get(name, self.latency)
+        if self.jitter:
+            delay += self._random.uniform(0.0, self.jitter)
+        with self._lock:
+            self._outbox_seq += 1
+            heapq.heappush(self._outbox, (time.monotonic() + delay, self._outbox_seq, reply))
+            self._lock.notify_all()
+
+    ##### Protocol
+
+    @staticmethod
+    def response_name(command):
+        """"command" value of the JSON reply to a command, e.g. B_STATUS -> status, H_LOOK -> look."""
+        name = command.split(",", 1)[0].strip().upper()
+        if name[:2] in ("B_", "H_", "A_"):
+            name = name[2:]
+        return name.lower()
+
+    def _handle_command(self, line):
+        self.received.append(line)
+        parts = [part.strip() for part in line.split(",")]
+        name, args = parts[0].upper(), parts[1:]
+        response = self.response_name(name)
+
+        handler = getattr(self, "_cmd_" + name.lower(), None)
+        try:
+            reply = handler(args) if handler else None
+        except (ValueError, IndexError) as e:
+            reply = {"success": "false", "error": f"Invalid arguments: {e}"}
+        if handler is None:
+            reply = {"success": "false", "error": f"Unknown command: {name}"}
+
+        if name == "JSON":
+            self._json_mode = bool(args) and args[0] == "1"
+            if not self._json_mode:
+                self._schedule(name, lambda: "INFO: JSON mode off")
+                return
+        if not self._json_mode:
+            self._schedule(name, lambda: f"INFO: {line}")
+            return
+
+        def build():
+            body = reply() if callable(reply) else dict(reply or {})
+            body.setdefault("success", "true")
+            return {"command": response, **body}
+        self._schedule(name, build)
+
+    def _cmd_json(self, args):
+        return {}
+
+    def _cmd_tofs(self, args):
+        return {}
+
+    def _cmd_ping(self, args):
+        return {key: "attached" if value else "not attached" for key, value in self.attached.items()}
+
+    def _cmd_version(self, args):
+        return {
+            "main_controller": "emulator",
+            "audio_mouth_eyes": "emulator",
+            "dynamixel_controller": "emulator",
+            "arm_controller": "emulator",
+        }
+
+    def _cmd_b_init(self, args):
+        return {}
+
+    def _cmd_b_mode(self, args):
+        return {}
+
+    def _cmd_b_start(self, args):
+        self._stop_motion()
+        return {}
+
+    def _cmd_b_kill(self, args):
+        self._stop_motion()
+        return {}
+
+    def _cmd_b_dock(self, args):
+        self._stop_motion()
+        return {}
+
+    def _cmd_b_quickmap(self, args):
+        return {}
+
+    def _cmd_b_bump(self, args):
+        return {}
+
+    def _cmd_b_status(self, args):
+        return self._status_fields
+
+    def _cmd_b_drive(self, args):
+        l_vel, a_vel = float(args[0]), float(args[1])
+        turn = math.radians(a_vel) * self.WHEEL_BASE_MM / 2.0
+        with self._lock:
+            self._update_motion()
+            self._goto = None
+            self._left_set_speed = l_vel - turn
+            self._right_set_speed = l_vel + turn
+            moving = self._left_set_speed or self._right_set_speed
+            self._motion_until = time.monotonic() + self.drive_duration if moving else None
+        return {}
+
+    def _cmd_b_goto(self, args):
+        goal = [float(args[0]), float(args[1]), float(args[2])]
+        with self._lock:
+            self._update_motion()
+            self._goto = (time.monotonic(), list(self._pose), goal)
+        return {}
+
+    def _cmd_b_pose(self, args):
+        def pose():
+            with self._lock:
+                self._update_motion()
+                x, y, angle = self._pose
+            return {"map_id": self.map_ids[0] if self.map_ids else None,
+                    "pose_x": x, "pose_y": y, "pose_angle": angle}
+        return pose
+
+    def _cmd_b_maplist(self, args):
+        return {"map_ids": list(self.map_ids)}
+
+    def _cmd_b_mapdata(self, args):
+        map_id = int(args[0])
+        if map_id not in self.map_ids:
+            return {"success": "false", "error": f"No map {map_id}"}
+        return {"map_id": map_id, "compressedmapdata": f"emulated-map-{map_id}"}
+
+    def _cmd_h_idle(self, args):
+        return {}
+
+    def _cmd_h_look(self, args):
+        return {}
+
+    def _cmd_h_gaze(self, args):
+        return {}
+
+    def _cmd_a_angle(self, args):
+        return {}
+
+    def _cmd_a_angles(self, args):
+        return {}
+
+    def _cmd_a_cal(self, args):
+        return {}
+
+    def _cmd_a_open(self, args):
+        return {}
+
+    def _cmd_a_close(self, args):
+        return {}
+
+    ##### Simulation
+
+    def _stop_motion(self):
+        with self._lock:
+            self._update_motion()
+            self._left_set_speed = self._right_set_speed = 0.0
+            self._motion_until = None
+
+    def _update_motion(self):
+        # Called with _lock held. Integrates encoders and pose up to now
+        now = time.monotonic()
+        if self._motion_until is not None and now >= self._motion_until:
+            self._integrate(self._motion_until)
+            self._left_set_speed = self._right_set_speed = 0.0
+            self._motion_until = None
+        self._integrate(now)
+
+        if self._goto is not None:
+            started, start, goal = self._goto
+            progress = min(1.0, (now - started) / self.goto_duration) if self.goto_duration > 0 else 1.0
+            self._pose = [s + (g - s) * progress for s, g in zip(start, goal)]
+            if progress >= 1.0:
+                self._goto = None
+
+    def _integrate(self, until):
+        dt = until - self._last_update
+        if dt <= 0:
+            return
+        self._last_update = until
+        left_mm = self._left_set_speed * dt
+        right_mm = self._right_set_speed * dt
+        self._left_encoder += left_mm * self.TICKS_PER_MM
+        self._right_encoder += right_mm * self.TICKS_PER_MM
+
+        distance_m = (left_mm + right_mm) / 2000.0
+        heading = math.radians(self._pose[2])
+        self._pose[0] += distance_m * math.cos(heading)
+        self._pose[1] += distance_m * math.sin(heading)
+        self._pose[2] += math.degrees((right_mm - left_mm) / self.WHEEL_BASE_MM)
+
+    def _status_fields(self):
+        with self._lock:
+            self._update_motion()
+            return {
+                "timestamp": int((time.monotonic() - self._started_at) * 1000),
+                "left_encoder": int(self._left_encoder),
+                "right_encoder": int(self._right_encoder),
+                "left_speed": self._left_set_speed,
+                "right_speed": self._right_set_speed,
+                "left_set_speed": self._left_set_speed,
+                "right_set_speed": self._right_set_speed,
+                "wall_tof": 500,
+            }
+
+    def _status_reply(self):
+        return {"command": "status", "success": "true", **self._status_fields()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an emulated Hackerbot main controller on a pty.")
+    parser.add_argument("--latency", type=float, default=0.005, help="Seconds before each reply")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds added to each reply")
+    parser.add_argument("--telemetry-rate", type=float, default=0.0, help="Unsolicited status lines per second")
+    args = parser.parse_args()
+
+    with HackerbotEmulator(latency=args.latency, jitter=args.jitter, telemetry_rate=args.telemetry_rate) as emulator:
+        print(f"Hackerbot emulator listening on {emulator.port}, connect with Hackerbot(port=\"{emulator.port}\")")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
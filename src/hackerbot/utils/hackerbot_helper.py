@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.07
+# Updated:    2026.10.18
 #
 # This module contains the HackerbotHelper class, which is a subclass of SerialHelper.
 # It contains the fields that will be share among higher level classes.
@@ -17,11 +17,10 @@
 
 
 from .serial_helper import SerialHelper
-import time
 import logging
 
 class HackerbotHelper(SerialHelper):
-    def __init__(self, port=None, board=None, verbose_mode=False):
+    def __init__(self, port=None, board=None, verbose_mode=False, serial_number=None):
         self._error_msg = ""
         self._warning_msg = ""
         self._v_mode = verbose_mode
@@ -44,9 +43,13 @@ class HackerbotHelper(SerialHelper):
         self._dynamixel_controller_attached = False
 
         self._arm_attached = False
+
+        self._error_count = 0
+        self._warning_count = 0
         
         self._port = port
         self._board = board
+        self._serial_number = serial_number
 
         self.setup()
 
@@ -55,32 +58,34 @@ class HackerbotHelper(SerialHelper):
         """
         Initialize the main controller.
 
-        If self._port and self._board are None, this method will find the first available serial port and use it to initialize the main controller.
-        Otherwise, it will use the provided port and board to initialize.
+        If self._port is None, this method will find the first available serial port and use it to initialize the main controller.
+        Otherwise, it will use the provided port, which can also be a "tcp://host:port" or "unix:///path" URL.
         After initialization, it will set the main controller to JSON mode and enable the TOFs.
         This setup ensures json mode are set and controller is initialized properly.
         If an exception occurs during initialization, it will raise an exception with the error message.
         """
         try:
-            if self._port is None or self._board is None:
-                super().__init__()
-                self._board, self._port = super().get_board_and_port()
+            if self._board is None:
+                super().__init__(self._port, serial_number=self._serial_number)
             else:
-                super().__init__(self._port, self._board)
+                super().__init__(self._port, self._board, serial_number=self._serial_number)
+            self._board, self._port = super().get_board_and_port()
 
             self._main_controller_init = True
-            self.set_json_mode(True)
+            self._handshake()
             # self.set_TOFs(True)
         except Exception as e:
             raise Exception(f"Error in setting up hackerbot helper: {e}")
 
+    def _handshake(self):
+        """First commands after the port is open. Hackerbot pipelines its startup commands here."""
+        self.set_json_mode(True)
+
     # Activate JSON mode
     def set_json_mode(self, mode):
         try:
             if mode == True:
-                super().send_raw_command("JSON, 1")
-                time.sleep(0.1) # Short sleep to process json response
-                response = super().get_json_from_command("json")
+                response = super().send_command_and_wait("JSON, 1", "json")
                 if response is None:
                     raise Exception("Failed to set json mode to: ", mode)
             else:
@@ -89,17 +94,20 @@ class HackerbotHelper(SerialHelper):
         except Exception as e:
             raise Exception(f"Error in set_json_mode: {e}")
 
+    def _on_reconnect(self):
+        # The controller comes back in its power-on state after a reset
+        try:
+            if self._json_mode:
+                self.set_json_mode(True)
+        except Exception as e:
+            self.log_error(f"Error restoring state after reconnect: {e}")
+
     #Set TOFs
     def set_TOFs(self, mode):
         try:
             if not self._left_tof_attached or not self._right_tof_attached:
                 raise Exception("TOFs not attached")
-            if mode == True:
-                super().send_raw_command("TOFS, 1")
-            else:
-                super().send_raw_command("TOFS, 0")
-            time.sleep(0.1) # Short sleep to process json response
-            response = super().get_json_from_command("tofs")
+            response = super().send_command_and_wait("TOFS, 1" if mode else "TOFS, 0", "tofs")
             if response is None:
                 raise Exception("TOFs activation failed")
             self._tofs_enabled = mode
@@ -120,11 +128,32 @@ class HackerbotHelper(SerialHelper):
         if self._v_mode:
             logging.error(error)
         self._error_msg = error
+        self._error_count += 1
 
     def log_warning(self, warning):
         if self._v_mode:
             logging.warning(warning)
         self._warning_msg = warning
+        self._warning_count += 1
+
+    def get_counters(self):
+        """Transport counters of SerialHelper plus the "errors" and "warnings" logged by the subsystems."""
+        counters = super().get_counters()
+        counters["errors"] = self._error_count
+        counters["warnings"] = self._warning_count
+        return counters
+
+    def get_attached_components(self):
+        """Attached flags of the components reported by the last ping."""
+        return {
+            "main_controller": self._main_controller_attached,
+            "temperature_sensor": self._temperature_sensor_attached,
+            "left_tof": self._left_tof_attached,
+            "right_tof": self._right_tof_attached,
+            "audio_mouth_eyes": self._audio_mouth_eyes_attached,
+            "dynamixel_controller": self._dynamixel_controller_attached,
+            "arm_controller": self._arm_attached,
+        }
 
     def check_controller_init(self):
         if not self._main_controller_init:
@@ -134,6 +163,7 @@ class HackerbotHelper(SerialHelper):
 
     def destroy(self):
         try:
+            self.stop_metrics_server()
             super().disconnect_serial()
             self._main_controller_init = False
             return True
@@ -0,0 +1,144 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains LatencyHistogram, a fixed-size log-linear histogram in
+# the style of HdrHistogram, and CommandLatency, the per-command set of
+# histograms and counters SerialHelper keeps.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import math
+
+class LatencyHistogram:
+    """
+    Latency histogram with constant relative precision.
+
+    Values are stored in microseconds. Every power of two is split into SUB_BUCKETS / 2
+    linear buckets, so percentiles are within about 3% of the recorded value, from 1 us
+    up to MAX_SECONDS. Larger values land in the last bucket. count, min, max and mean
+    are exact. record() is a few integer operations and one list increment.
+    """
+
+    SUB_BUCKET_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    MAX_SECONDS = 3600.0
+
+    def __init__(self):
+        max_value = int(self.MAX_SECONDS * 1e6)
+        self._size = self._index(max_value) + 1
+        self.reset()
+
+    def reset(self):
+        self._counts = [0] * self._size
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        if value < self.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - self.SUB_BUCKET_BITS
+        half = self.SUB_BUCKETS >> 1
+        return self.SUB_BUCKETS + (shift - 1) * half + (value >> shift) - half
+
+    def _bucket_range(self, index):
+        # Lowest value and width in microseconds of a bucket
+        if index < self.SUB_BUCKETS:
+            return index, 1
+        half = self.SUB_BUCKETS >> 1
+        shift = (index - self.SUB_BUCKETS) // half + 1
+        top = (index - self.SUB_BUCKETS) % half + half
+        return top << shift, 1 << shift
+
+    def record(self, seconds):
+        """Record a latency in seconds."""
+        if seconds < 0:
+            seconds = 0.0
+        index = self._index(int(seconds * 1e6))
+        self._counts[index if index < self._size else self._size - 1] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent):
+        """
+        Latency below which percent of the recorded values fall.
+
+        :param percent: Percentile between 0 and 100
+        :return: Seconds, or None if nothing has been recorded
+        """
+        if not self.count:
+            return None
+        if percent <= 0:
+            return self.min
+        if percent >= 100:
+            return self.max
+        target = max(1, math.ceil(percent / 100.0 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= target:
+                low, width = self._bucket_range(index)
+                value = (low + width / 2.0) / 1e6
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        """
+        :return: Dict with "count", "min", "mean", "max", "p50", "p90" and "p99", latencies in seconds
+        """
+        return {
+            "count": self.count,
+            "min": self.min,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class CommandLatency:
+    """
+    Latency histograms and error counters of one command name.
+
+    - write: from the command being queued to it being written to the port
+    - first_byte: from the command being queued to the next bytes arriving from the controller
+    - response: from the command being queued to its JSON response being parsed
+    """
+
+    __slots__ = ("write", "first_byte", "response", "timeouts", "failures")
+
+    def __init__(self):
+        self.write = LatencyHistogram()
+        self.first_byte = LatencyHistogram()
+        self.response = LatencyHistogram()
+        self.timeouts = 0
+        self.failures = 0
+
+    def summary(self):
+        return {
+            "write": self.write.summary(),
+            "first_byte": self.first_byte.summary(),
+            "response": self.response.summary(),
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+        }
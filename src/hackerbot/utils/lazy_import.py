@@ -0,0 +1,48 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the helper modules use to defer heavy optional
+# dependencies (audio, TTS, downloads) until they are first used, so that
+# `import hackerbot` stays fast for scripts that never need them.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import importlib
+
+def lazy_import(module_globals, imports, name):
+    """
+    Import one of a module's deferred dependencies and cache it as a module global.
+
+    Modules pair this with a module-level __getattr__, so that patch("pkg.module.name")
+    and pkg.module.name keep working before the first use:
+
+        _LAZY_IMPORTS = {"sd": ("sounddevice", None), "PiperVoice": ("piper.voice", "PiperVoice")}
+
+        def __getattr__(name):
+            if name in _LAZY_IMPORTS:
+                return lazy_import(globals(), _LAZY_IMPORTS, name)
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    :param module_globals: globals() of the importing module
+    :param imports: Dict of name -> (module name, attribute or None for the module itself)
+    :param name: Name to resolve
+    :return: The module or attribute
+    """
+    if name in module_globals:
+        return module_globals[name]
+    module_name, attribute = imports[name]
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    module_globals[name] = value
+    return value
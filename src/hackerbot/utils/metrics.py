@@ -0,0 +1,134 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the MetricsServer class, a small HTTP endpoint that
+# exports the SerialHelper and HackerbotHelper counters and the per-command
+# latency histograms in the Prometheus text exposition format.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# get_counters key -> metric name, type and help text
+COUNTERS = [
+    ("bytes_in", "hackerbot_serial_bytes_received_total", "counter", "Bytes read from the main controller."),
+    ("bytes_out", "hackerbot_serial_bytes_sent_total", "counter", "Bytes written to the main controller."),
+    ("lines", "hackerbot_serial_lines_total", "counter", "Lines received from the main controller."),
+    ("responses", "hackerbot_serial_responses_total", "counter", "JSON responses with a command key received."),
+    ("decode_failures", "hackerbot_serial_decode_failures_total", "counter", "Lines that failed to decode as JSON."),
+    ("dropped_frames", "hackerbot_serial_dropped_frames_total", "counter", "Oversized lines, recorder frames and subscription dispatch backlog entries dropped."),
+    ("write_queue_depth", "hackerbot_serial_write_queue_depth", "gauge", "Commands waiting for the writer thread."),
+    ("pending_responses", "hackerbot_serial_pending_responses", "gauge", "Callers waiting for a response."),
+    ("reconnects", "hackerbot_serial_reconnects_total", "counter", "Times the serial link was reopened."),
+    ("errors", "hackerbot_errors_total", "counter", "Errors logged by the subsystems."),
+    ("warnings", "hackerbot_warnings_total", "counter", "Warnings logged by the subsystems."),
+]
+
+LATENCY_PHASES = ("write", "first_byte", "response")
+QUANTILES = (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99"))
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _sample(name, value, **labels):
+    if labels:
+        label_text = ",".join(f'{key}="{_label_value(label)}"' for key, label in labels.items())
+        name = f"{name}{{{label_text}}}"
+    return f"{name} {float(value) if value is not None else 'NaN'}"
+
+
+def render_metrics(helper):
+    """
+    Render the metrics of a SerialHelper or HackerbotHelper.
+
+    :param helper: Helper to read the counters from
+    :return: Prometheus text exposition
+    """
+    lines = []
+    counters = helper.get_counters()
+    for key, name, metric_type, help_text in COUNTERS:
+        if key in counters:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(_sample(name, counters[key]))
+
+    if hasattr(helper, "get_attached_components"):
+        lines.append("# HELP hackerbot_component_attached Whether a component answered the last ping.")
+        lines.append("# TYPE hackerbot_component_attached gauge")
+        for component, attached in helper.get_attached_components().items():
+            lines.append(_sample("hackerbot_component_attached", int(bool(attached)), component=component))
+
+    latency = helper.get_latency_stats()
+    lines.append("# HELP hackerbot_command_latency_seconds Seconds from a command being queued to it being written, to the first byte received and to its response.")
+    lines.append("# TYPE hackerbot_command_latency_seconds summary")
+    for command, stats in latency.items():
+        for phase in LATENCY_PHASES:
+            summary = stats[phase]
+            if not summary["count"]:
+                continue
+            for quantile, key in QUANTILES:
+                lines.append(_sample("hackerbot_command_latency_seconds", summary[key], command=command, phase=phase, quantile=quantile))
+            lines.append(_sample("hackerbot_command_latency_seconds_sum", summary["mean"] * summary["count"], command=command, phase=phase))
+            lines.append(_sample("hackerbot_command_latency_seconds_count", summary["count"], command=command, phase=phase))
+    for key, name, help_text in (("timeouts", "hackerbot_command_timeouts_total", "Waits for a response that ran out."),
+                                 ("failures", "hackerbot_command_failures_total", "Unsuccessful responses.")):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for command, stats in latency.items():
+            lines.append(_sample(name, stats[key], command=command))
+
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        try:
+            body = render_metrics(self.server.helper).encode("utf-8")
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood stderr
+
+
+class MetricsServer:
+    """Serves render_metrics(helper) on http://host:port/metrics from a daemon thread."""
+
+    def __init__(self, helper, port, host="127.0.0.1"):
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.helper = helper
+        self.host = host
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -0,0 +1,133 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the serial port discovery for the main controller. Ports
+# are matched on their USB vendor and product ID (and serial number, when one is
+# known) rather than their description. The last port that matched is kept in
+# a small cache file and checked first, so the full port enumeration only runs
+# when the device is new or has moved.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import sys
+import json
+import serial.tools.list_ports
+from collections import namedtuple
+
+# USB (vendor ID, product ID) pairs of each supported main controller board
+BOARD_USB_IDS = {
+    "adafruit:samd:adafruit_qt_py_m0": ((0x239A, 0x80CB),),
+}
+
+# Port description matched when no port has the board's USB IDs, as before USB IDs were used.
+# Also the only match for boards missing from BOARD_USB_IDS
+FALLBACK_DESCRIPTION = "QT Py"
+
+PORT_CACHE_PATH = os.path.join(os.environ['HOME'], "hackerbot/port_cache.json")
+
+PortIdentity = namedtuple("PortIdentity", ["device", "vid", "pid", "serial_number"])
+
+def port_identity(device):
+    """
+    Read the USB identity of a single device path, without enumerating every port.
+
+    :param device: Device path, e.g. "/dev/ttyACM0"
+    :return: PortIdentity, or None if the device does not exist or its identity
+        cannot be read directly on this platform
+    """
+    if not sys.platform.startswith("linux") or not os.path.exists(device):
+        return None
+    from serial.tools.list_ports_linux import SysFS
+    try:
+        info = SysFS(os.path.realpath(device))
+    except (OSError, ValueError):
+        return None
+    if info.vid is None:
+        return None
+    return PortIdentity(device, info.vid, info.pid, info.serial_number)
+
+def _matches(identity, usb_ids, serial_number=None):
+    if (identity.vid, identity.pid) not in usb_ids:
+        return False
+    return serial_number is None or identity.serial_number == serial_number
+
+def load_port_cache(board, path=PORT_CACHE_PATH):
+    """
+    :return: The cached PortIdentity for board, or None if there is no usable entry
+    """
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+        entry = cache[board]
+        return PortIdentity(entry["device"], entry["vid"], entry["pid"], entry.get("serial_number"))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_port_cache(board, identity, path=PORT_CACHE_PATH):
+    """Remember identity as the last good port for board. Failures are ignored, the cache is only a shortcut."""
+    try:
+        try:
+            with open(path) as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        cache[board] = identity._asdict()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)  # Readers never see a partial file
+    except OSError:
+        pass
+
+def discover_port(board, serial_number=None, cache_path=PORT_CACHE_PATH):
+    """
+    Find the serial port of the main controller.
+
+    The cached port is tried first and used if its USB identity still matches. Otherwise
+    every port is enumerated, preferring the cached serial number when several boards
+    match, and the result is cached. If no port has the board's USB IDs, the first port
+    whose description contains FALLBACK_DESCRIPTION is used, without caching it.
+
+    :param board: Board name, usually a key of BOARD_USB_IDS
+    :param serial_number: Only accept the board with this USB serial number
+    :param cache_path: Cache file, None to disable caching
+    :return: Device path
+    """
+    usb_ids = BOARD_USB_IDS.get(board, ())
+
+    cached = load_port_cache(board, cache_path) if cache_path else None
+    if cached is not None and _matches(cached, usb_ids, serial_number):
+        identity = port_identity(cached.device)
+        if identity is not None and identity[1:] == cached[1:]:
+            return identity.device
+
+    ports = serial.tools.list_ports.comports()
+    candidates = [PortIdentity(port.device, port.vid, port.pid, port.serial_number) for port in ports]
+    candidates = [identity for identity in candidates if _matches(identity, usb_ids, serial_number)]
+    if not candidates:
+        for port in ports:
+            if FALLBACK_DESCRIPTION in (port.description or "") and serial_number in (None, port.serial_number):
+                return port.device
+        raise ConnectionError(f"No Port found for {board}, are you using a different board?")
+
+    # Stay on the same board if it is still plugged in under a new name
+    if cached is not None:
+        candidates.sort(key=lambda identity: identity.serial_number != cached.serial_number)
+    identity = candidates[0]
+    if cache_path:
+        save_port_cache(board, identity, cache_path)
+    return identity.device
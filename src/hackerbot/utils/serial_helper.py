@@ -6,11 +6,17 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.07
+# Updated:    2026.10.18
 #
 # This module contains the SerialHelper class, which is a base class does the 
 # serial handling. Including sending serial commands, finding serial ports
-# reading serial outputs.
+# (utils/port_discovery.py) reading serial outputs. The port itself is opened through utils/transport.py,
+# so the same logic runs over serial, TCP and Unix socket links. Raw traffic can
+# be recorded to LOG_FILE_PATH with start_recording, and incoming messages can
+# be streamed to callbacks or queues with subscribe. How long to wait for each
+# response, and how often to resend, comes from utils/command_policy.py. The
+# latest status, pose and ping can be shared with other local processes through
+# a memory-mapped state block with start_state_block.
 #
 # Special thanks to the following for their code contributions to this codebase:
 # Allen Chien - https://github.com/AllenChienXXX
@@ -18,66 +24,393 @@
 
 
 import serial
-import serial.tools.list_ports
+from .transport import open_transport
+from .port_discovery import discover_port, PORT_CACHE_PATH
+from .serial_recorder import SerialRecorder, TX, RX
+from .serial_replay import ReplayTransport
+from .latency_histogram import CommandLatency
+from .subscriptions import Subscription, DispatchWorker, DROP_OLDEST, BLOCK
+from .command_policy import CommandPolicies, DEFAULT_COMMAND_POLICIES, command_name
+from .state_block import StateBlockWriter, STATE_BLOCK_PATH
 import threading
 import os
 import json
-from collections import deque
+from collections import deque, namedtuple
+from concurrent.futures import Future
 import time
 
-class SerialHelper:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON decoders that can be selected by name with SerialHelper.set_json_decoder
+JSON_DECODERS = {"json": json.loads}
+if orjson is not None:
+    JSON_DECODERS["orjson"] = orjson.loads
+
+# Latest response for a command: global arrival sequence number, time.monotonic() arrival time and the JSON entry.
+# Inside the index the entry may still be the raw line, it is decoded on first lookup
+IndexedResponse = namedtuple("IndexedResponse", ["seq", "timestamp", "entry"])
+
+class _PendingWrite:
+    """A chunk of bytes queued for the writer thread."""
+    __slots__ = ("data", "commands", "enqueued_at", "written", "error")
+
+    def __init__(self, data, commands):
+        self.data = data
+        self.commands = commands
+        self.enqueued_at = time.monotonic()
+        self.written = threading.Event()
+        self.error = None
+
+class SerialHelper(CommandPolicies):
     HOME_DIR = os.environ['HOME']
 
-    LOG_FILE_PATH = os.path.join(HOME_DIR, "hackerbot/logs/serial_log.txt")
+    LOG_FILE_PATH = os.path.join(HOME_DIR, "hackerbot/logs/serial_log.bin")
     MAP_DATA_PATH = os.path.join(HOME_DIR, "hackerbot/logs/map_{map_id}.txt")
+    PORT_CACHE_PATH = PORT_CACHE_PATH # Last auto-detected port, None to disable
+
+    READ_TIMEOUT = 0.5 # Seconds a blocking read waits before re-checking the stop event
+    READ_ERROR_BACKOFF = 0.1 # Seconds to wait after a read error before retrying
+    MAX_LINE_SIZE = 1024 * 1024 # Bytes buffered without a newline before they are dropped
+    RESPONSE_TIMEOUT = 0.6 # Seconds to wait for a JSON response to a command without a policy
+
+    WRITE_QUEUE_SIZE = 64 # Queued writes before senders block
+    WRITE_TIMEOUT = 1.0 # Seconds a sender waits for its command to reach the port
+    MAX_WRITE_SIZE = 4096 # Bytes the writer merges into a single write call
+    PRIORITY_COMMANDS = ("B_KILL",) # Safety commands that skip ahead of queued traffic
+
+    RECONNECT_BACKOFF = 0.1 # Seconds before the first reconnect attempt, doubled after each failure
+    RECONNECT_BACKOFF_MAX = 5.0 # Longest wait between reconnect attempts
+
+    MAX_INFLIGHT = 64 # Sent commands per response name waiting to be paired with a response
+    INFLIGHT_TIMEOUT = 10.0 # Seconds after which a sent command is no longer paired with a response
+
+    DISPATCH_WORKERS = 2 # Threads delivering entries to subscribers, started on the first subscribe.
+                         # Each "block" subscription gets a thread of its own on top
 
     # port = '/dev/ttyACM1'
-    def __init__(self, port=None, board="adafruit:samd:adafruit_qt_py_m0", baudrate=230400):
+    def __init__(self, port=None, board="adafruit:samd:adafruit_qt_py_m0", baudrate=230400, serial_number=None):
         self.port = port
         self.board = board
         self.baudrate = baudrate
+        self.serial_number = serial_number  # USB serial number find_port requires, to pick one of several boards
         self.ser = None
         self.state = None
         self.ser_error = None
+        self._auto_port = port is None  # Re-run find_port on reconnect, the device may re-enumerate
+
+        self._reconnect_count = 0
+        self._last_reconnect_duration = None
+        self._total_reconnect_duration = 0.0
+
+        self._rx_buffer = bytearray()  # Received bytes not yet split into lines, reused across reads
+        self._command_names = {}  # Raw "command" values seen on the wire -> str
+        self._json_loads = json.loads
+
+        # Latest response per "command" name, so lookups are O(1) and nothing is evicted by telemetry
+        self._responses = {}
+        self._response_seq = 0
+        self._responses_cond = threading.Condition()
+
+        # Pending responses keyed by the expected "command" name, oldest waiter first
+        self._waiters = {}
+        self._waiters_lock = threading.Lock()
+
+        # Outgoing commands, drained by the write thread. The priority lane always goes first
+        self._write_queue = deque()
+        self._priority_write_queue = deque()
+        self._write_cond = threading.Condition()
+
+        # Per-command latency, see get_latency_stats. Sent commands are paired with the next
+        # response whose "command" is their response name, e.g. B_STATUS with status
+        self._latency = {}  # command name -> CommandLatency
+        self._inflight = {}  # response name -> deque of [CommandLatency, sent time, first byte time]
+        self._awaiting_first_byte = deque()  # In-flight entries of commands written since the last read
+        self._response_commands = {}  # response name -> command name that was last sent for it
+        # Error counters are bumped by every thread that waits on a response or looks one up
+        self._stats_lock = threading.Lock()
+
+        self._recorder = None  # SerialRecorder while start_recording is active
 
-        self.json_entries = deque(maxlen=20)  # Store up to 10 most recent JSON entries
+        self._command_policies = dict(DEFAULT_COMMAND_POLICIES)  # command name -> CommandPolicy
+
+        self._state_block = None  # StateBlockWriter while start_state_block is active
+        self._metrics_server = None  # MetricsServer while start_metrics_server is active
+        self._state_block_subscriptions = []
+
+        # Subscriptions, see subscribe. Both are replaced rather than mutated so the read thread
+        # can look them up without taking the lock
+        self._subscriptions = {}  # "command" name -> tuple of Subscription
+        self._wildcard_subscriptions = ()  # Subscriptions to every command, filtered by predicate
+        self._subscriptions_lock = threading.Lock()
+        self._dispatch_workers = []
+        self._next_worker = 0
+        self._block_workers = []  # Own DispatchWorker of each open "block" subscription
+        self._closed_workers_dropped = 0  # Backlog drops of block workers already stopped
+
+        # Transport counters, see get_counters. Each is only written by one thread, except decode_failures
+        # which lazy lookups also bump under _stats_lock
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._lines = 0
+        self._decode_failures = 0
+        self._dropped_lines = 0
 
         try:
             if self.port is None:
                 self.port = self.find_port()
-            self.ser = serial.Serial(port=self.port, baudrate=baudrate, timeout=1)
+            self.ser = self._open_port(self.port)
         except ConnectionError as e:
             raise ConnectionError(f"Error initializing main controller: {e}")
         except serial.SerialException as e:
             raise ConnectionError(f"Serial connection error: {port}. {e}")
         except Exception as e:
             raise RuntimeError(f"Error initializing main controller: {e}")
-        
+
+        if isinstance(self.ser, ReplayTransport):
+            self.ser.attach(self)  # Lets a SessionReplay observe every line from the first one
+
         self.read_thread_stop_event = threading.Event()
         self.read_thread = threading.Thread(target=self.read_serial)
-        self.read_thread.daemon = False
+        self.read_thread.daemon = True
         self.read_thread.start()
 
+        self.write_thread_stop_event = threading.Event()
+        self.write_thread = threading.Thread(target=self.write_serial)
+        self.write_thread.daemon = True
+        self.write_thread.start()
+
+    def _open_port(self, port):
+        # Device paths open as serial.Serial, "tcp://" and "unix://" ports as socket transports
+        return open_transport(port, self.baudrate, self.READ_TIMEOUT)
+
     def find_port(self):
-        ports = list(serial.tools.list_ports.comports())
-        for port in ports:
-            if "QT Py" in port.description:
-                return port.device 
-            
-        raise ConnectionError(f"No Port found for {self.board}, are you using a different board?")
+        # Matched on USB VID/PID, the cached port is checked before enumerating, see utils/port_discovery.py
+        return discover_port(self.board, self.serial_number, cache_path=self.PORT_CACHE_PATH)
 
     def get_board_and_port(self):
         return self.board, self.port
 
-    def send_raw_command(self, command):
-        if self.ser and self.ser.is_open:
+    def send_raw_command(self, command, priority=None):
+        """
+        Queue a command for the write thread and wait until it is on the wire.
+
+        :param command: Raw command string, e.g. "B_DRIVE,100,0"
+        :param priority: Send ahead of queued traffic. Defaults to True for PRIORITY_COMMANDS
+        """
+        if priority is None:
+            priority = self._command_name(command) in self.PRIORITY_COMMANDS
+        self._write(command.encode('utf-8') + b'\r\n', [command], priority)
+        self.state = command
+
+    @staticmethod
+    def _command_name(command):
+        return command_name(command)
+
+    def _write(self, data, commands=(), priority=False):
+        if not (self.ser and self.ser.is_open):
+            raise ConnectionError("Serial port is closed or unavailable!")
+
+        pending = _PendingWrite(data, commands)
+        with self._write_cond:
+            if priority:
+                self._priority_write_queue.append(pending)
+            else:
+                while len(self._write_queue) >= self.WRITE_QUEUE_SIZE:
+                    if not self._write_cond.wait(timeout=self.WRITE_TIMEOUT):
+                        raise IOError("Serial write queue is full")
+                self._write_queue.append(pending)
+            self._write_cond.notify_all()
+
+        if not pending.written.wait(timeout=self.WRITE_TIMEOUT):
+            raise IOError("Timed out waiting for the serial write thread")
+        if pending.error is not None:
+            raise pending.error
+
+    def write_serial(self):
+        """Drain queued commands, merging everything queued so far into one write."""
+        while True:
+            with self._write_cond:
+                while not (self._priority_write_queue or self._write_queue or self.write_thread_stop_event.is_set()):
+                    self._write_cond.wait()
+                if not (self._priority_write_queue or self._write_queue):
+                    break  # Stop requested and nothing left to send
+
+                batch = list(self._priority_write_queue)
+                self._priority_write_queue.clear()
+                size = sum(len(pending.data) for pending in batch)
+                while self._write_queue and (not batch or size + len(self._write_queue[0].data) <= self.MAX_WRITE_SIZE):
+                    pending = self._write_queue.popleft()
+                    size += len(pending.data)
+                    batch.append(pending)
+                self._write_cond.notify_all()  # Wake senders blocked on a full queue
+
+            error = None
             try:
-                self.ser.write(command.encode('utf-8') + b'\r\n')
-                self.state = command
+                payload = b"".join(pending.data for pending in batch)
+                self.ser.write(payload)
+                self._bytes_out += len(payload)
+                recorder = self._recorder
+                if recorder is not None:
+                    recorder.record(TX, time.monotonic_ns(), payload)
             except serial.SerialException as e:
-                raise IOError(f"Error writing to serial port: {e}")
-        else:
-            raise ConnectionError("Serial port is closed or unavailable!")
+                error = IOError(f"Error writing to serial port: {e}")
+            except Exception as e:
+                error = e
+
+            written_at = time.monotonic()
+            for pending in batch:
+                if error is None:
+                    self._record_write_latency(pending, written_at)
+                pending.error = error
+                pending.written.set()
+
+    def _record_write_latency(self, pending, written_at):
+        sent_at = pending.enqueued_at
+        for command in pending.commands:
+            name = self._command_name(command)
+            stats = self._command_latency(name)
+            stats.write.record(written_at - sent_at)
+            # The first byte time is filled in by the read thread, and only recorded once the
+            # response arrives, so commands without a response never count
+            entry = [stats, sent_at, None]
+            self._awaiting_first_byte.append(entry)
+
+            response = self._response_name(name)
+            self._response_commands[response] = name
+            inflight = self._inflight.get(response)
+            if inflight is None:
+                inflight = self._inflight.setdefault(response, deque(maxlen=self.MAX_INFLIGHT))
+            inflight.append(entry)
+
+    def _command_latency(self, name):
+        stats = self._latency.get(name)
+        if stats is None:
+            stats = self._latency.setdefault(name, CommandLatency())
+        return stats
+
+    @staticmethod
+    def _response_name(command_name):
+        # The controller answers B_STATUS with "status", H_LOOK with "look", PING with "ping"
+        if command_name[:2] in ("B_", "H_", "A_"):
+            command_name = command_name[2:]
+        return command_name.lower()
+
+    def get_write_latency(self):
+        """
+        Enqueue-to-wire latency of sent commands.
+
+        :return: Dict of command name to {"count", "mean", "max"}, latencies in seconds
+        """
+        return {
+            name: {"count": stats.write.count, "mean": stats.write.mean, "max": stats.write.max}
+            for name, stats in list(self._latency.items()) if stats.write.count
+        }
+
+    def get_latency_stats(self, command=None):
+        """
+        Round-trip latency histograms per command name.
+
+        Every command has "write" (queued to written), "first_byte" (queued to the next
+        bytes received after it was written, which may belong to streamed telemetry rather
+        than its response; only recorded for commands whose response arrived) and
+        "response" (queued to its JSON response parsed) summaries with
+        count, min, mean, max, p50, p90 and p99 in seconds, plus "timeouts" and "failures"
+        counts of waits that ran out or got an unsuccessful response.
+
+        :param command: Command name such as "B_STATUS", or None for every command
+        :return: Dict of command name to its stats, or the stats of one command (None if never sent)
+        """
+        if command is not None:
+            stats = self._latency.get(command)
+            return stats.summary() if stats is not None else None
+        return {name: stats.summary() for name, stats in list(self._latency.items())}
+
+    def reset_latency_stats(self):
+        """Clear all latency histograms and counters, e.g. between benchmark runs."""
+        self._latency = {}
+        # In-flight entries hold the old histograms, responses to them must not count
+        self._inflight = {}
+        self._awaiting_first_byte = deque()
+
+    def _count_error(self, command_name, timeout):
+        stats = self._command_latency(command_name)
+        with self._stats_lock:
+            if timeout:
+                stats.timeouts += 1
+            else:
+                stats.failures += 1
+
+    def start_recording(self, path=None, max_bytes=SerialRecorder.MAX_BYTES, backup_count=SerialRecorder.BACKUP_COUNT):
+        """
+        Record every frame written to and read from the port into a binary log.
+
+        Read it back with serial_recorder.read_recording. Calling this while already
+        recording restarts the recording in the new file.
+
+        :param path: Recording file, LOG_FILE_PATH by default
+        :param max_bytes: Size at which the file is rotated
+        :param backup_count: Rotated files to keep
+        :return: The SerialRecorder
+        """
+        self.stop_recording()
+        self._recorder = SerialRecorder(path or self.LOG_FILE_PATH, max_bytes, backup_count)
+        return self._recorder
+
+    def stop_recording(self):
+        """Stop recording and flush the log to disk."""
+        recorder, self._recorder = self._recorder, None
+        if recorder is not None:
+            recorder.close()
+
+    def start_state_block(self, path=STATE_BLOCK_PATH):
+        """
+        Publish every status, pose and ping response into a shared-memory state block.
+
+        Other processes read it with state_block.StateBlockReader. Responses are published
+        whoever asked for them, including the clients of a HackerbotDaemon.
+
+        :param path: File to map, in /dev/shm by default
+        :return: The StateBlockWriter
+        """
+        self.stop_state_block()
+        writer = StateBlockWriter(path)
+        self._state_block = writer
+        self._state_block_subscriptions = [
+            self.subscribe("status", callback=writer.update_status),
+            self.subscribe("pose", callback=writer.update_pose),
+            self.subscribe("ping", callback=writer.update_components),
+        ]
+        return writer
+
+    def stop_state_block(self):
+        """Stop publishing and remove the state block."""
+        for subscription in self._state_block_subscriptions:
+            subscription.close()
+        self._state_block_subscriptions = []
+        if self._state_block is not None:
+            self._state_block.close()
+            self._state_block = None
+
+    def start_metrics_server(self, port, host="127.0.0.1"):
+        """
+        Serve the counters and latency histograms in Prometheus text format on http://host:port/metrics.
+
+        :param port: TCP port, 0 picks a free one (see the returned server's port)
+        :param host: Interface to listen on, only the local machine by default
+        :return: The MetricsServer
+        """
+        self.stop_metrics_server()
+        from .metrics import MetricsServer  # http.server is only imported when metrics are served
+        self._metrics_server = MetricsServer(self, port, host)
+        return self._metrics_server
+
+    def stop_metrics_server(self):
+        server, self._metrics_server = self._metrics_server, None
+        if server is not None:
+            server.close()
 
     def get_state(self):    
         return self.state
@@ -96,24 +429,23 @@ class SerialHelper:
                     if not self.ser.is_open:
                         self.ser_error = "Serial port is closed or unavailable!"
                         # raise ConnectionError("Serial port is closed or unavailable!")
-                    
-                    if self.ser.in_waiting > 0:
-                        response = self.ser.readline().decode('utf-8').strip()
-                        if response:
-                            # Try to parse the response as JSON
-                            try:
-                                json_entry = json.loads(response)
-                                if json_entry.get("command"): # Only store JSON entries with a "command" key
-                                    self.json_entries.append(json_entry)  # Store the latest JSON entry
-                            except json.JSONDecodeError:
-                                # If it's not a valid JSON entry, just continue
-                                continue
-                except serial.SerialException as e:
+                        self.read_thread_stop_event.wait(self.READ_ERROR_BACKOFF)
+                        continue
+
+                    # Blocks until a byte arrives or the port timeout expires, so the thread
+                    # sleeps in the kernel instead of polling. Anything already waiting comes
+                    # along in the same read.
+                    data = self.ser.read(max(1, self.ser.in_waiting))
+                    if data:
+                        self._handle_rx_data(data)
+                except (serial.SerialException, OSError) as e:
                     self.ser_error = f"Serial read error: {e}"
                     # raise IOError(f"Serial read error: {e}")
+                    self._reconnect(e)
                 except Exception as e:
                     self.ser_error = f"Unexpected read error: {e}"
                     # raise RuntimeError(f"Unexpected read error: {e}")
+                    self.read_thread_stop_event.wait(self.READ_ERROR_BACKOFF)
         except PermissionError as e:
             self.ser_error = f"Permission error: {e}"
             # raise IOError(f"File write error: {e}")
@@ -121,33 +453,530 @@ class SerialHelper:
             self.ser_error = f"Unexpected error: {e}"
             # raise IOError(f"File write error: {e}")
 
-    def get_json_from_command(self, command_filter=None):
+    def _reconnect(self, error):
+        """
+        Recover from a dropped link. Runs on the read thread.
+
+        In-flight requests fail with ConnectionError, then the port is reopened with
+        exponential backoff (re-running find_port if it was auto-detected) and
+        _on_reconnect is called so subclasses can restore their state.
+        """
+        started = time.monotonic()
+        self._fail_waiters(ConnectionError(f"Serial link lost: {error}"))
+
+        try:
+            self.ser.close()
+        except Exception:
+            pass  # The device is usually already gone
+
+        delay = self.RECONNECT_BACKOFF
+        while not self.read_thread_stop_event.wait(delay):
+            try:
+                port = self.find_port() if self._auto_port else self.port
+                self.ser = self._open_port(port)
+                self.port = port
+                break
+            except Exception as e:
+                self.ser_error = f"Reconnect failed: {e}"
+                delay = min(delay * 2, self.RECONNECT_BACKOFF_MAX)
+        else:
+            return  # Stopped while reconnecting
+
+        self._rx_buffer.clear()  # Drop the partial line from the old connection
+        self._last_reconnect_duration = time.monotonic() - started
+        self._total_reconnect_duration += self._last_reconnect_duration
+        self._reconnect_count += 1
+        self.ser_error = None
+
+        # The hook may send commands and wait for responses, which needs the read thread running
+        threading.Thread(target=self._on_reconnect, daemon=True).start()
+
+    def _on_reconnect(self):
+        """Called after the port has been reopened. Subclasses restore controller state here."""
+        pass
+
+    def get_counters(self):
+        """
+        Transport counters, read without locking.
+
+        :return: Dict with "bytes_in", "bytes_out", "lines", "responses", "decode_failures",
+            "dropped_frames" (oversized lines, recorder drops and dispatch backlog drops), "write_queue_depth",
+            "pending_responses" and "reconnects"
+        """
+        recorder = self._recorder
+        dropped = self._dropped_lines + self._closed_workers_dropped
+        dropped += sum(worker.dropped for worker in list(self._dispatch_workers) + list(self._block_workers))
+        if recorder is not None:
+            dropped += recorder.dropped
+        return {
+            "bytes_in": self._bytes_in,
+            "bytes_out": self._bytes_out,
+            "lines": self._lines,
+            "responses": self._response_seq,
+            "decode_failures": self._decode_failures,
+            "dropped_frames": dropped,
+            "write_queue_depth": len(self._priority_write_queue) + len(self._write_queue),
+            "pending_responses": sum(len(waiters) for waiters in list(self._waiters.values())),
+            "reconnects": self._reconnect_count,
+        }
+
+    def get_reconnect_stats(self):
+        """
+        Reconnect metrics.
+
+        :return: Dict with "count", "last_duration" and "total_duration", durations in seconds
+        """
+        return {
+            "count": self._reconnect_count,
+            "last_duration": self._last_reconnect_duration,
+            "total_duration": self._total_reconnect_duration,
+        }
+
+    def _handle_rx_data(self, data):
+        """Append raw bytes to the receive buffer and hand every complete line to _handle_line."""
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.record(RX, time.monotonic_ns(), data)
+
+        awaiting = self._awaiting_first_byte
+        if awaiting:
+            now = time.monotonic()
+            while awaiting:
+                awaiting.popleft()[2] = now
+
+        self._bytes_in += len(data)
+        buffer = self._rx_buffer
+        buffer += data
+
+        start = 0
+        lines = 0
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                line = view[start:end]
+                lines += 1
+                try:
+                    self._handle_line(line)
+                finally:
+                    line.release()  # The buffer can't be resized while a view is alive
+                start = end + 1
+        self._lines += lines
+
+        if start:
+            del buffer[:start]  # Keep only the incomplete tail for the next read
+        if len(buffer) > self.MAX_LINE_SIZE:
+            buffer.clear()  # No newline in sight, drop the garbage instead of growing forever
+            self._dropped_lines += 1
+
+    def _handle_line(self, line):
+        if len(line) < 2:
+            return  # Blank line or a lone "\r", too short to be a JSON object
+
+        raw = line.tobytes()
+        command = self._extract_command(raw)
+        if command is None:
+            return  # Only store JSON entries with a "command" key
+
+        subscriptions = self._subscriptions.get(command, ())
+        wildcards = self._wildcard_subscriptions
+        if command in self._waiters or subscriptions or wildcards:
+            # Someone is blocked on or subscribed to this response, decode it right away
+            json_entry = self._decode_json(raw)
+            if json_entry is None or json_entry.get("command") != command:
+                return
+            self._store_response(command, json_entry)
+            self._resolve_waiter(json_entry)
+            for subscription in subscriptions + wildcards:
+                if subscription.matches(json_entry):
+                    subscription._worker.submit(subscription, json_entry)
+        else:
+            # Telemetry nobody is waiting for is indexed raw and only decoded if it is looked up
+            self._store_response(command, raw)
+
+    def _extract_command(self, raw):
+        """Cheaply pull the "command" value out of a raw line without decoding the JSON."""
+        key = raw.find(b'"command"')
+        if key < 0:
+            return None
+        key += len(b'"command"')
+        start = raw.find(b'"', key)
+        if start < 0 or raw[key:start].strip() != b":":
+            return None  # Not a string value
+        end = raw.find(b'"', start + 1)
+        if end <= start + 1:
+            return None
+
+        name = raw[start + 1:end]
+        command = self._command_names.get(name)
+        if command is None:
+            try:
+                command = name.decode('utf-8')
+            except UnicodeDecodeError:
+                return None
+            if len(self._command_names) < 256:
+                self._command_names[name] = command
+        return command
+
+    def _decode_json(self, raw):
+        try:
+            json_entry = self._json_loads(raw)
+        except ValueError:
+            # If it's not a valid JSON entry, just continue. Lookups decode lazily on other threads
+            with self._stats_lock:
+                self._decode_failures += 1
+            return None
+        return json_entry if isinstance(json_entry, dict) else None
+
+    def set_json_decoder(self, decoder):
+        """
+        Select the JSON decoder used for incoming lines.
+
+        :param decoder: A name from JSON_DECODERS ("json", or "orjson" when it is installed),
+            or any callable that takes bytes and returns the decoded object
+        """
+        if callable(decoder):
+            self._json_loads = decoder
+        elif decoder in JSON_DECODERS:
+            self._json_loads = JSON_DECODERS[decoder]
+        else:
+            raise ValueError(f"Unknown JSON decoder: {decoder}. Available: {', '.join(JSON_DECODERS)}")
+
+    def _store_response(self, command, entry):
+        now = time.monotonic()
+        inflight = self._inflight.get(command)
+        while inflight:
+            stats, sent_at, first_byte_at = inflight.popleft()
+            if now - sent_at <= self.INFLIGHT_TIMEOUT:
+                if first_byte_at is not None:
+                    stats.first_byte.record(first_byte_at - sent_at)
+                stats.response.record(now - sent_at)
+                break
+
+        with self._responses_cond:
+            self._response_seq += 1
+            self._responses[command] = IndexedResponse(self._response_seq, now, entry)
+            self._responses_cond.notify_all()
+
+    def _decoded_response(self, command_filter, indexed):
+        # Called with _responses_cond held. Decodes a raw index entry in place
+        if isinstance(indexed.entry, bytes):
+            json_entry = self._decode_json(indexed.entry)
+            if json_entry is None:
+                # Drop the bad line, so it is decoded and counted in decode_failures only once
+                del self._responses[command_filter]
+                return None
+            indexed = indexed._replace(entry=json_entry)
+            self._responses[command_filter] = indexed
+        return indexed
+
+    def get_response_seq(self):
+        """
+        Sequence number of the most recent JSON entry.
+
+        Pass it as newer_than to get_json_from_command to ignore responses that arrived before now.
+        """
+        return self._response_seq
+
+    def get_latest_response(self, command_filter):
+        """
+        Latest indexed response for a command name without waiting.
+
+        :return: IndexedResponse(seq, timestamp, entry) or None if nothing has arrived yet
+        """
+        with self._responses_cond:
+            indexed = self._responses.get(command_filter)
+            if indexed is None:
+                return None
+            return self._decoded_response(command_filter, indexed)
+
+    def get_json_from_command(self, command_filter=None, newer_than=None, timeout=None):
+        """
+        Return the latest JSON entry whose "command" is command_filter, waiting for it if needed.
+
+        :param command_filter: "command" value of the entry, e.g. "status"
+        :param newer_than: Only accept an entry with a sequence number greater than this
+        :param timeout: Seconds to wait for a matching entry, defaults to the policy deadline of
+            the command last sent for this response
+        :return: The JSON entry as a dict
+        """
         if command_filter is None:
             raise ValueError("command_filter cannot be None")
+        if timeout is None:
+            timeout = self.get_command_policy(self._response_commands.get(command_filter, command_filter)).deadline
 
-        for attempt in range(5):
-            if self.json_entries is None or len(self.json_entries) == 0:
-                time.sleep(0.1)
-                continue
+        deadline = time.monotonic() + timeout
+        with self._responses_cond:
+            while True:
+                indexed = self._responses.get(command_filter)
+                if indexed is not None and (newer_than is None or indexed.seq > newer_than):
+                    decoded = self._decoded_response(command_filter, indexed)
+                    if decoded is not None:
+                        indexed = decoded
+                        break
+                    newer_than = indexed.seq  # Undecodable line, wait for the next one
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._count_error(self._response_commands.get(command_filter, command_filter), timeout=True)
+                    raise Exception(f"Command {command_filter} not found in JSON entries after {timeout}s")
+                self._responses_cond.wait(remaining)
 
-            for entry in reversed(self.json_entries):
-                if entry.get("command") == command_filter:
-                    if entry.get("success") == "true":
-                        return entry
-                    raise Exception("Fail to fetch...")
-            time.sleep(0.1)
+        if indexed.entry.get("success") == "true":
+            return indexed.entry
+        self._count_error(self._response_commands.get(command_filter, command_filter), timeout=False)
+        raise Exception("Fail to fetch...")
+
+    def send_command_and_wait(self, command, command_filter, timeout=None, retries=None):
+        """
+        Send a command and block until its JSON response arrives.
+
+        The waiter is registered before the command is written, and the read thread
+        completes it as soon as an entry whose "command" is command_filter is parsed.
+
+        If no response arrives within the deadline, the command is resent up to retries
+        times, waiting the policy backoff (doubled each time) in between. A late response
+        to an earlier attempt still completes the call.
+
+        :param command: Raw command string to send, e.g. "PING"
+        :param command_filter: "command" value of the expected response, e.g. "ping"
+        :param timeout: Seconds to wait for each attempt, defaults to the command's policy deadline
+        :param retries: Times to resend after a timeout, defaults to the command's policy
+        :return: The JSON response as a dict
+        """
+        if command_filter is None:
+            raise ValueError("command_filter cannot be None")
+        name = self._command_name(command)
+        policy = self.get_command_policy(name)
+        if timeout is None:
+            timeout = policy.deadline
+        if retries is None:
+            retries = policy.retries
+
+        future = self._register_waiter(command_filter)
+        try:
+            self.send_raw_command(command)
+            try:
+                for attempt in range(retries + 1):
+                    if attempt:
+                        self.send_raw_command(command)
+                    try:
+                        return future.result(timeout=timeout)
+                    except TimeoutError:
+                        if attempt == retries:
+                            raise
+                    try:
+                        return future.result(timeout=policy.backoff * 2 ** attempt)
+                    except TimeoutError:
+                        pass
+            except TimeoutError:
+                self._count_error(name, timeout=True)
+                raise TimeoutError(f"No {command_filter} response to {command} after {retries + 1} x {timeout}s")
+            except ConnectionError:
+                raise  # Link lost, not an answer from the controller
+            except Exception:
+                self._count_error(name, timeout=False)
+                raise
+        finally:
+            self._discard_waiter(command_filter, future)
+
+    def send_command_batch(self, commands):
+        """
+        Send several commands in a single write and return one future per command.
+
+        All waiters are registered before anything is written. Responses are matched
+        by their "command" name in arrival order, so a batch such as
+        [("B_STATUS", "status"), ("B_POSE", "pose"), ("PING", "ping")] costs a single
+        round trip. Cancel a future you stop waiting for so it does not consume a
+        later response.
+
+        :param commands: Sequence of (command, command_filter) tuples
+        :return: List of concurrent.futures.Future, one per command, in the same order
+        """
+        commands = list(commands)
+        if any(command_filter is None for _, command_filter in commands):
+            raise ValueError("command_filter cannot be None")
+
+        futures = self._register_waiters([command_filter for _, command_filter in commands])
+        try:
+            self._write(b"".join(command.encode('utf-8') + b'\r\n' for command, _ in commands),
+                        [command for command, _ in commands])
+        except Exception:
+            for (_, command_filter), future in zip(commands, futures):
+                self._discard_waiter(command_filter, future)
+            raise
+        if commands:
+            self.state = commands[-1][0]
+        return futures
+
+    def send_commands_and_wait(self, commands, timeout=None):
+        """
+        Send a batch of commands with send_command_batch and wait for every response.
+
+        :param commands: Sequence of (command, command_filter) tuples
+        :param timeout: Seconds to wait for the whole batch, defaults to the longest policy deadline
+        :return: List of JSON responses in the same order as commands
+        """
+        commands = list(commands)
+        if timeout is None:
+            timeout = max((self.get_command_policy(command).deadline for command, _ in commands), default=self.RESPONSE_TIMEOUT)
+
+        futures = self.send_command_batch(commands)
+        deadline = time.monotonic() + timeout
+        try:
+            responses = []
+            for (command, command_filter), future in zip(commands, futures):
+                try:
+                    responses.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except TimeoutError:
+                    self._count_error(self._command_name(command), timeout=True)
+                    raise TimeoutError(f"No {command_filter} response to {command} after {timeout}s")
+                except ConnectionError:
+                    raise
+                except Exception:
+                    self._count_error(self._command_name(command), timeout=False)
+                    raise
+            return responses
+        finally:
+            for (_, command_filter), future in zip(commands, futures):
+                self._discard_waiter(command_filter, future)
+
+    def _register_waiter(self, command_filter):
+        return self._register_waiters([command_filter])[0]
+
+    def _register_waiters(self, command_filters):
+        futures = [Future() for _ in command_filters]
+        with self._waiters_lock:
+            for command_filter, future in zip(command_filters, futures):
+                self._waiters.setdefault(command_filter, deque()).append(future)
+        return futures
+
+    def _discard_waiter(self, command_filter, future):
+        with self._waiters_lock:
+            waiters = self._waiters.get(command_filter)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[command_filter]
+
+    def _resolve_waiter(self, json_entry):
+        command = json_entry.get("command")
+        future = None
+        with self._waiters_lock:
+            waiters = self._waiters.get(command)
+            if not waiters:
+                return
+            # Skip waiters that were cancelled after their caller gave up
+            while waiters and future is None:
+                candidate = waiters.popleft()
+                if candidate.set_running_or_notify_cancel():
+                    future = candidate
+            if not waiters:
+                del self._waiters[command]
+
+        if future is None:
+            return
+        if json_entry.get("success") == "true":
+            future.set_result(json_entry)
+        else:
+            future.set_exception(Exception(f"Fail to fetch {command}..."))
+
+    def subscribe(self, command=None, predicate=None, callback=None, queue_size=100, policy=DROP_OLDEST):
+        """
+        Subscribe to incoming JSON entries.
+
+        Entries are decoded on the read thread and handed to a dispatch worker, so slow
+        subscribers never delay serial reads or other responses.
+
+        :param command: Response "command" name to receive, e.g. "status". None for every command
+        :param predicate: Optional predicate(entry) -> bool, called on the read thread so keep it cheap
+        :param callback: Called with each entry on a dispatch worker. Without it, read entries with
+            get() or by iterating the subscription
+        :param queue_size: Entries waiting for the subscriber before the policy applies
+        :param policy: "drop_oldest" to drop the oldest waiting entry, "block" to wait for room. A "block"
+            subscription has its own dispatch worker, so one that stops reading only holds up itself
+        :return: The Subscription, close it to unsubscribe
+        """
+        if command is None and predicate is None:
+            raise ValueError("subscribe needs a command or a predicate")
+        subscription = Subscription(self, command, predicate, callback, queue_size, policy)
+        with self._subscriptions_lock:
+            if policy == BLOCK:
+                subscription._worker = DispatchWorker(f"hackerbot-dispatch-block-{self._next_worker}")
+                self._block_workers.append(subscription._worker)
+            else:
+                if not self._dispatch_workers:
+                    self._dispatch_workers = [DispatchWorker(f"hackerbot-dispatch-{i}") for i in range(self.DISPATCH_WORKERS)]
+                subscription._worker = self._dispatch_workers[self._next_worker % len(self._dispatch_workers)]
+            self._next_worker += 1
+            if command is None:
+                self._wildcard_subscriptions = self._wildcard_subscriptions + (subscription,)
+            else:
+                self._subscriptions = {**self._subscriptions, command: self._subscriptions.get(command, ()) + (subscription,)}
+        return subscription
+
+    def _remove_subscription(self, subscription):
+        with self._subscriptions_lock:
+            if subscription.command is None:
+                self._wildcard_subscriptions = tuple(s for s in self._wildcard_subscriptions if s is not subscription)
+            else:
+                subscriptions = self._subscriptions.copy()
+                remaining = tuple(s for s in subscriptions.get(subscription.command, ()) if s is not subscription)
+                if remaining:
+                    subscriptions[subscription.command] = remaining
+                else:
+                    subscriptions.pop(subscription.command, None)
+                self._subscriptions = subscriptions
+
+            worker = subscription._worker
+            if worker in self._block_workers:
+                self._block_workers.remove(worker)
+                self._closed_workers_dropped += worker.dropped
+                # Not joined, it may be waiting for the subscription to close or be the caller
+                worker.stop(wait=False)
+
+    def _close_subscriptions(self):
+        with self._subscriptions_lock:
+            subscriptions = [s for subs in self._subscriptions.values() for s in subs] + list(self._wildcard_subscriptions)
+            workers = self._dispatch_workers
+            self._dispatch_workers = []
+        for subscription in subscriptions:
+            subscription.close()
+        for worker in workers:
+            worker.stop()
+
+    def _fail_waiters(self, error):
+        with self._waiters_lock:
+            waiters = self._waiters
+            self._waiters = {}
+        for futures in waiters.values():
+            for future in futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(error)
 
-        raise Exception(f"Command {command_filter} not found in JSON entries after 5 retries")
-            
     def stop_read_thread(self):
         """Call this method to stop the serial reading thread."""
         self.read_thread_stop_event.set()
+        if self.ser and hasattr(self.ser, "cancel_read"):
+            self.ser.cancel_read()  # Wake up a read blocked on the port
         self.read_thread.join()  # Wait for the thread to fully terminate
 
+    def stop_write_thread(self):
+        """Call this method to stop the serial writing thread once queued commands are sent."""
+        self.write_thread_stop_event.set()
+        with self._write_cond:
+            self._write_cond.notify_all()
+        self.write_thread.join()
+
     def disconnect_serial(self):
         """Disconnect the serial port and stop the read thread cleanly."""
-        # Stop the reading thread first
+        # Stop the reading and writing threads first
         self.stop_read_thread()
+        self.stop_write_thread()
+        self.stop_recording()
+        self._fail_waiters(ConnectionError("Serial connection closed"))
+        self.stop_state_block()
+        self._close_subscriptions()
 
         # Close the serial connection safely
         if self.ser:
@@ -0,0 +1,162 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the SerialRecorder class, which captures raw serial
+# traffic into a compact append-only binary log, and read_recording to read
+# it back. Every record is a 13 byte header (direction, time.monotonic_ns()
+# timestamp, length) followed by the bytes as they went over the wire.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import struct
+import threading
+from collections import deque, namedtuple
+
+TX = 0 # Bytes written to the port
+RX = 1 # Bytes read from the port
+
+FILE_MAGIC = b"HBSERIAL\x01" # Start of every recording file, the last byte is the format version
+RECORD_HEADER = struct.Struct("<BQI") # direction, monotonic timestamp in ns, data length
+
+Frame = namedtuple("Frame", ["direction", "timestamp_ns", "data"])
+
+class SerialRecorder:
+    """
+    Records serial frames to a binary log from a background flusher thread.
+
+    record() only appends to an in-memory queue, so the reader and writer threads never
+    wait on the disk. When the file would grow past max_bytes it is rotated like a
+    logging.handlers.RotatingFileHandler: path -> path.1 -> path.2 ... up to backup_count.
+    """
+
+    FLUSH_INTERVAL = 0.2 # Seconds between flushes of queued frames to disk
+    MAX_PENDING = 100000 # Frames queued before new ones are dropped, if the disk can't keep up
+    MAX_BYTES = 64 * 1024 * 1024 # Default size cap of a single recording file
+    BACKUP_COUNT = 4 # Default number of rotated files kept next to the current one
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0 # Frames lost because the queue was full
+        self.written = 0 # Frames written to disk
+
+        self._pending = deque()
+        self._stop_event = threading.Event()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = self._open_file()
+
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+
+    def record(self, direction, timestamp_ns, data):
+        """Queue a frame. Safe to call from any thread, never touches the disk."""
+        if len(self._pending) >= self.MAX_PENDING:
+            self.dropped += 1
+            return
+        self._pending.append((direction, timestamp_ns, bytes(data)))
+
+    def close(self):
+        """Flush everything queued so far and close the file."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._flush_thread.join()
+        self._flush()
+        self._file.close()
+
+    def _open_file(self):
+        file = open(self.path, "ab")
+        if file.tell() == 0:
+            file.write(FILE_MAGIC)
+        return file
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.FLUSH_INTERVAL):
+            self._flush()
+
+    def _flush(self):
+        chunks = []
+        size = 0
+        while self._pending:
+            direction, timestamp_ns, data = self._pending.popleft()
+            record = RECORD_HEADER.pack(direction, timestamp_ns, len(data)) + data
+            if self._file.tell() + size + len(record) > self.max_bytes and self._file.tell() + size > len(FILE_MAGIC):
+                self._write(chunks)
+                chunks, size = [], 0
+                self._rotate()
+            chunks.append(record)
+            size += len(record)
+        self._write(chunks)
+
+    def _write(self, chunks):
+        if chunks:
+            self._file.write(b"".join(chunks))
+            self._file.flush()
+            self.written += len(chunks)
+
+    def _rotate(self):
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = self._open_file()
+
+
+def recording_files(path):
+    """
+    Files of a rotated recording, oldest first.
+
+    :param path: Path the recorder was started with
+    :return: List of existing paths, e.g. [path.2, path.1, path]
+    """
+    files = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        files.insert(0, f"{path}.{index}")
+        index += 1
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_recording(path):
+    """
+    Read the frames of a recording file.
+
+    A record cut short at the end of the file (e.g. after a crash) is ignored.
+
+    :param path: Recording file
+    :return: Generator of Frame(direction, timestamp_ns, data)
+    """
+    with open(path, "rb") as file:
+        if file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"Not a serial recording: {path}")
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            direction, timestamp_ns, length = RECORD_HEADER.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                return
+            yield Frame(direction, timestamp_ns, data)
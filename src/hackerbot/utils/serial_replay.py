@@ -0,0 +1,327 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the replay engine for recordings made with
+# SerialHelper.start_recording. SessionReplay exposes the recorded traffic as
+# a transport, so the real SerialHelper, HackerbotHelper, Core, Base and Maps
+# stack runs on it unchanged, e.g. Hackerbot(port=replay.transport).
+#
+# Usage: python -m hackerbot.utils.serial_replay RECORDING [--fast] [--speed X]
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import json
+import time
+import argparse
+import threading
+from collections import namedtuple
+from .serial_recorder import read_recording, recording_files, TX, RX
+from .subscriptions import BLOCK
+
+# A recorded RX frame and what has to happen before it is sent:
+# tx_bytes recorded TX bytes must have been written, then delay seconds pass
+_ReplayFrame = namedtuple("_ReplayFrame", ["tx_bytes", "delay", "data"])
+
+class ReplayTransport:
+    """
+    Transport that plays back the RX side of a recording.
+
+    With gate_on_tx, a received frame is only played once the client has written as many
+    bytes as had been sent before it in the recording, so responses follow the commands
+    that caused them. If the client never sends them, the frame is released after
+    GATE_TIMEOUT seconds and the stall is counted in gate_timeouts.
+
+    timing="original" keeps the recorded gaps (divided by speed), measured from the
+    command that preceded each frame, or from the first frame of the recording without
+    gate_on_tx. timing="fast" plays frames as soon as they are allowed.
+    """
+
+    GATE_TIMEOUT = 2.0 # Seconds a frame waits for the commands recorded before it
+
+    def __init__(self, frames, timing="original", speed=1.0, gate_on_tx=True, timeout=0.5):
+        if timing not in ("original", "fast"):
+            raise ValueError(f"Invalid timing: {timing}, expected 'original' or 'fast'")
+        if speed <= 0:
+            raise ValueError(f"Invalid speed: {speed}, expected a positive multiplier")
+        self.timing = timing
+        self.speed = speed
+        self.gate_on_tx = gate_on_tx
+        self.timeout = timeout
+        self.port = "replay://"
+        self.is_open = True
+
+        self.expected_tx = []  # Recorded TX frames
+        self.observed_tx = []  # Bytes written by the client
+        self.gate_timeouts = 0
+        self.first_rx_at = None  # time.monotonic() the first frame was handed to the client
+        self.finished_at = None  # time.monotonic() the last frame was handed to the client
+        self.finished = threading.Event()
+        self.on_attach = None  # Called with the SerialHelper opening this transport, see attach
+
+        self._frames = []
+        self._tx_thresholds = []  # Cumulative recorded TX bytes after each TX frame
+        tx_bytes = 0
+        anchor_ns = None
+        for frame in frames:
+            if anchor_ns is None:
+                anchor_ns = frame.timestamp_ns
+            if frame.direction == TX:
+                self.expected_tx.append(frame.data)
+                tx_bytes += len(frame.data)
+                self._tx_thresholds.append(tx_bytes)
+                if gate_on_tx:
+                    anchor_ns = frame.timestamp_ns  # Ungated frames all count from the first frame
+            elif frame.direction == RX:
+                delay = max(0, frame.timestamp_ns - anchor_ns) / 1e9 / speed
+                self._frames.append(_ReplayFrame(tx_bytes if gate_on_tx else 0, delay, frame.data))
+
+        self._cond = threading.Condition()
+        self._next = 0  # Index of the next frame to release
+        self._out = bytearray()  # Released bytes not read yet
+        self._cancelled = False
+        self._tx_seen = 0
+        self._threshold_index = 0
+        self._gate_times = {0: time.monotonic()}  # TX byte count -> time.monotonic() it was reached
+        self._gate_wait_since = None
+        if not self._frames:
+            self.finished_at = time.monotonic()
+            self.finished.set()
+
+    @property
+    def in_waiting(self):
+        with self._cond:
+            self._release_due(time.monotonic())
+            return len(self._out)
+
+    def read(self, size=1):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if not self.is_open:
+                    raise ConnectionError("Transport is closed")
+                now = time.monotonic()
+                wake_at = self._release_due(now)
+                if self._out:
+                    data = bytes(self._out[:max(1, size)])
+                    del self._out[:len(data)]
+                    if not self._out and self._next == len(self._frames) and not self.finished.is_set():
+                        self.finished_at = now
+                        self.finished.set()
+                    return data
+                if self._cancelled:
+                    self._cancelled = False
+                    return b""
+                if deadline is not None:
+                    if now >= deadline:
+                        return b""
+                    wake_at = deadline if wake_at is None else min(wake_at, deadline)
+                self._cond.wait(None if wake_at is None else wake_at - now)
+
+    def write(self, data):
+        if not self.is_open:
+            raise ConnectionError("Transport is closed")
+        with self._cond:
+            now = time.monotonic()
+            self.observed_tx.append(bytes(data))
+            self._tx_seen += len(data)
+            while self._threshold_index < len(self._tx_thresholds) and self._tx_thresholds[self._threshold_index] <= self._tx_seen:
+                self._gate_times.setdefault(self._tx_thresholds[self._threshold_index], now)
+                self._threshold_index += 1
+            self._cond.notify_all()
+        return len(data)
+
+    def attach(self, helper):
+        """Called by SerialHelper with itself before it starts reading, so no replayed line is missed."""
+        if self.on_attach is not None:
+            self.on_attach(helper)
+
+    def cancel_read(self):
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self.is_open = False
+            self._cond.notify_all()
+
+    def _release_due(self, now):
+        # Called with _cond held. Moves due frames to _out, returns when the next one is due or None
+        while self._next < len(self._frames):
+            frame = self._frames[self._next]
+            gate_time = self._gate_times.get(frame.tx_bytes)
+            if gate_time is None:
+                if self._gate_wait_since is None:
+                    self._gate_wait_since = now
+                if now - self._gate_wait_since < self.GATE_TIMEOUT:
+                    return self._gate_wait_since + self.GATE_TIMEOUT
+                self.gate_timeouts += 1
+                gate_time = self._gate_times[frame.tx_bytes] = now
+            self._gate_wait_since = None
+
+            release_at = gate_time + frame.delay if self.timing == "original" else gate_time
+            if now < release_at:
+                return release_at
+            if self.first_rx_at is None:
+                self.first_rx_at = now
+            self._out += frame.data
+            self._next += 1
+        return None
+
+
+class SessionReplay:
+    """
+    Replays a recording through a SerialHelper (or Hackerbot) and reports on the run.
+
+    Usage:
+        replay = SessionReplay(SerialHelper.LOG_FILE_PATH, timing="fast")
+        bot = Hackerbot(port=replay.transport)
+        ... issue the same calls as during the recording ...
+        report = replay.report(bot)
+    """
+
+    def __init__(self, recording, timing="original", speed=1.0, gate_on_tx=True):
+        """
+        Args:
+            recording: Path given to start_recording (rotated files are included) or an iterable of Frames.
+            timing (str): "original" to keep the recorded gaps, "fast" to play as fast as possible.
+            speed (float): Playback speed multiplier for "original" timing, must be positive.
+            gate_on_tx (bool): Hold responses until the client sends the commands recorded before them.
+        """
+        if isinstance(recording, str):
+            frames = [frame for path in recording_files(recording) for frame in read_recording(path)]
+        else:
+            frames = list(recording)
+        self.transport = ReplayTransport(frames, timing, speed, gate_on_tx)
+        self.transport.on_attach = self._observe
+
+        rx_data = b"".join(frame.data for frame in frames if frame.direction == RX)
+        self.rx_bytes = len(rx_data)
+        self.rx_lines = 0
+        self.expected_responses = []  # Recorded JSON responses with a "command" key, in order
+        for line in rx_data.split(b"\n"):
+            line = line.strip()
+            if not line:
+                continue
+            self.rx_lines += 1
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and entry.get("command"):
+                self.expected_responses.append(entry)
+
+        self.observed_responses = []  # JSON responses the helper parsed during the replay, in order
+        self._observed_lock = threading.Lock()
+
+    def _observe(self, helper):
+        # Every decoded entry, on a "block" subscription so none is dropped while the helper is busy
+        helper.subscribe(predicate=lambda entry: True, callback=self._record_response,
+                         queue_size=max(100, len(self.expected_responses)), policy=BLOCK)
+
+    def _record_response(self, entry):
+        with self._observed_lock:
+            self.observed_responses.append(entry)
+
+    def wait(self, timeout=None):
+        """
+        Wait until all recorded frames were handed to the client.
+
+        :param timeout: Seconds to wait, None to wait forever
+        :return: True if the replay finished
+        """
+        return self.transport.finished.wait(timeout)
+
+    def report(self, helper, settle=0.5):
+        """
+        Compare what the helper observed with the recording.
+
+        The helper must have been created on this replay's transport, so it records every
+        response it parses from the start of the replay.
+
+        :param helper: SerialHelper running on self.transport
+        :param settle: Seconds to wait for the helper to parse the last frames
+        :return: Dict with throughput figures and the lists of divergences
+        """
+        deadline = time.monotonic() + settle
+        while len(self.observed_responses) < len(self.expected_responses) and time.monotonic() < deadline:
+            time.sleep(0.001)
+        parsed = helper.get_response_seq()
+
+        transport = self.transport
+        elapsed = None
+        if transport.first_rx_at is not None and transport.finished_at is not None:
+            elapsed = max(transport.finished_at - transport.first_rx_at, 1e-9)
+
+        return {
+            "finished": transport.finished.is_set(),
+            "elapsed": elapsed,
+            "rx_bytes": self.rx_bytes,
+            "rx_lines": self.rx_lines,
+            "responses_expected": len(self.expected_responses),
+            "responses_parsed": parsed,
+            "lines_per_second": self.rx_lines / elapsed if elapsed else None,
+            "bytes_per_second": self.rx_bytes / elapsed if elapsed else None,
+            "gate_timeouts": transport.gate_timeouts,
+            "tx_divergences": self._tx_divergences(),
+            "response_divergences": self._response_divergences(),
+        }
+
+    def _tx_divergences(self):
+        # Writes may be merged differently than during the recording, so compare command lines
+        expected = b"".join(self.transport.expected_tx).splitlines()
+        observed = b"".join(self.transport.observed_tx).splitlines()
+        divergences = []
+        for index in range(max(len(expected), len(observed))):
+            expected_line = expected[index].decode("utf-8", "replace") if index < len(expected) else None
+            observed_line = observed[index].decode("utf-8", "replace") if index < len(observed) else None
+            if expected_line != observed_line:
+                divergences.append({"index": index, "expected": expected_line, "observed": observed_line})
+        return divergences
+
+    def _response_divergences(self):
+        # Every response in order, so a changed or missing entry shows even if a later one matches
+        expected = self.expected_responses
+        with self._observed_lock:
+            observed = list(self.observed_responses)
+        divergences = []
+        for index in range(max(len(expected), len(observed))):
+            expected_entry = expected[index] if index < len(expected) else None
+            observed_entry = observed[index] if index < len(observed) else None
+            if expected_entry != observed_entry:
+                divergences.append({"index": index, "expected": expected_entry, "observed": observed_entry})
+        return divergences
+
+
+def main():
+    from .serial_helper import SerialHelper
+
+    parser = argparse.ArgumentParser(description="Replay a serial recording through SerialHelper and report decode throughput.")
+    parser.add_argument("recording", help="Recording file written by SerialHelper.start_recording")
+    parser.add_argument("--fast", action="store_true", help="Play as fast as possible instead of at the original timing")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed multiplier for the original timing")
+    args = parser.parse_args()
+
+    # Nothing re-sends the recorded commands here, so play the received side ungated
+    replay = SessionReplay(args.recording, "fast" if args.fast else "original", args.speed, gate_on_tx=False)
+    helper = SerialHelper(port=replay.transport)
+    replay.wait()
+    report = replay.report(helper)
+    helper.disconnect_serial()
+
+    report.pop("tx_divergences")  # No commands were sent
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the shared-memory state block. The process owning the
+# connection publishes the latest status, pose and attached components into a
+# fixed-layout memory-mapped file (SerialHelper.start_state_block), and other
+# local processes read a consistent snapshot with StateBlockReader without any
+# serial or socket round trip.
+#
+# The block is guarded by a seqlock: the writer makes the sequence number odd,
+# writes the payload and its CRC-32 and makes it even again. A reader copies the
+# payload and retries if the sequence number was odd or changed meanwhile, or if
+# the copy does not match the checksum. Python gives no memory barriers, so on
+# weakly ordered CPUs (e.g. the ARM of a Raspberry Pi) a reader can see the
+# sequence number before the payload stores, the checksum catches those copies.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import mmap
+import math
+import time
+import zlib
+import struct
+import tempfile
+import threading
+
+if os.path.isdir("/dev/shm"):
+    STATE_BLOCK_PATH = "/dev/shm/hackerbot_state"
+else:
+    STATE_BLOCK_PATH = os.path.join(tempfile.gettempdir(), "hackerbot_state")
+
+MAGIC = b"HBSTATE\x02"
+HEADER = struct.Struct("<8sQI4x")  # magic, sequence number, CRC-32 of the payload
+_SEQ_OFFSET = 8
+_CHECKSUM_OFFSET = 16
+
+STATUS_FIELDS = ("timestamp", "left_encoder", "right_encoder", "left_speed", "right_speed",
+                 "left_set_speed", "right_set_speed", "wall_tof")
+POSE_FIELDS = ("map_id", "x", "y", "angle")
+COMPONENTS = ("main_controller", "temperature_sensor", "left_tof", "right_tof",
+              "audio_mouth_eyes", "dynamixel_controller", "arm_controller")
+
+# Each section starts with the time.time() it was last updated, 0.0 if never.
+# Missing values are NaN, components are a bitmask in COMPONENTS order
+PAYLOAD = struct.Struct(f"<d{len(STATUS_FIELDS)}d" f"d{len(POSE_FIELDS)}d" "dQ")
+BLOCK_SIZE = HEADER.size + PAYLOAD.size
+
+_STATUS = slice(0, 1 + len(STATUS_FIELDS))
+_POSE = slice(_STATUS.stop, _STATUS.stop + 1 + len(POSE_FIELDS))
+_COMPONENTS = slice(_POSE.stop, _POSE.stop + 2)
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class StateBlockWriter:
+    """Single writer of a state block. Safe to call from several threads of the owning process."""
+
+    def __init__(self, path=STATE_BLOCK_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._values = [0.0] + [math.nan] * len(STATUS_FIELDS) + [0.0] + [math.nan] * len(POSE_FIELDS) + [0.0, 0]
+        self._seq = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, BLOCK_SIZE)
+            self._mm = mmap.mmap(fd, BLOCK_SIZE)
+        finally:
+            os.close(fd)
+        payload = PAYLOAD.pack(*self._values)
+        self._mm[HEADER.size:BLOCK_SIZE] = payload
+        HEADER.pack_into(self._mm, 0, MAGIC, self._seq, zlib.crc32(payload))
+
+    def update_status(self, entry):
+        """Publish a status response, e.g. {"command": "status", "left_encoder": 10, ...}."""
+        self._update(_STATUS, [time.time()] + [_number(entry.get(field)) for field in STATUS_FIELDS])
+
+    def update_pose(self, entry):
+        """Publish a pose response, e.g. {"command": "pose", "map_id": 1, "pose_x": 0.5, ...}."""
+        self._update(_POSE, [time.time(), _number(entry.get("map_id")), _number(entry.get("pose_x")),
+                             _number(entry.get("pose_y")), _number(entry.get("pose_angle"))])
+
+    def update_components(self, entry):
+        """Publish a ping response, e.g. {"command": "ping", "left_tof": "attached", ...}."""
+        mask = 0
+        for bit, component in enumerate(COMPONENTS):
+            if entry.get(component) == "attached":
+                mask |= 1 << bit
+        self._update(_COMPONENTS, [time.time(), mask])
+
+    def _update(self, section, values):
+        with self._lock:
+            if self._mm is None:
+                return
+            self._values[section] = values
+            payload = PAYLOAD.pack(*self._values)
+            self._seq += 1  # Odd: readers retry
+            struct.pack_into("<Q", self._mm, _SEQ_OFFSET, self._seq)
+            self._mm[HEADER.size:BLOCK_SIZE] = payload
+            struct.pack_into("<I", self._mm, _CHECKSUM_OFFSET, zlib.crc32(payload))
+            self._seq += 1
+            struct.pack_into("<Q", self._mm, _SEQ_OFFSET, self._seq)
+
+    def close(self, unlink=True):
+        """Unmap the block and by default remove the file, so readers stop seeing stale state."""
+        with self._lock:
+            if self._mm is None:
+                return
+            self._mm.close()
+            self._mm = None
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class StateBlockReader:
+    """
+    Reader of a state block published by another process.
+
+        with StateBlockReader() as state:
+            snapshot = state.read()
+            snapshot["status"]["left_speed"], snapshot["pose"]["x"], snapshot["components"]["arm_controller"]
+    """
+
+    MAX_SPINS = 1000 # Inconsistent copies before read() starts yielding to the writer
+
+    def __init__(self, path=STATE_BLOCK_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), BLOCK_SIZE, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a Hackerbot state block")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def read_raw(self):
+        """
+        Consistent copy of the payload.
+
+        :return: (sequence number, tuple of PAYLOAD values)
+        """
+        mm = self._mm
+        spins = 0
+        while True:
+            seq = struct.unpack_from("<Q", mm, _SEQ_OFFSET)[0]
+            if not seq & 1:
+                checksum = struct.unpack_from("<I", mm, _CHECKSUM_OFFSET)[0]
+                payload = mm[HEADER.size:BLOCK_SIZE]
+                if struct.unpack_from("<Q", mm, _SEQ_OFFSET)[0] == seq and zlib.crc32(payload) == checksum:
+                    return seq, PAYLOAD.unpack(payload)
+            spins += 1
+            if spins >= self.MAX_SPINS:
+                time.sleep(0)  # The writer may be descheduled mid-update, let it finish
+
+    def read(self):
+        """
+        Consistent snapshot of the latest published state.
+
+        :return: Dict with "seq", "status", "pose" and "components". A section is None until it is
+            first published, otherwise a dict of its fields plus "updated" (time.time() of the update)
+        """
+        seq, values = self.read_raw()
+        status, pose, components = values[_STATUS], values[_POSE], values[_COMPONENTS]
+        snapshot = {"seq": seq, "status": None, "pose": None, "components": None}
+        if status[0]:
+            snapshot["status"] = dict(zip(STATUS_FIELDS, status[1:]), updated=status[0])
+        if pose[0]:
+            snapshot["pose"] = dict(zip(POSE_FIELDS, pose[1:]), updated=pose[0])
+            if not math.isnan(pose[1]):
+                snapshot["pose"]["map_id"] = int(pose[1])
+        if components[0]:
+            mask = components[1]
+            snapshot["components"] = {component: bool(mask >> bit & 1) for bit, component in enumerate(COMPONENTS)}
+            snapshot["components"]["updated"] = components[0]
+        return snapshot
+
+    def close(self):
+        self._mm.close()
@@ -0,0 +1,187 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the Subscription class returned by
+# SerialHelper.subscribe, and the dispatch workers that deliver controller
+# messages to subscribers. The read thread only appends to a worker's inbox,
+# so a slow subscriber never stalls serial ingestion.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import threading
+from collections import deque
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+class Subscription:
+    """
+    A subscription to incoming JSON entries.
+
+    With a callback, entries are passed to callback(entry) on a dispatch worker thread.
+    Without one, they are queued for get() or iteration. At most queue_size entries wait
+    for the subscriber. When it falls behind, policy decides what happens:
+
+    - "drop_oldest": the oldest waiting entry is dropped and counted in dropped
+    - "block": the dispatch worker waits for room. SerialHelper gives every "block"
+      subscription its own worker, so only the subscription itself is held up
+    """
+
+    def __init__(self, owner, command=None, predicate=None, callback=None, queue_size=100, policy=DROP_OLDEST):
+        if policy not in (DROP_OLDEST, BLOCK):
+            raise ValueError(f"Invalid policy: {policy}, expected '{DROP_OLDEST}' or '{BLOCK}'")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.command = command
+        self.predicate = predicate
+        self.callback = callback
+        self.queue_size = queue_size
+        self.policy = policy
+        self.dropped = 0 # Entries dropped because the subscriber fell behind
+        self.errors = 0 # Exceptions raised by the callback or predicate
+        self.last_error = None
+        self.closed = False
+
+        self._owner = owner
+        self._worker = None
+        self._pending = 0 # Entries in the worker inbox, guarded by the worker's lock
+        self._skip = 0 # Oldest inbox entries to drop instead of delivering, guarded by the worker's lock
+        self._queue = deque()
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            entry = self.get()
+            if entry is None:
+                return
+            yield entry
+
+    def matches(self, json_entry):
+        if self.predicate is None:
+            return True
+        try:
+            return bool(self.predicate(json_entry))
+        except Exception as e:
+            self.errors += 1
+            self.last_error = e
+            return False
+
+    def get(self, timeout=None):
+        """
+        Next queued entry, for subscriptions without a callback.
+
+        :param timeout: Seconds to wait, None to wait until an entry arrives or the subscription is closed
+        :return: The JSON entry, or None once the subscription is closed and drained
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._queue or self.closed, timeout):
+                raise TimeoutError(f"No entry received after {timeout}s")
+            if not self._queue:
+                return None
+            entry = self._queue.popleft()
+            self._cond.notify_all()  # Room for a blocked dispatch worker
+            return entry
+
+    def close(self):
+        """Stop receiving entries. Queued entries can still be read with get()."""
+        if self.closed:
+            return
+        self._owner._remove_subscription(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def _deliver(self, entry):
+        # Dispatch worker
+        if self.closed:
+            return
+        if self.callback is not None:
+            try:
+                self.callback(entry)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+            return
+        with self._cond:
+            if len(self._queue) >= self.queue_size:
+                if self.policy == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    self._cond.wait_for(lambda: len(self._queue) < self.queue_size or self.closed)
+                    if self.closed:
+                        return
+            self._queue.append(entry)
+            self._cond.notify_all()
+
+
+class DispatchWorker:
+    """Thread delivering entries to the subscriptions pinned to it, in arrival order."""
+
+    MAX_BACKLOG = 10000 # Entries waiting in the inbox before the oldest are dropped
+
+    def __init__(self, name):
+        self.dropped = 0
+        self._inbox = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, subscription, entry):
+        """Queue an entry for a subscription. Called by the read thread, never blocks."""
+        with self._cond:
+            if (subscription.callback is not None and subscription.policy == DROP_OLDEST
+                    and subscription._pending - subscription._skip >= subscription.queue_size):
+                subscription._skip += 1  # Its oldest pending entry is dropped when it comes up
+                subscription.dropped += 1
+            if len(self._inbox) >= self.MAX_BACKLOG:
+                oldest, _ = self._inbox.popleft()
+                oldest._pending -= 1
+                if oldest._skip:
+                    oldest._skip -= 1  # Already counted as dropped
+                else:
+                    oldest.dropped += 1
+                self.dropped += 1
+            subscription._pending += 1
+            self._inbox.append((subscription, entry))
+            self._cond.notify()
+
+    def stop(self, wait=True):
+        """Stop the thread. With wait=False it exits on its own once the current delivery returns."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if wait:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._inbox and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                subscription, entry = self._inbox.popleft()
+                subscription._pending -= 1
+                skip = subscription._skip > 0
+                if skip:
+                    subscription._skip -= 1
+            if not skip:
+                subscription._deliver(entry)
@@ -0,0 +1,153 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the transports SerialHelper can run on. A transport is
+# anything with the small part of the serial.Serial interface SerialHelper uses:
+# is_open, in_waiting, read(size), write(data), cancel_read() and close().
+# Serial ports and pty devices use serial.Serial directly, TCP serial bridges
+# and Unix sockets use the socket transports below.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import sys
+import select
+import socket
+import serial
+
+try:
+    import fcntl
+    import termios
+except ImportError:  # Not available on Windows, in_waiting then reports 0
+    fcntl = None
+    termios = None
+
+
+def open_transport(port, baudrate, timeout):
+    """
+    Open the transport for a port string.
+
+    - "tcp://host:port" connects to a TCP serial bridge (e.g. ser2net)
+    - "unix:///path/to/socket" connects to a Unix stream socket
+    - Other pyserial URLs such as "rfc2217://host:port" go through serial.serial_for_url
+    - Anything else is a device path, e.g. "/dev/ttyACM0" or a pty like "/dev/pts/3"
+
+    A port that is already a transport object (e.g. a serial_replay.ReplayTransport) is used as is.
+
+    :param port: Port string or transport
+    :param baudrate: Baud rate, only used by serial ports
+    :param timeout: Seconds a read waits for data before returning b""
+    :return: An open transport
+    """
+    if not isinstance(port, str):
+        return port
+    if port.startswith("tcp://"):
+        host, _, tcp_port = port[len("tcp://"):].rpartition(":")
+        if not host or not tcp_port.isdigit():
+            raise ValueError(f"Invalid TCP port: {port}, expected tcp://host:port")
+        return TcpTransport(host.strip("[]"), int(tcp_port), timeout)
+    if port.startswith("unix://"):
+        return UnixSocketTransport(port[len("unix://"):], timeout)
+    if "://" in port:
+        return serial.serial_for_url(port, baudrate=baudrate, timeout=timeout)
+    return serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
+
+
+class SocketTransport:
+    """
+    Transport over a connected stream socket.
+
+    read() blocks until data arrives, the timeout expires or cancel_read() is called,
+    and raises ConnectionError once the other end has closed the connection.
+    """
+
+    def __init__(self, sock, timeout):
+        self.timeout = timeout
+        self._sock = sock
+        self._sock.setblocking(True)
+        self._sock.settimeout(None)
+        self._abort_read, self._abort_read_w = os.pipe()
+        self.is_open = True
+
+    def fileno(self):
+        return self._sock.fileno()
+
+    @property
+    def in_waiting(self):
+        if not self.is_open or fcntl is None:
+            return 0
+        buf = bytearray(4)
+        fcntl.ioctl(self._sock.fileno(), termios.FIONREAD, buf)
+        return int.from_bytes(buf, sys.byteorder)
+
+    def read(self, size=1):
+        if not self.is_open:
+            raise ConnectionError("Transport is closed")
+        ready, _, _ = select.select([self._sock, self._abort_read], [], [], self.timeout)
+        if self._abort_read in ready:
+            os.read(self._abort_read, 1024)
+            return b""
+        if not ready:
+            return b""
+        data = self._sock.recv(max(1, size))
+        if not data:
+            raise ConnectionError("Connection closed by the remote end")
+        return data
+
+    def write(self, data):
+        if not self.is_open:
+            raise ConnectionError("Transport is closed")
+        self._sock.sendall(data)
+        return len(data)
+
+    def cancel_read(self):
+        if self.is_open:
+            os.write(self._abort_read_w, b"x")
+
+    def close(self):
+        if not self.is_open:
+            return
+        self.is_open = False
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # Already disconnected
+        self._sock.close()
+        os.close(self._abort_read)
+        os.close(self._abort_read_w)
+
+
+class TcpTransport(SocketTransport):
+    """Transport to a TCP serial bridge, e.g. ser2net or socat on the robot."""
+
+    CONNECT_TIMEOUT = 5.0
+
+    def __init__(self, host, port, timeout):
+        sock = socket.create_connection((host, port), timeout=self.CONNECT_TIMEOUT)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Commands are tiny, don't batch them
+        super().__init__(sock, timeout)
+        self.port = f"tcp://{host}:{port}"
+
+
+class UnixSocketTransport(SocketTransport):
+    """Transport to a Unix stream socket on the same machine."""
+
+    def __init__(self, path, timeout):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            raise
+        super().__init__(sock, timeout)
+        self.port = f"unix://{path}"
@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.05.13
+# Updated:    2026.10.18
 #
 # This module contains the TTSHelper class that gets or downloads a Piper voice 
 # model from HuggingFace
@@ -22,8 +22,18 @@
 
 
 import os
-from huggingface_hub import hf_hub_url
-import requests
+from .lazy_import import lazy_import
+
+# Only imported when a model has to be downloaded
+_LAZY_IMPORTS = {
+    "hf_hub_url": ("huggingface_hub", "hf_hub_url"),
+    "requests": ("requests", None),
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return lazy_import(globals(), _LAZY_IMPORTS, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class TTSHelper:
     """
@@ -77,6 +87,7 @@ class TTSHelper:
         filename_onnx = f"{voice}.onnx"
         filename_json = f"{voice}.onnx.json"
 
+        hf_hub_url = lazy_import(globals(), _LAZY_IMPORTS, "hf_hub_url")
         url_onnx = hf_hub_url(repo_id="rhasspy/piper-voices", filename=f"{base_path}/{filename_onnx}")
         url_json = hf_hub_url(repo_id="rhasspy/piper-voices", filename=f"{base_path}/{filename_json}")
 
@@ -92,6 +103,7 @@ class TTSHelper:
 
     def _download_file(self, url: str, dest_path: str):
         try:
+            requests = lazy_import(globals(), _LAZY_IMPORTS, "requests")
             response = requests.get(url, stream=True)
             response.raise_for_status()
             with open(dest_path, 'wb') as f:
@@ -0,0 +1,70 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains a cold-start benchmark for Hackerbot. It times the
+# constructor against the emulator on a pty, with the pipelined, lazy startup
+# and with the previous sequential startup that built every subsystem.
+#
+# Usage: python tests/benchmarks/bench_cold_start.py [runs] [latency_ms]
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import sys
+import time
+import statistics
+from hackerbot import Hackerbot
+from hackerbot.core import Core
+from hackerbot.base import Base
+from hackerbot.head import Head
+from hackerbot.arm import Arm
+from hackerbot.utils.hackerbot_helper import HackerbotHelper
+from hackerbot.utils.emulator import HackerbotEmulator
+
+
+class SequentialHackerbot(Hackerbot):
+    """Hackerbot with the previous startup, kept for comparison: one round trip per step, every subsystem built."""
+
+    def __init__(self, port=None):
+        HackerbotHelper.__init__(self, port)
+        self.core = Core(controller=self)
+        self.base = Base(controller=self)
+        self._head = Head(controller=self)
+        self._arm = Arm(controller=self)
+
+    def _handshake(self):
+        self.set_json_mode(True)
+
+
+def run(bot_cls, emulator, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        bot = bot_cls(port=emulator.port)
+        times.append(time.perf_counter() - start)
+        bot.disconnect_serial()
+    return times
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.005
+    with HackerbotEmulator(latency=latency) as emulator:
+        print(f"{runs} cold starts, {latency * 1000:.1f} ms controller latency")
+        for name, bot_cls in (("sequential", SequentialHackerbot), ("pipelined", Hackerbot)):
+            times = run(bot_cls, emulator, runs)
+            print(f"{name:>10}: median {1000 * statistics.median(times):7.2f} ms, "
+                  f"min {1000 * min(times):7.2f} ms, max {1000 * max(times):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
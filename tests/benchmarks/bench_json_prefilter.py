@@ -0,0 +1,89 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains a parse-rate benchmark for the SerialHelper line handler.
+# It compares decoding every line against the "command" key prefilter, with the
+# standard library decoder and with orjson when it is installed.
+#
+# Usage: python tests/benchmarks/bench_json_prefilter.py [lines]
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import sys
+import json
+import time
+import tty
+from hackerbot.utils.serial_helper import SerialHelper, JSON_DECODERS
+
+
+class FullDecodeSerialHelper(SerialHelper):
+    """SerialHelper decoding every line before looking at its "command" key."""
+
+    def _handle_line(self, line):
+        if len(line) < 2:
+            return
+        json_entry = self._decode_json(line.tobytes())
+        if json_entry is not None and json_entry.get("command"):
+            self._store_response(json_entry["command"], json_entry)
+            self._resolve_waiter(json_entry)
+
+
+def telemetry(lines):
+    chunks = []
+    for i in range(lines):
+        if i % 20 == 0:
+            entry = {"command": "ping", "success": "true", "main_controller": "attached"}
+        else:
+            entry = {
+                "command": "status", "success": "true", "timestamp": i,
+                "left_encoder": i * 3, "right_encoder": i * 3 + 1,
+                "left_speed": 120.5, "right_speed": 119.25,
+                "left_set_speed": 120, "right_set_speed": 120, "wall_tof": 431,
+            }
+        chunks.append(json.dumps(entry).encode() + b"\r\n")
+    return b"".join(chunks)
+
+
+def run(helper_cls, decoder, payload, chunk_size=4096):
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(slave_fd)
+    helper = helper_cls(port=os.ttyname(slave_fd))
+    helper.stop_read_thread()
+    helper.set_json_decoder(decoder)
+    helper._waiters["ping"] = []  # Pretend a caller is waiting on ping, so those lines are decoded
+
+    start = time.perf_counter()
+    for offset in range(0, len(payload), chunk_size):
+        helper._handle_rx_data(payload[offset:offset + chunk_size])
+    elapsed = time.perf_counter() - start
+
+    helper._waiters.clear()
+    helper.disconnect_serial()
+    os.close(master_fd)
+    os.close(slave_fd)
+    return elapsed
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    payload = telemetry(lines)
+    print(f"{lines} lines ({len(payload)} bytes), 1 in 20 has a waiter")
+    for decoder in JSON_DECODERS:
+        for name, helper_cls in (("full decode", FullDecodeSerialHelper), ("prefilter", SerialHelper)):
+            elapsed = run(helper_cls, decoder, payload)
+            print(f"{decoder:>7} {name:>11}: {lines / elapsed:10.0f} lines/s {len(payload) / elapsed:12.0f} bytes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains a CPU usage benchmark for the SerialHelper reader thread.
+# It compares the blocking reader against the previous in_waiting polling loop
+# using a pty-backed fake port, so no robot is needed.
+#
+# Usage: python tests/benchmarks/bench_read_serial.py [seconds]
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import sys
+import json
+import time
+import tty
+import threading
+from hackerbot.utils.serial_helper import SerialHelper
+
+
+class PollingSerialHelper(SerialHelper):
+    """SerialHelper with the previous busy-wait read loop, kept for comparison."""
+
+    def read_serial(self):
+        while not self.read_thread_stop_event.is_set():
+            try:
+                if self.ser.in_waiting > 0:
+                    response = self.ser.readline().decode('utf-8').strip()
+                    if response:
+                        try:
+                            json_entry = json.loads(response)
+                            if json_entry.get("command"):
+                                self._store_response(json_entry["command"], json_entry)
+                        except json.JSONDecodeError:
+                            continue
+            except Exception as e:
+                self.ser_error = f"Unexpected read error: {e}"
+
+
+def open_fake_port():
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(slave_fd)
+    return master_fd, slave_fd, os.ttyname(slave_fd)
+
+
+def run(helper_cls, duration, line_interval=0.05):
+    master_fd, slave_fd, port = open_fake_port()
+    helper = helper_cls(port=port)
+    stop = threading.Event()
+    line = json.dumps({"command": "status", "success": "true", "left_encoder": 0}).encode() + b"\r\n"
+
+    def feed():
+        while not stop.wait(line_interval):
+            os.write(master_fd, line)
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    time.sleep(0.2)  # Let the reader settle
+
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    time.sleep(duration)
+    cpu = time.process_time() - cpu_start
+    wall = time.monotonic() - wall_start
+
+    stop.set()
+    feeder.join()
+    helper.disconnect_serial()
+    os.close(master_fd)
+    os.close(slave_fd)
+    return cpu, wall
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    for name, helper_cls in (("polling", PollingSerialHelper), ("blocking", SerialHelper)):
+        cpu, wall = run(helper_cls, duration)
+        print(f"{name:>8}: {cpu:6.3f}s CPU over {wall:5.2f}s wall ({100.0 * cpu / wall:5.1f}% of one core)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains a receive throughput benchmark for the SerialHelper reader.
+# It streams status telemetry through a pty-backed fake port as fast as the pty
+# allows and reports parsed lines/s and bytes/s for the bulk buffered reader and
+# for a readline-per-line reader.
+#
+# Usage: python tests/benchmarks/bench_rx_throughput.py [lines]
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import sys
+import json
+import time
+import tty
+import threading
+from hackerbot.utils.serial_helper import SerialHelper
+
+BAUD_BYTES_PER_SECOND = 230400 // 10  # 8N1 framing, 10 bits on the wire per byte
+
+
+class ReadlineSerialHelper(SerialHelper):
+    """SerialHelper reading one line per readline() call, decoded to str and stripped."""
+
+    def read_serial(self):
+        while not self.read_thread_stop_event.is_set():
+            try:
+                response = self.ser.readline().decode('utf-8').strip()
+                if response:
+                    try:
+                        json_entry = json.loads(response)
+                        if json_entry.get("command"):
+                            self._store_response(json_entry["command"], json_entry)
+                    except json.JSONDecodeError:
+                        continue
+            except Exception as e:
+                self.ser_error = f"Unexpected read error: {e}"
+
+
+def telemetry(lines):
+    chunks = []
+    for i in range(lines):
+        chunks.append(json.dumps({
+            "command": "status", "success": "true", "timestamp": i,
+            "left_encoder": i * 3, "right_encoder": i * 3 + 1,
+            "left_speed": 120.5, "right_speed": 119.25,
+            "left_set_speed": 120, "right_set_speed": 120, "wall_tof": 431,
+        }).encode() + b"\r\n")
+    return b"".join(chunks)
+
+
+def run(helper_cls, payload, lines):
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(slave_fd)
+    helper = helper_cls(port=os.ttyname(slave_fd))
+
+    start = time.monotonic()
+    feeder = threading.Thread(target=os.write, args=(master_fd, payload), daemon=True)
+    feeder.start()
+    while helper.get_response_seq() < lines and time.monotonic() - start < 60:
+        time.sleep(0.001)
+    elapsed = time.monotonic() - start
+    parsed = helper.get_response_seq()
+
+    helper.disconnect_serial()
+    os.close(master_fd)
+    os.close(slave_fd)
+    return parsed, elapsed
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payload = telemetry(lines)
+    print(f"{lines} lines, {len(payload)} bytes, 230400 baud carries {BAUD_BYTES_PER_SECOND} bytes/s")
+    for name, helper_cls in (("readline", ReadlineSerialHelper), ("bulk", SerialHelper)):
+        parsed, elapsed = run(helper_cls, payload, lines)
+        print(f"{name:>8}: {parsed / elapsed:10.0f} lines/s {len(payload) * parsed / lines / elapsed:12.0f} bytes/s"
+              f" ({parsed}/{lines} parsed in {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
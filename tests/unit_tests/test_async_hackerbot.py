@@ -0,0 +1,191 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the AsyncHackerbot class.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import json
+import time
+import asyncio
+import unittest
+from hackerbot.aio import AsyncHackerbot
+from hackerbot.aio.connection import AsyncConnection
+from hackerbot.utils.emulator import HackerbotEmulator
+
+class TestAsyncHackerbot(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.emulator = HackerbotEmulator(latency=0.001, drive_duration=0.1, goto_duration=0.1)
+        self.emulator.command_latency["B_MAPDATA"] = 0.05
+        self.addCleanup(self.emulator.close)
+
+    async def connect(self):
+        # No time to leave or reach the dock
+        settle = {command: {"settle": 0.0} for command in ("B_START", "B_GOTO", "B_DOCK")}
+        bot = await AsyncHackerbot.connect(port=self.emulator.port, command_policies=settle)
+        bot.base._docked = False
+        bot.base.maps._docked = False
+        return bot
+
+    async def test_connect_runs_setup(self):
+        async with await self.connect() as bot:
+            self.assertTrue(bot._json_mode)
+            self.assertTrue(bot._main_controller_attached)
+            self.assertTrue(bot._base_init)
+            deadline = time.monotonic() + 1
+            while len(self.emulator.received) < 4 and time.monotonic() < deadline:
+                await asyncio.sleep(0.005)  # B_INIT and H_IDLE have no response to wait for
+            self.assertEqual(self.emulator.received[:4], ["JSON, 1", "PING", "B_INIT", "H_IDLE, 1"])
+
+    async def test_core(self):
+        async with await self.connect() as bot:
+            self.assertTrue(json.loads(await bot.core.ping())["arm_control_attached"])
+            self.assertEqual(json.loads(await bot.core.version())["main_controller_version"], "emulator")
+
+    async def test_base_and_maps(self):
+        async with await self.connect() as bot:
+            self.assertTrue(await bot.base.drive(100, 0))
+            self.assertEqual((await bot.base.status())["left_set_speed"], 0)
+            self.assertTrue(await bot.base.maps.goto(1.0, 2.0, 90, 0.4))
+            self.assertEqual(await bot.base.maps.position(), {"x": 1.0, "y": 2.0, "angle": 90.0})
+            self.assertEqual(await bot.base.maps.list(), [1, 2])
+            self.assertEqual(await bot.base.maps.fetch(1), "emulated-map-1")
+            self.assertIsNone(await bot.base.maps.fetch(9))
+            self.assertIn("maps:fetch", bot.get_error())
+            self.assertTrue(await bot.base.dock())
+
+    async def test_motion_timeout_and_cancel(self):
+        self.emulator.drive_duration = 5.0
+        self.emulator.goto_duration = 5.0
+        async with await self.connect() as bot:
+            start = time.monotonic()
+            self.assertFalse(await bot.base.drive(100, 0, timeout=0.2))
+            self.assertLess(time.monotonic() - start, 1.0)
+            self.assertIn("not completed", bot._warning_msg)
+
+            drive = asyncio.ensure_future(bot.base.drive(100, 0))
+            await asyncio.sleep(0.1)
+            bot.base.cancel()
+            self.assertFalse(await asyncio.wait_for(drive, 1.0))
+
+            goto = asyncio.ensure_future(bot.base.maps.goto(5.0, 5.0, 0, 0.1))
+            await asyncio.sleep(0.1)
+            bot.base.maps.cancel()
+            self.assertFalse(await asyncio.wait_for(goto, 1.0))
+
+    async def test_command_policies(self):
+        async with await self.connect() as bot:
+            self.assertEqual(bot.get_command_policy("B_MAPDATA,1").deadline, 8.0)
+            self.assertEqual(bot.get_command_policy("B_START").settle, 0.0)
+            bot.set_command_policy("B_MAPDATA", deadline=0.02, retries=0)
+            self.assertIsNone(await bot.base.maps.fetch(1))  # Map takes 0.05s to generate
+            self.assertIn("No mapdata response", bot.get_error())
+            bot.set_command_policy("B_MAPDATA", deadline=8.0)
+            self.assertIsNone(await bot.base.maps.fetch(1, deadline=0.02, retries=0))  # Per call, fails fast
+
+    async def test_head_and_arm(self):
+        async with await self.connect() as bot:
+            self.assertTrue(await bot.head.look(180, 200, 50))
+            self.assertTrue(await bot.head.eyes.gaze(0.5, -0.5))
+            self.assertTrue(await bot.arm.move_joints(0, 10, 20, 30, 40, 50, 10))
+            await asyncio.sleep(0.05)
+            self.assertIn("H_GAZE,0.5,-0.5", self.emulator.received)
+            self.assertIn("A_ANGLES,0,10,20,30,40,50,10", self.emulator.received)
+
+    async def test_requests_do_not_block_the_loop(self):
+        self.emulator.command_latency["B_STATUS"] = 0.2
+        async with await self.connect() as bot:
+            start = time.monotonic()
+            results = await asyncio.gather(bot.base.status(), bot.base.maps.position(), bot.core.ping())
+            self.assertLess(time.monotonic() - start, 0.35)
+            self.assertTrue(all(results))
+
+    async def test_several_robots_on_one_loop(self):
+        with HackerbotEmulator(latency=0.001) as other:
+            bots = await asyncio.gather(self.connect(), AsyncHackerbot.connect(port=other.port))
+            pings = await asyncio.gather(*(bot.core.ping() for bot in bots))
+            self.assertTrue(all(pings))
+            for bot in bots:
+                await bot.close()
+
+    async def test_request_timeout_and_close(self):
+        bot = await self.connect()
+        with self.assertRaises(TimeoutError):
+            await bot.request("PING", "pong", timeout=0.05)
+        pending = asyncio.ensure_future(bot.request("B_STATUS", "never", timeout=1))
+        await asyncio.sleep(0)
+        await bot.close()
+        with self.assertRaises(ConnectionError):
+            await pending
+        self.assertIsNone(await bot.base.status())
+
+class TestAsyncConnection(unittest.IsolatedAsyncioTestCase):
+
+    async def test_tcp(self):
+        async def controller(reader, writer):
+            while line := await reader.readline():
+                if line == b"PING\r\n":
+                    writer.write(b'{"command": "ping", "success": "true"}\r\n')
+
+        server = await asyncio.start_server(controller, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        connection = await AsyncConnection.open(f"tcp://127.0.0.1:{port}")
+        self.assertEqual((await connection.request("PING", "ping"))["success"], "true")
+        self.assertEqual(connection.get_latest_response("ping")["command"], "ping")
+        connection.close()
+        server.close()
+        await server.wait_closed()
+
+    async def test_request_retries(self):
+        received = []
+        async def controller(reader, writer):
+            while line := await reader.readline():
+                received.append(line)
+                if len(received) == 2:  # First attempt lost
+                    writer.write(b'{"command": "ping", "success": "true"}\r\n')
+
+        server = await asyncio.start_server(controller, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        connection = await AsyncConnection.open(f"tcp://127.0.0.1:{port}",
+                                                command_policies={"PING": {"deadline": 0.05, "backoff": 0.0}})
+        self.assertEqual((await connection.request("PING", "ping"))["success"], "true")
+        self.assertEqual(received, [b"PING\r\n", b"PING\r\n"])
+        with self.assertRaises(TimeoutError):
+            await connection.request("B_STATUS", "status", timeout=0.02, retries=1)
+        self.assertEqual(len(received), 4)
+        connection.close()
+        server.close()
+        await server.wait_closed()
+
+    async def test_partial_serial_write(self):
+        with HackerbotEmulator(latency=0.001) as emulator:
+            connection = await AsyncConnection.open(emulator.port)
+            write = connection.ser.write
+            writes = []
+            def partial_write(data):
+                writes.append(bytes(data))
+                return write(data[:2]) if len(writes) == 1 else write(data)  # The port takes 2 bytes at first
+            connection.ser.write = partial_write
+
+            self.assertEqual((await connection.request("JSON, 1", "json"))["command"], "json")
+            self.assertEqual(writes, [b"JSON, 1\r\n", b"ON, 1\r\n"])
+            self.assertEqual(connection._tx_buffer, b"")
+            connection.close()
+
+    async def test_invalid_port(self):
+        with self.assertRaises(ValueError):
+            await AsyncConnection.open("tcp://localhost")
+
+if __name__ == '__main__':
+    unittest.main()
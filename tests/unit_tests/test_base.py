@@ -15,10 +15,13 @@
 ################################################################################
 
 import json
+import time
+import threading
 import unittest
 from unittest.mock import patch, MagicMock, call
 from hackerbot.utils.hackerbot_helper import HackerbotHelper
 from hackerbot.base import Base
+from hackerbot.utils.command_policy import CommandPolicy
 import numpy as np
 
 class TestHackerbotBase(unittest.TestCase):
@@ -28,6 +31,14 @@ class TestHackerbotBase(unittest.TestCase):
         # Mock method behaviors
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
+        self.mock_controller.get_command_policy.return_value = CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=0.0)
+        # Report the base as stopped as soon as a blocking call subscribes to status
+        self.stopped = {"command": "status", "left_set_speed": 0, "right_set_speed": 0}
+        def subscribe(command, callback, **kwargs):
+            callback(self.stopped)
+            return MagicMock()
+        self.mock_controller.subscribe.side_effect = subscribe
 
     def test_initialize_success(self):
         # self.mock_controller.get_json_from_command.return_value = None
@@ -65,7 +76,7 @@ class TestHackerbotBase(unittest.TestCase):
             "wall_tof": 0,
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -73,6 +84,7 @@ class TestHackerbotBase(unittest.TestCase):
         base._future_completed = False
 
         result = base.status()
+        self.mock_controller.send_command_and_wait.assert_called_with("B_STATUS", "status", timeout=None, retries=None)
         self.assertEqual(result, sample_response)
         self.assertTrue(base._future_completed)
 
@@ -87,13 +99,13 @@ class TestHackerbotBase(unittest.TestCase):
             "wall_tof": 0,
         }
 
-        self.mock_controller.get_json_from_command.return_value = new_response
+        self.mock_controller.send_command_and_wait.return_value = new_response
         result = base.status()
         self.assertEqual(result, new_response)
         self.assertFalse(base._future_completed)
 
     def test_status_failure(self):
-        self.mock_controller.get_json_from_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -110,12 +122,11 @@ class TestHackerbotBase(unittest.TestCase):
         self.mock_controller.send_raw_command.return_value = None
 
         base = Base(self.mock_controller)
-        base._future_completed = True
         base._docked = True
 
         result = base.start()
         self.assertFalse(base._docked)
-        self.assertFalse(base._future_completed)
+        self.mock_controller.send_raw_command.assert_called_with("B_STATUS")
         self.assertTrue(result)
         
     def test_quickmap_success(self):
@@ -124,10 +135,9 @@ class TestHackerbotBase(unittest.TestCase):
         self.mock_controller.send_raw_command.return_value = None
 
         base = Base(self.mock_controller)
-        base._future_completed = True
 
         result = base.quickmap()
-        self.assertFalse(base._future_completed)
+        self.mock_controller.subscribe.assert_called_once()
         self.assertTrue(result)
         
     def test_dock_success(self):
@@ -136,14 +146,23 @@ class TestHackerbotBase(unittest.TestCase):
         self.mock_controller.send_raw_command.return_value = None
 
         base = Base(self.mock_controller)
-        base._future_completed = True
         base._docked = False
 
         result = base.dock()
 
-        self.assertFalse(base._future_completed)
         self.assertTrue(base._docked)
         self.assertTrue(result)
+
+    def test_dock_timeout_keeps_state(self):
+        self.mock_controller.subscribe.side_effect = None  # Never reports stopped
+        self.mock_controller._driver_mode = True
+
+        base = Base(self.mock_controller)
+        base._docked = False
+
+        self.assertFalse(base.dock(timeout=0.1))
+        self.assertFalse(base._docked)
+        self.assertTrue(self.mock_controller._driver_mode)
     
     def test_kill_success(self):
         self.mock_controller.get_json_from_command.return_value = None
@@ -170,21 +189,75 @@ class TestHackerbotBase(unittest.TestCase):
         self.assertTrue(result)
 
     def test_drive_success(self):
-        self.mock_controller.get_json_from_command.return_value = {"command": "drive", "success": "true"}
+        self.mock_controller.send_command_and_wait.return_value = {"command": "drive", "success": "true"}
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
         self.mock_controller._driver_mode = True
 
         base = Base(self.mock_controller)
-        base._future_completed = True
 
         result = base.drive(0, 0)
 
-        self.assertFalse(base._future_completed)
+        self.mock_controller.send_raw_command.assert_called_with("B_STATUS")
         self.assertTrue(result)
 
+    def test_drive_timeout(self):
+        self.mock_controller.send_command_and_wait.return_value = {"command": "drive", "success": "true"}
+        self.mock_controller._driver_mode = True
+        self.mock_controller.subscribe.side_effect = None  # No status ever arrives
+
+        base = Base(self.mock_controller)
+        base.MOTION_POLL_MAX = 0.05
+
+        start = time.monotonic()
+        result = base.drive(100, 0, timeout=0.3)
+
+        self.assertFalse(result)
+        self.assertLess(time.monotonic() - start, 1.0)
+        polls = [c for c in self.mock_controller.send_raw_command.call_args_list if c == call("B_STATUS")]
+        self.assertGreaterEqual(len(polls), 2)  # Polls again while nothing answers
+        self.mock_controller.subscribe.return_value.close.assert_called_once()
+        self.mock_controller.log_warning.assert_called_once()
+
+    def test_drive_cancel(self):
+        self.mock_controller.send_command_and_wait.return_value = {"command": "drive", "success": "true"}
+        self.mock_controller._driver_mode = True
+        self.mock_controller.subscribe.side_effect = None
+
+        base = Base(self.mock_controller)
+        threading.Timer(0.1, base.cancel).start()
+
+        start = time.monotonic()
+        self.assertFalse(base.drive(100, 0))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.mock_controller.log_warning.assert_not_called()
+
+    def test_drive_start_not_completed(self):
+        self.mock_controller._driver_mode = False
+        self.mock_controller.subscribe.side_effect = None  # The base never reports it started
+
+        base = Base(self.mock_controller)
+
+        start = time.monotonic()
+        self.assertFalse(base.drive(100, 0, timeout=0.2))
+        self.assertLess(time.monotonic() - start, 1.0)  # The start only gets the caller's timeout
+        self.mock_controller.send_command_and_wait.assert_not_called()
+        self.mock_controller.log_error.assert_called_once_with("Error in base:drive: start did not complete, not driving")
+
+    def test_cancel_while_settling(self):
+        self.mock_controller.get_command_policy.return_value = CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=0.2)
+        self.mock_controller.subscribe.side_effect = None
+
+        base = Base(self.mock_controller)
+        threading.Timer(0.05, base.cancel).start()  # While B_START leaves the dock
+
+        start = time.monotonic()
+        self.assertFalse(base.start(timeout=2.0))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.mock_controller.subscribe.assert_not_called()
+
     def test_drive_failure(self):
-        self.mock_controller.get_json_from_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
         self.mock_controller._driver_mode = True
@@ -46,7 +46,7 @@ class TestHackerbotCore(unittest.TestCase):
             "arm_controller": "attached"
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -65,6 +65,7 @@ class TestHackerbotCore(unittest.TestCase):
 
         result = core.ping()
         self.assertEqual(json.loads(result), expected_output)
+        self.mock_controller.send_command_and_wait.assert_called_with("PING", "ping", timeout=None, retries=None)
         self.assertTrue(self.mock_controller._main_controller_attached)
         self.assertTrue(self.mock_controller._temperature_sensor_attached)
         self.assertTrue(self.mock_controller._left_tof_attached)
@@ -73,6 +74,14 @@ class TestHackerbotCore(unittest.TestCase):
         self.assertTrue(self.mock_controller._dynamixel_controller_attached)
         self.assertTrue(self.mock_controller._arm_attached)
 
+    def test_ping_failure(self):
+        self.mock_controller.send_command_and_wait.side_effect = TimeoutError("No ping response")
+
+        core = Core(self.mock_controller)
+
+        self.assertIsNone(core.ping())
+        self.mock_controller.log_error.assert_called_with("Error in core:ping: No ping response")
+
     def test_ping_main_controller_not_attached(self):
         sample_response = {
             # "main_controller": "attached", # Main controller not attached
@@ -84,7 +93,7 @@ class TestHackerbotCore(unittest.TestCase):
             "arm_controller": "attached"
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -123,7 +132,7 @@ class TestHackerbotCore(unittest.TestCase):
             "arm_controller": "attached"
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -162,7 +171,7 @@ class TestHackerbotCore(unittest.TestCase):
             "arm_controller": "attached"
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -202,7 +211,7 @@ class TestHackerbotCore(unittest.TestCase):
             # "arm_controller": "attached"
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -237,7 +246,7 @@ class TestHackerbotCore(unittest.TestCase):
             "arm_controller": "v7"
         }
 
-        self.mock_controller.get_json_from_command.return_value = sample_response
+        self.mock_controller.send_command_and_wait.return_value = sample_response
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
@@ -255,7 +264,7 @@ class TestHackerbotCore(unittest.TestCase):
         self.assertEqual(json.loads(result), expected_output)
         
     def test_versions_failure(self):
-        self.mock_controller.get_json_from_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
         self.mock_controller.check_controller_init.return_value = None
         self.mock_controller.send_raw_command.return_value = None
 
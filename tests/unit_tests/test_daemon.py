@@ -0,0 +1,115 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the HackerbotDaemon class.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import json
+import time
+import tempfile
+import threading
+import unittest
+from hackerbot import Hackerbot
+from hackerbot.utils.daemon import HackerbotDaemon
+from hackerbot.utils.emulator import HackerbotEmulator
+from hackerbot.utils.serial_helper import SerialHelper
+
+class TestHackerbotDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = HackerbotEmulator(latency=0.001)
+        self.addCleanup(self.emulator.close)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.socket_path = os.path.join(self.tmp_dir.name, "hackerbot.sock")
+        self.daemon = HackerbotDaemon(socket_path=self.socket_path, port=self.emulator.port)
+        self.addCleanup(self.daemon.close)
+
+    def connect(self):
+        client = SerialHelper(port=f"unix://{self.socket_path}")
+        self.addCleanup(client.disconnect_serial)
+        return client
+
+    def test_responses_go_to_the_sender(self):
+        first, second = self.connect(), self.connect()
+        self.emulator.command_latency["B_POSE"] = 0.05
+        results = {}
+
+        def ask_pose():
+            results["pose"] = first.send_command_and_wait("B_POSE", "pose", timeout=1)
+
+        thread = threading.Thread(target=ask_pose)
+        thread.start()
+        time.sleep(0.01)
+        self.assertEqual(second.send_command_and_wait("PING", "ping", timeout=1)["command"], "ping")
+        thread.join()
+
+        self.assertEqual(results["pose"]["command"], "pose")
+        self.assertIsNone(second.get_latest_response("pose"))
+        self.assertIsNone(first.get_latest_response("ping"))
+        self.assertEqual(self.daemon.get_counters()["clients"], 2)
+
+    def test_telemetry_fans_out(self):
+        first, second = self.connect(), self.connect()
+        time.sleep(0.05)
+        self.emulator.telemetry_rate = 100
+        time.sleep(0.2)
+        self.emulator.telemetry_rate = 0
+        self.assertIsNotNone(first.get_latest_response("status"))
+        self.assertIsNotNone(second.get_latest_response("status"))
+        self.assertNotIn("B_STATUS", self.emulator.received)
+
+    def test_json_mode_is_owned_by_the_daemon(self):
+        client = self.connect()
+        self.assertEqual(client.send_command_and_wait("JSON, 1", "json", timeout=1)["success"], "true")
+        client.send_raw_command("JSON, 0")
+        self.assertEqual(client.send_command_and_wait("PING", "ping", timeout=1)["success"], "true")
+        self.assertEqual(self.emulator.received.count("JSON, 0"), 0)
+
+    def test_hackerbot_through_daemon(self):
+        bot = Hackerbot(port=f"unix://{self.socket_path}")
+        self.assertTrue(json.loads(bot.core.ping())["main_controller_attached"])
+        self.assertEqual(bot.base.maps.position(), {"x": 0.0, "y": 0.0, "angle": 0.0})
+        self.assertIsNotNone(bot.base.status())
+        bot.disconnect_serial()
+
+    def test_client_does_not_interrupt_motion(self):
+        self.emulator.drive_duration = 2.0
+        driver = Hackerbot(port=f"unix://{self.socket_path}")
+        self.addCleanup(driver.disconnect_serial)
+        self.assertTrue(driver.base.drive(200, 0, block=False))
+
+        # Startup commands of a second client are answered by the daemon, shared mode skips H_IDLE and B_KILL
+        other = Hackerbot(port=f"unix://{self.socket_path}", shared=True)
+        self.assertTrue(json.loads(other.core.ping())["main_controller_attached"])
+        self.assertIsNotNone(other.head)
+        other.base.destroy()
+
+        self.assertEqual(self.emulator.received.count("B_INIT"), 1)
+        self.assertNotIn("B_KILL", self.emulator.received)
+        self.assertNotIn("H_IDLE, 1", self.emulator.received)
+        status = driver.base.status()
+        self.assertNotEqual(status["left_set_speed"], 0)
+
+    def test_close_disconnects_clients(self):
+        client = self.connect()
+        client.send_command_and_wait("PING", "ping", timeout=1)
+        self.daemon.close()
+        self.assertFalse(os.path.exists(self.socket_path))
+        with self.assertRaises(Exception):
+            client.send_command_and_wait("PING", "ping", timeout=0.2, retries=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the HackerbotEmulator class.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import json
+import time
+import unittest
+from hackerbot import Hackerbot
+from hackerbot.utils.emulator import HackerbotEmulator
+from hackerbot.utils.serial_helper import SerialHelper
+
+class TestHackerbotEmulator(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = HackerbotEmulator(latency=0.001, drive_duration=0.2, goto_duration=0.1)
+        self.helper = SerialHelper(port=self.emulator.port)
+
+    def tearDown(self):
+        self.helper.disconnect_serial()
+        self.emulator.close()
+
+    def test_response_name(self):
+        self.assertEqual(HackerbotEmulator.response_name("B_STATUS"), "status")
+        self.assertEqual(HackerbotEmulator.response_name("H_LOOK, 180, 180, 70"), "look")
+        self.assertEqual(HackerbotEmulator.response_name("A_ANGLES,0,0,0,0,0,0,10"), "angles")
+        self.assertEqual(HackerbotEmulator.response_name("PING"), "ping")
+
+    def test_no_json_before_json_mode(self):
+        with self.assertRaises(TimeoutError):
+            self.helper.send_command_and_wait("PING", "ping", timeout=0.2, retries=0)
+        self.assertEqual(self.emulator.received, ["PING"])
+
+        response = self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        self.assertEqual(response["success"], "true")
+        response = self.helper.send_command_and_wait("PING", "ping", timeout=1)
+        self.assertEqual(response["main_controller"], "attached")
+
+    def test_drive_updates_status(self):
+        self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        self.helper.send_command_and_wait("B_DRIVE,100,0", "drive", timeout=1)
+
+        status = self.helper.send_command_and_wait("B_STATUS", "status", timeout=1)
+        self.assertEqual(status["left_set_speed"], 100.0)
+        self.assertEqual(status["right_set_speed"], 100.0)
+
+        time.sleep(0.3)
+        status = self.helper.send_command_and_wait("B_STATUS", "status", timeout=1)
+        self.assertEqual(status["left_set_speed"], 0.0)
+        self.assertAlmostEqual(status["left_encoder"], 20, delta=1)
+
+    def test_goto_reaches_goal(self):
+        self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        self.helper.send_command_and_wait("B_GOTO,1.5,-0.5,90,0.4", "goto", timeout=1)
+        time.sleep(0.15)
+        pose = self.helper.send_command_and_wait("B_POSE", "pose", timeout=1)
+        self.assertEqual((pose["pose_x"], pose["pose_y"], pose["pose_angle"]), (1.5, -0.5, 90.0))
+
+    def test_maps(self):
+        self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        self.assertEqual(self.helper.send_command_and_wait("B_MAPLIST", "maplist", timeout=1)["map_ids"], [1, 2])
+        map_data = self.helper.send_command_and_wait("B_MAPDATA,2", "mapdata", timeout=1)
+        self.assertEqual(map_data["compressedmapdata"], "emulated-map-2")
+        with self.assertRaises(Exception):
+            self.helper.send_command_and_wait("B_MAPDATA,7", "mapdata", timeout=1)
+
+    def test_unknown_command_fails(self):
+        self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        with self.assertRaises(Exception):
+            self.helper.send_command_and_wait("B_DANCE", "dance", timeout=1)
+
+    def test_command_latency(self):
+        self.emulator.command_latency["VERSION"] = 0.2
+        self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        start = time.monotonic()
+        self.helper.send_command_and_wait("VERSION", "version", timeout=1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_telemetry_rate(self):
+        self.emulator.telemetry_rate = 100
+        self.helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+        time.sleep(0.2)
+        self.assertIsNotNone(self.helper.get_latest_response("status"))
+        self.assertNotIn("B_STATUS", self.emulator.received)
+
+class TestHackerbotOnEmulator(unittest.TestCase):
+
+    def test_hackerbot_connects_unchanged(self):
+        with HackerbotEmulator(latency=0.001, attached={"arm_controller": False}) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.assertEqual(bot.get_board_and_port()[1], emulator.port)
+
+            state = json.loads(bot.core.ping())
+            self.assertTrue(state["main_controller_attached"])
+            self.assertFalse(state["arm_control_attached"])
+            self.assertEqual(json.loads(bot.core.version())["main_controller_version"], "emulator")
+            self.assertEqual(bot.base.maps.position(), {"x": 0.0, "y": 0.0, "angle": 0.0})
+            self.assertIsNotNone(bot.base.status())
+            bot.disconnect_serial()
+
+    def test_per_call_deadline(self):
+        with HackerbotEmulator(latency=0.001) as emulator:
+            emulator.command_latency["B_MAPDATA"] = 0.5
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            start = time.monotonic()
+            self.assertIsNone(bot.base.maps.fetch(1, deadline=0.05, retries=0))  # Policy deadline is 8s
+            self.assertLess(time.monotonic() - start, 0.4)
+            self.assertEqual(emulator.received.count("B_MAPDATA,1"), 1)
+
+    def test_blocking_drive_polls_sparingly(self):
+        with HackerbotEmulator(latency=0.001, drive_duration=1.0) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            bot.base._docked = False  # Skip the time to leave the dock
+            bot.base.start()
+            sent = len(emulator.received)
+            self.assertTrue(bot.base.drive(100, 0))
+            self.assertEqual(bot.base.status()["left_set_speed"], 0)
+            # Backed off to MOTION_POLL_MAX instead of polling back to back
+            self.assertLess(emulator.received[sent:].count("B_STATUS"), 10)
+
+    def test_blocking_drive_uses_telemetry(self):
+        with HackerbotEmulator(latency=0.001, drive_duration=0.5, telemetry_rate=50) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            bot.base._docked = False  # Skip the time to leave the dock
+            bot.base.start()
+            sent = len(emulator.received)
+            self.assertTrue(bot.base.drive(100, 0))
+            self.assertLessEqual(emulator.received[sent:].count("B_STATUS"), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the Hackerbot startup.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import time
+import unittest
+from hackerbot import Hackerbot
+from hackerbot.head import Head
+from hackerbot.arm import Arm
+from hackerbot.utils.emulator import HackerbotEmulator
+
+class TestHackerbotStartup(unittest.TestCase):
+
+    def start(self, model=None, **emulator_args):
+        emulator = HackerbotEmulator(latency=0.001, **emulator_args)
+        self.addCleanup(emulator.close)
+        bot = Hackerbot(port=emulator.port, model=model)
+        self.addCleanup(bot.disconnect_serial)
+        return emulator, bot
+
+    def test_handshake_is_pipelined(self):
+        emulator, bot = self.start()
+        self.assertTrue(bot._json_mode)
+        self.assertTrue(bot._main_controller_attached)
+        deadline = time.monotonic() + 1
+        while len(emulator.received) < 3 and time.monotonic() < deadline:
+            time.sleep(0.005)  # B_INIT has no response to wait for
+        self.assertEqual(emulator.received, ["JSON, 1", "PING", "B_INIT"])
+        # One write for the handshake
+        self.assertEqual(bot.get_latency_stats("PING")["write"]["count"], 1)
+
+    def test_subsystems_are_lazy(self):
+        emulator, bot = self.start()
+        self.assertIsNone(bot._head)
+        self.assertIsNone(bot._arm)
+        self.assertIsNone(bot.base._maps)
+
+        self.assertIsInstance(bot.head, Head)
+        self.assertIs(bot.head, bot.head)
+        self.assertIsInstance(bot.arm, Arm)
+        self.assertEqual(bot.base.maps.position(), {"x": 0.0, "y": 0.0, "angle": 0.0})
+        time.sleep(0.05)
+        self.assertIn("H_IDLE, 1", emulator.received)
+
+    def test_model_skips_subsystems(self):
+        emulator, bot = self.start(model="lite")
+        self.assertIsNone(bot.head)
+        self.assertIsNone(bot.arm)
+        self.assertIn("not part of the lite model", bot._warning_msg)
+        self.assertNotIn("H_IDLE, 1", emulator.received)
+
+    def test_unknown_model_builds_every_subsystem(self):
+        emulator, bot = self.start(model="t800")
+        self.assertIn("Unknown model: t800", bot._warning_msg)
+        self.assertIsInstance(bot.head, Head)
+        self.assertIsInstance(bot.arm, Arm)
+
+    def test_unattached_subsystems_are_skipped(self):
+        emulator, bot = self.start(attached={"arm_controller": False})
+        self.assertIsNone(bot.arm)
+        self.assertIsNone(bot.arm)
+        self.assertEqual(bot._warning_msg, "Arm not attached, skipping it.")
+        self.assertIsInstance(bot.head, Head)
+
+        emulator.attached["arm_controller"] = True
+        bot.core.ping()
+        self.assertIsInstance(bot.arm, Arm)
+
+    def test_falls_back_to_sequential_handshake(self):
+        emulator = HackerbotEmulator(latency=0.001)
+        self.addCleanup(emulator.close)
+        emulator.command_latency["PING"] = 1.0  # Ping misses the pipelined deadline
+        bot = Hackerbot(port=emulator.port)
+        self.addCleanup(bot.disconnect_serial)
+        self.assertTrue(bot._json_mode)
+        self.assertEqual(emulator.received[:2], ["JSON, 1", "PING"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -33,6 +33,15 @@ class TestHackerbotHelper(unittest.TestCase):
             
             self.assertTrue(helper._main_controller_init)
 
+    def test_setup_uses_port_without_board(self):
+        with patch.object(SerialHelper, '__init__', return_value= None) as mock_init, \
+             patch.object(SerialHelper, 'get_board_and_port', return_value= ('mock_board', 'tcp://robot:4000')), \
+             patch.object(HackerbotHelper, 'set_json_mode', return_value= None):
+            helper = HackerbotHelper(port='tcp://robot:4000')
+
+            mock_init.assert_called_with('tcp://robot:4000', serial_number=None)
+            self.assertEqual(helper._port, 'tcp://robot:4000')
+
     def test_setup_port_and_board_failure(self):
         with patch.object(SerialHelper, '__init__', return_value= None), \
              patch.object(SerialHelper, 'get_board_and_port', side_effect= Exception("Setup error")), \
@@ -69,7 +78,7 @@ class TestHackerbotHelper(unittest.TestCase):
     def test_set_json_mode_success(self):
         with patch.object(HackerbotHelper, '__init__', return_value= None), \
              patch.object(SerialHelper, 'send_raw_command', return_value= None), \
-             patch.object(SerialHelper, 'get_json_from_command', return_value= {"command": "json", "success": "true"}):
+             patch.object(SerialHelper, 'send_command_and_wait', return_value= {"command": "json", "success": "true"}):
             controller = HackerbotHelper()
             controller._json_mode = False
         
@@ -84,7 +93,7 @@ class TestHackerbotHelper(unittest.TestCase):
     def test_set_json_mode_failure(self):
         with patch.object(HackerbotHelper, '__init__', return_value= None), \
              patch.object(SerialHelper, 'send_raw_command', return_value= None), \
-             patch.object(SerialHelper, 'get_json_from_command', return_value= None):
+             patch.object(SerialHelper, 'send_command_and_wait', return_value= None):
             try:
                 controller = HackerbotHelper()
                 controller._json_mode = False
@@ -98,8 +107,7 @@ class TestHackerbotHelper(unittest.TestCase):
     
     def test_set_tofs_success(self):
         with patch.object(HackerbotHelper, '__init__', return_value= None), \
-             patch.object(SerialHelper, 'send_raw_command', return_value= None), \
-             patch.object(SerialHelper, 'get_json_from_command', return_value= {"command": "tofs", "success": "true"}):
+             patch.object(SerialHelper, 'send_command_and_wait', return_value= {"command": "tofs", "success": "true"}) as mock_send:
             controller = HackerbotHelper()
             controller._left_tof_attached = True
             controller._right_tof_attached = True
@@ -108,6 +116,7 @@ class TestHackerbotHelper(unittest.TestCase):
             controller.set_TOFs(True)
         
             self.assertTrue(controller._tofs_enabled)
+            mock_send.assert_called_with("TOFS, 1", "tofs")
 
             controller.set_TOFs(False)
         
@@ -115,8 +124,7 @@ class TestHackerbotHelper(unittest.TestCase):
 
     def test_set_tofs_failure(self):
         with patch.object(HackerbotHelper, '__init__', return_value= None), \
-             patch.object(SerialHelper, 'send_raw_command', return_value= None), \
-             patch.object(SerialHelper, 'get_json_from_command', return_value= None):
+             patch.object(SerialHelper, 'send_command_and_wait', return_value= None):
             try:
                 controller = HackerbotHelper()
                 controller._left_tof_attached = True
@@ -157,6 +165,29 @@ class TestHackerbotHelper(unittest.TestCase):
                 self.assertIn("Error in set_TOFs", str(e))
                 self.assertFalse(controller._tofs_enabled)
 
+    def test_on_reconnect_restores_json_mode(self):
+        with patch.object(HackerbotHelper, '__init__', return_value= None), \
+             patch.object(HackerbotHelper, 'set_json_mode', return_value= None) as mock_set_json_mode:
+            controller = HackerbotHelper()
+            controller._json_mode = True
+            controller._error_count = 0
+
+            controller._on_reconnect()
+
+            mock_set_json_mode.assert_called_once_with(True)
+
+    def test_on_reconnect_logs_failure(self):
+        with patch.object(HackerbotHelper, '__init__', return_value= None), \
+             patch.object(HackerbotHelper, 'set_json_mode', side_effect= Exception("no response")):
+            controller = HackerbotHelper()
+            controller._json_mode = True
+            controller._error_count = 0
+            controller._v_mode = False
+
+            controller._on_reconnect()
+
+            self.assertIn("Error restoring state after reconnect", controller._error_msg)
+
     def test_get_current_action(self):
         with patch.object(HackerbotHelper, '__init__', return_value= None), \
              patch.object(SerialHelper, 'get_state', return_value= "STATE"):
@@ -190,15 +221,18 @@ class TestHackerbotHelper(unittest.TestCase):
         with patch.object(HackerbotHelper, '__init__', return_value= None):
             controller = HackerbotHelper()
             controller._v_mode = True
+            controller._error_count = 0
         
             controller.log_error("Error message")
         
             self.assertIn("Error message", controller._error_msg)
+            self.assertEqual(controller._error_count, 1)
 
     def test_log_warning(self):
         with patch.object(HackerbotHelper, '__init__', return_value= None):
             controller = HackerbotHelper()
             controller._v_mode = True
+            controller._warning_count = 0
         
             controller.log_warning("Warning message")
         
@@ -209,6 +243,8 @@ class TestHackerbotHelper(unittest.TestCase):
              patch.object(SerialHelper, 'disconnect_serial', return_value= None):
             controller = HackerbotHelper()
             controller._main_controller_init = True
+            controller._metrics_server = None
+            controller._error_count = 0
             result = controller.destroy()
             
             self.assertTrue(result)
@@ -219,6 +255,8 @@ class TestHackerbotHelper(unittest.TestCase):
              patch.object(SerialHelper, 'disconnect_serial', side_effect= ConnectionError("Error closing serial connection:")):
             controller = HackerbotHelper()
             controller._main_controller_init = True
+            controller._metrics_server = None
+            controller._error_count = 0
             controller._v_mode = True
             
             result = controller.destroy()
@@ -0,0 +1,51 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the import-time budget test for `import hackerbot`.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import sys
+import subprocess
+import unittest
+
+# Seconds `import hackerbot` may take in a fresh interpreter, generous so slow CI machines pass
+IMPORT_BUDGET = 0.3
+
+# Only imported on first use of Base.speak, TTSHelper downloads or the metrics server
+DEFERRED_MODULES = ("sounddevice", "piper", "numpy", "huggingface_hub", "requests", "http.server")
+
+class TestImportTime(unittest.TestCase):
+
+    def import_times(self, module):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                capture_output=True, text=True, check=True)
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative) / 1e6
+        return times
+
+    def test_heavy_dependencies_are_deferred(self):
+        times = self.import_times("hackerbot")
+        self.assertEqual([module for module in DEFERRED_MODULES if module in times], [])
+
+    def test_import_budget(self):
+        # Best of three runs, the first one may pay for a cold file cache
+        best = min(self.import_times("hackerbot")["hackerbot"] for _ in range(3))
+        self.assertLess(best, IMPORT_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
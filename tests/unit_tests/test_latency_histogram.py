@@ -0,0 +1,78 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the LatencyHistogram class.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import unittest
+from hackerbot.utils.latency_histogram import LatencyHistogram, CommandLatency
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertIsNone(summary["mean"])
+        self.assertIsNone(summary["p99"])
+
+    def test_buckets_are_contiguous(self):
+        histogram = LatencyHistogram()
+        expected_low = 0
+        for index in range(200):
+            low, width = histogram._bucket_range(index)
+            self.assertEqual(low, expected_low)
+            self.assertEqual(histogram._index(low), index)
+            self.assertEqual(histogram._index(low + width - 1), index)
+            expected_low = low + width
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000.0)
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.min, 0.001)
+        self.assertEqual(histogram.max, 1.0)
+        self.assertAlmostEqual(histogram.mean, 0.5005)
+        self.assertAlmostEqual(histogram.percentile(50), 0.5, delta=0.5 * 0.04)
+        self.assertAlmostEqual(histogram.percentile(99), 0.99, delta=0.99 * 0.04)
+        self.assertEqual(histogram.percentile(100), 1.0)
+
+    def test_out_of_range_values(self):
+        histogram = LatencyHistogram()
+        histogram.record(-1.0)
+        histogram.record(2 * LatencyHistogram.MAX_SECONDS)
+        self.assertEqual(histogram.count, 2)
+        self.assertEqual(histogram.percentile(0), 0.0)
+        self.assertEqual(histogram.percentile(100), 2 * LatencyHistogram.MAX_SECONDS)
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.01)
+        histogram.reset()
+        self.assertEqual(histogram.count, 0)
+        self.assertIsNone(histogram.percentile(50))
+
+    def test_command_latency_summary(self):
+        stats = CommandLatency()
+        stats.response.record(0.02)
+        stats.timeouts += 1
+        summary = stats.summary()
+        self.assertEqual(summary["response"]["count"], 1)
+        self.assertEqual(summary["write"]["count"], 0)
+        self.assertEqual(summary["timeouts"], 1)
+        self.assertEqual(summary["failures"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
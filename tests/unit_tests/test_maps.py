@@ -15,30 +15,41 @@
 ################################################################################
 
 
+import time
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
+from hackerbot import Hackerbot
 from hackerbot.base.maps import Maps
+from hackerbot.utils.emulator import HackerbotEmulator
+from hackerbot.utils.command_policy import CommandPolicy
 
 class TestHackerbotMaps(unittest.TestCase):
     def setUp(self):
         self.mock_controller = MagicMock()
+        self.mock_controller.get_command_policy.return_value = CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=0.0)
+        # Report the goal pose as soon as a blocking goto subscribes to pose
+        self.pose = {"command": "pose", "map_id": 1, "pose_x": 1.0, "pose_y": 2.0, "pose_angle": 90}
+        def subscribe(command, callback, **kwargs):
+            callback(self.pose)
+            return MagicMock()
+        self.mock_controller.subscribe.side_effect = subscribe
         self.maps = Maps(controller=self.mock_controller)
 
     @patch("time.sleep", return_value=None)
     def test_fetch_success(self, _):
-        self.mock_controller.get_json_from_command.return_value = {
+        self.mock_controller.send_command_and_wait.return_value = {
             "compressedmapdata": "fake_map_data"
         }
 
         result = self.maps.fetch("map123")
 
-        self.mock_controller.send_raw_command.assert_called_with("B_MAPDATA,map123")
-        self.mock_controller.get_json_from_command.assert_called_with("mapdata")
+        self.mock_controller.send_command_and_wait.assert_called_with("B_MAPDATA,map123", "mapdata", timeout=None, retries=None)
         self.assertEqual(result, "fake_map_data")
 
     @patch("time.sleep", return_value=None)
     def test_fetch_no_data(self, _):
-        self.mock_controller.get_json_from_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
         result = self.maps.fetch("map123")
 
         self.assertIsNone(result)
@@ -46,18 +57,18 @@ class TestHackerbotMaps(unittest.TestCase):
 
     @patch("time.sleep", return_value=None)
     def test_list_success(self, _):
-        self.mock_controller.get_json_from_command.return_value = {
+        self.mock_controller.send_command_and_wait.return_value = {
             "map_ids": ["m1", "m2"]
         }
 
         result = self.maps.list()
 
-        self.mock_controller.send_raw_command.assert_called_with("B_MAPLIST")
+        self.mock_controller.send_command_and_wait.assert_called_with("B_MAPLIST", "maplist", timeout=None, retries=None)
         self.assertEqual(result, ["m1", "m2"])
 
     @patch("time.sleep", return_value=None)
     def test_list_failure(self, _):
-        self.mock_controller.get_json_from_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
 
         result = self.maps.list()
 
@@ -66,7 +77,7 @@ class TestHackerbotMaps(unittest.TestCase):
 
     @patch("time.sleep", return_value=None)
     def test_position_success(self, _):
-        self.mock_controller.get_json_from_command.return_value = {
+        self.mock_controller.send_command_and_wait.return_value = {
             "map_id": "map01",
             "pose_x": 1.1,
             "pose_y": 2.2,
@@ -75,7 +86,7 @@ class TestHackerbotMaps(unittest.TestCase):
 
         result = self.maps.position()
 
-        self.mock_controller.send_raw_command.assert_called_with("B_POSE")
+        self.mock_controller.send_command_and_wait.assert_called_with("B_POSE", "pose", timeout=None, retries=None)
         self.assertEqual(result, {"x": 1.1, "y": 2.2, "angle": 45.5})
         self.assertEqual(self.maps.map_id, "map01")
         self.assertEqual(self.maps._x, 1.1)
@@ -84,7 +95,7 @@ class TestHackerbotMaps(unittest.TestCase):
 
     @patch("time.sleep", return_value=None)
     def test_position_failure(self, _):
-        self.mock_controller.get_json_from_command.return_value = None
+        self.mock_controller.send_command_and_wait.return_value = None
 
         result = self.maps.position()
 
@@ -110,7 +121,7 @@ class TestHackerbotMaps(unittest.TestCase):
 
         self.assertTrue(result)
         self.assertFalse(self.maps._docked)
-        self.mock_controller.send_raw_command.assert_called_with("B_GOTO,1.0,2.0,90,0.3")
+        self.mock_controller.send_raw_command.assert_any_call("B_GOTO,1.0,2.0,90,0.3")
 
     def _complete_goto(self):
         self.maps._goto_completed = True
@@ -148,18 +159,60 @@ class TestHackerbotMaps(unittest.TestCase):
 
         self.assertFalse(self.maps._goto_completed)
 
-    @patch("time.sleep", return_value=None)
-    def test_wait_until_reach_pose_works(self, _):
-        self.maps.position = MagicMock()
-        self.maps._calculate_position_offset = MagicMock(side_effect=self._complete_goto)
-        self.maps._goto_completed = False
+    def test_wait_until_reach_pose_works(self):
+        self.maps._goal_x = 1.0
+        self.maps._goal_y = 2.0
+        self.maps._goal_angle = 90
 
-        self.maps._wait_until_reach_pose()
+        self.assertTrue(self.maps._wait_until_reach_pose())
 
-        self.maps.position.assert_called()
-        self.maps._calculate_position_offset.assert_called()
+        self.mock_controller.send_raw_command.assert_called_with("B_POSE")
+        self.assertEqual(self.maps.map_id, 1)
         self.assertFalse(self.maps._goto_completed)  # should reset after reaching
 
+    def test_wait_until_reach_pose_timeout(self):
+        self.mock_controller.subscribe.side_effect = None  # No pose ever arrives
+        self.maps._goal_x = 1.0
+        self.maps._goal_y = 2.0
+        self.maps._goal_angle = 90
+        self.maps.GOTO_POLL_MAX = 0.05
+
+        start = time.monotonic()
+        self.assertFalse(self.maps._wait_until_reach_pose(timeout=0.2))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.mock_controller.log_warning.assert_called_once()
+        self.mock_controller.subscribe.return_value.close.assert_called_once()
+
+    def test_goto_cancel(self):
+        self.mock_controller.subscribe.side_effect = None
+        self.maps._docked = False
+        threading.Timer(0.1, self.maps.cancel).start()
+
+        start = time.monotonic()
+        self.assertFalse(self.maps.goto(1.0, 2.0, 90, 0.3))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.mock_controller.log_warning.assert_not_called()
+
+    def test_goto_cancel_while_leaving_dock(self):
+        self.mock_controller.get_command_policy.return_value = CommandPolicy(deadline=0.6, retries=0, backoff=0.0, settle=0.2)
+        self.mock_controller.subscribe.side_effect = None
+        self.maps._docked = True
+        threading.Timer(0.05, self.maps.cancel).start()
+
+        start = time.monotonic()
+        self.assertFalse(self.maps.goto(1.0, 2.0, 90, 0.3, timeout=2.0))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_goto_polls_sparingly(self):
+        with HackerbotEmulator(latency=0.001, goto_duration=1.0) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            bot.base.maps._docked = False  # Skip the time to leave the dock
+            sent = len(emulator.received)
+            self.assertTrue(bot.base.maps.goto(1.0, 0.5, 0, 0.3, timeout=5.0))
+            # Backed off to GOTO_POLL_MAX instead of polling back to back
+            self.assertLess(emulator.received[sent:].count("B_POSE"), 12)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
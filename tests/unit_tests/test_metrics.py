@@ -0,0 +1,88 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the metrics endpoint.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+from hackerbot import Hackerbot
+from hackerbot.utils.emulator import HackerbotEmulator
+from hackerbot.utils.serial_helper import SerialHelper
+from hackerbot.utils.metrics import MetricsServer, render_metrics
+
+class TestMetrics(unittest.TestCase):
+
+    @patch('serial.Serial')
+    def test_render_serial_helper(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        helper = SerialHelper(port='/dev/MOCK_PORT')
+        helper.stop_read_thread()
+        helper.send_raw_command("PING")
+        helper._handle_rx_data(b'{"command": "ping", "success": "true"}\r\nnot json\r\n')
+
+        text = render_metrics(helper)
+        self.assertIn("# TYPE hackerbot_serial_bytes_sent_total counter\nhackerbot_serial_bytes_sent_total 6.0\n", text)
+        self.assertIn("\nhackerbot_serial_lines_total 2.0\n", text)
+        self.assertIn("\nhackerbot_serial_responses_total 1.0\n", text)
+        self.assertIn('hackerbot_command_latency_seconds_count{command="PING",phase="response"} 1.0\n', text)
+        self.assertIn('hackerbot_command_timeouts_total{command="PING"} 0.0\n', text)
+        self.assertNotIn("hackerbot_component_attached", text)  # Only HackerbotHelper knows the components
+        helper.disconnect_serial()
+
+    @patch('serial.Serial')
+    def test_label_escaping(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        helper = SerialHelper(port='/dev/MOCK_PORT')
+        helper._command_latency('SAY "hi"').timeouts += 1
+        self.assertIn('hackerbot_command_timeouts_total{command="SAY \\"hi\\""} 1.0', render_metrics(helper))
+        helper.disconnect_serial()
+
+    def test_hackerbot_metrics_endpoint(self):
+        with HackerbotEmulator(latency=0.001, attached={"arm_controller": False}) as emulator:
+            bot = Hackerbot(port=emulator.port, metrics_port=0)
+            port = bot._metrics_server.port
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=2) as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+                text = response.read().decode("utf-8")
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=2)
+            self.assertTrue(bot.destroy())
+
+        self.assertIn('hackerbot_component_attached{component="main_controller"} 1.0', text)
+        self.assertIn('hackerbot_component_attached{component="arm_controller"} 0.0', text)
+        self.assertIn('hackerbot_command_latency_seconds{command="PING",phase="response",quantile="0.99"}', text)
+        self.assertIn("\nhackerbot_errors_total 0.0\n", text)
+        self.assertIsNone(bot._metrics_server)
+        with self.assertRaises(OSError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=2)
+
+    @patch('serial.Serial')
+    def test_server_close(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        helper = SerialHelper(port='/dev/MOCK_PORT')
+        server = helper.start_metrics_server(0)
+        self.assertIsInstance(server, MetricsServer)
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/", timeout=2) as response:
+            self.assertEqual(response.status, 200)
+        helper.stop_metrics_server()
+        self.assertIsNone(helper._metrics_server)
+        with self.assertRaises(OSError):
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/", timeout=2)
+        helper.disconnect_serial()
+
+if __name__ == '__main__':
+    unittest.main()
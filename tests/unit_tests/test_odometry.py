@@ -0,0 +1,109 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the base odometry.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import math
+import unittest
+import numpy as np
+from hackerbot import Hackerbot
+from hackerbot.base.odometry import Odometry, integrate
+from hackerbot.utils.emulator import HackerbotEmulator
+
+def status(left, right):
+    return {"command": "status", "left_encoder": left, "right_encoder": right}
+
+class TestIntegrate(unittest.TestCase):
+
+    def test_straight_line(self):
+        ticks = np.arange(0, 1001, 10)
+        x, y, angle = integrate(ticks, ticks, wheel_base_mm=250, ticks_per_mm=1)
+        self.assertEqual(len(x), len(ticks))
+        self.assertAlmostEqual(x[-1], 1.0)
+        self.assertAlmostEqual(y[-1], 0.0)
+        self.assertAlmostEqual(angle[-1], 0.0)
+
+    def test_turn_in_place(self):
+        ticks = np.linspace(0, math.pi * 125, 50)  # Half the wheel base turning circle
+        x, y, angle = integrate(-ticks, ticks, wheel_base_mm=250, ticks_per_mm=1)
+        self.assertAlmostEqual(angle[-1], 180.0)
+        self.assertAlmostEqual(x[-1], 0.0)
+
+    def test_arc_is_exact(self):
+        # Left wheel on a 0.5 m radius quarter circle, right wheel on 0.75 m, center 0.625 m
+        steps = np.linspace(0, 1, 7)
+        left = steps * 500 * math.pi / 2
+        right = steps * 750 * math.pi / 2
+        x, y, angle = integrate(left * 2, right * 2, wheel_base_mm=250, ticks_per_mm=2, x=1.0, y=2.0, angle=0.0)
+        self.assertAlmostEqual(angle[-1], 90.0)
+        self.assertAlmostEqual(x[-1], 1.625)
+        self.assertAlmostEqual(y[-1], 2.625)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            integrate([0, 1], [0, 1, 2])
+        self.assertEqual(len(integrate([], [])[0]), 0)
+
+class TestOdometry(unittest.TestCase):
+
+    def test_matches_batch(self):
+        rng = np.random.default_rng(0)
+        left = np.cumsum(rng.uniform(0, 20, 200))
+        right = np.cumsum(rng.uniform(0, 20, 200))
+        odometry = Odometry(wheel_base_mm=250, ticks_per_mm=1)
+        odometry.reset(0.5, -0.5, 45)
+        self.assertFalse(odometry.update(status(left[0], right[0])))  # Reference only
+        for l, r in zip(left[1:], right[1:]):
+            self.assertTrue(odometry.update(status(l, r)))
+
+        x, y, angle = integrate(left, right, 250, 1, x=0.5, y=-0.5, angle=45)
+        pose = odometry.pose()
+        self.assertAlmostEqual(pose["x"], x[-1])
+        self.assertAlmostEqual(pose["y"], y[-1])
+        self.assertAlmostEqual(pose["angle"], angle[-1])
+        self.assertEqual(odometry.updates, 199)
+
+    def test_ignores_entries_without_encoders(self):
+        odometry = Odometry()
+        self.assertFalse(odometry.update({"command": "status"}))
+        self.assertFalse(odometry.update(status(None, 3)))
+        self.assertEqual(odometry.pose(), {"x": 0.0, "y": 0.0, "angle": 0.0})
+
+    def test_invalid_calibration(self):
+        with self.assertRaises(ValueError):
+            Odometry(wheel_base_mm=0)
+
+    def test_tracks_emulator_pose(self):
+        with HackerbotEmulator(latency=0.001, drive_duration=0.5) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            self.assertTrue(bot.base.start_odometry(emulator.WHEEL_BASE_MM, emulator.TICKS_PER_MM))
+            self.assertFalse(bot.base.start_odometry())  # Already running
+            bot.base.start_telemetry(rate=50)
+            bot.base._docked = False  # Skip the time to leave the dock
+            bot.base.drive(200, 40)
+            bot.base.stop_telemetry()
+
+            estimate = bot.base.odometry.pose()
+            pose = bot.base.maps.position()
+            self.assertGreater(pose["x"], 0.05)
+            self.assertAlmostEqual(estimate["x"], pose["x"], delta=0.01)
+            self.assertAlmostEqual(estimate["y"], pose["y"], delta=0.01)
+            self.assertAlmostEqual(estimate["angle"], pose["angle"], delta=2.0)
+            bot.base.stop_odometry()
+            self.assertIsNone(bot.base.odometry)
+
+if __name__ == '__main__':
+    unittest.main()
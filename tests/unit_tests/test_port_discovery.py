@@ -0,0 +1,114 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the serial port discovery.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from hackerbot.utils.port_discovery import (discover_port, load_port_cache, save_port_cache,
+                                            PortIdentity)
+
+BOARD = "adafruit:samd:adafruit_qt_py_m0"
+
+def mock_port(device, vid=0x239A, pid=0x80CB, serial_number="A1", description="USB Serial"):
+    port = MagicMock()
+    port.device = device
+    port.vid, port.pid, port.serial_number = vid, pid, serial_number
+    port.description = description  # Only matched when no port has the USB IDs
+    return port
+
+class TestPortDiscovery(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_path = os.path.join(tmp_dir.name, "hackerbot", "port_cache.json")
+
+    @patch('serial.tools.list_ports.comports')
+    def test_matches_on_usb_ids_and_caches(self, mock_comports):
+        mock_comports.return_value = [mock_port("/dev/ttyUSB0", vid=0x0403, pid=0x6001),
+                                      mock_port("/dev/ttyACM3")]
+        self.assertEqual(discover_port(BOARD, cache_path=self.cache_path), "/dev/ttyACM3")
+        self.assertEqual(load_port_cache(BOARD, self.cache_path),
+                         PortIdentity("/dev/ttyACM3", 0x239A, 0x80CB, "A1"))
+
+    @patch('serial.tools.list_ports.comports', return_value=[mock_port("/dev/ttyUSB0", vid=0x0403)])
+    def test_no_matching_port(self, mock_comports):
+        with self.assertRaises(ConnectionError):
+            discover_port(BOARD, cache_path=self.cache_path)
+        self.assertIsNone(load_port_cache(BOARD, self.cache_path))
+
+    @patch('serial.tools.list_ports.comports')
+    def test_description_fallback(self, mock_comports):
+        qt_py = mock_port("/dev/ttyACM5", vid=0x1234, pid=0x5678, description="Adafruit QT Py M0")
+        mock_comports.return_value = [qt_py, mock_port("/dev/ttyACM4", description="Adafruit QT Py M0")]
+        # USB IDs win over the description
+        self.assertEqual(discover_port(BOARD, cache_path=self.cache_path), "/dev/ttyACM4")
+
+        mock_comports.return_value = [mock_port("/dev/ttyUSB0", vid=0x0403), qt_py]
+        self.assertEqual(discover_port(BOARD, cache_path=None), "/dev/ttyACM5")
+        with self.assertRaises(ConnectionError):
+            discover_port(BOARD, serial_number="B2", cache_path=None)
+
+    @patch('serial.tools.list_ports.comports')
+    def test_unknown_board(self, mock_comports):
+        mock_comports.return_value = [mock_port("/dev/ttyACM0")]
+        with self.assertRaises(ConnectionError):
+            discover_port("arduino:avr:uno", cache_path=self.cache_path)
+        mock_comports.return_value = [mock_port("/dev/ttyACM0", description="QT Py")]
+        self.assertEqual(discover_port("arduino:avr:uno", cache_path=self.cache_path), "/dev/ttyACM0")
+        self.assertIsNone(load_port_cache("arduino:avr:uno", self.cache_path))
+
+    @patch('hackerbot.utils.port_discovery.port_identity')
+    @patch('serial.tools.list_ports.comports')
+    def test_cached_port_skips_enumeration(self, mock_comports, mock_identity):
+        save_port_cache(BOARD, PortIdentity("/dev/ttyACM0", 0x239A, 0x80CB, "A1"), self.cache_path)
+        mock_identity.return_value = PortIdentity("/dev/ttyACM0", 0x239A, 0x80CB, "A1")
+        self.assertEqual(discover_port(BOARD, cache_path=self.cache_path), "/dev/ttyACM0")
+        mock_identity.assert_called_once_with("/dev/ttyACM0")
+        mock_comports.assert_not_called()
+
+    @patch('hackerbot.utils.port_discovery.port_identity')
+    @patch('serial.tools.list_ports.comports')
+    def test_stale_cache_falls_back_to_enumeration(self, mock_comports, mock_identity):
+        save_port_cache(BOARD, PortIdentity("/dev/ttyACM0", 0x239A, 0x80CB, "A1"), self.cache_path)
+        # Another device now has the cached name, the board moved to ttyACM2
+        mock_identity.return_value = PortIdentity("/dev/ttyACM0", 0x0403, 0x6001, "X")
+        mock_comports.return_value = [mock_port("/dev/ttyACM1", serial_number="B2"),
+                                      mock_port("/dev/ttyACM2", serial_number="A1")]
+        self.assertEqual(discover_port(BOARD, cache_path=self.cache_path), "/dev/ttyACM2")
+        self.assertEqual(load_port_cache(BOARD, self.cache_path).device, "/dev/ttyACM2")
+
+    @patch('serial.tools.list_ports.comports')
+    def test_serial_number(self, mock_comports):
+        mock_comports.return_value = [mock_port("/dev/ttyACM1", serial_number="A1"),
+                                      mock_port("/dev/ttyACM2", serial_number="B2")]
+        self.assertEqual(discover_port(BOARD, serial_number="B2", cache_path=None), "/dev/ttyACM2")
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_corrupt_cache_is_ignored(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as f:
+            f.write("{not json")
+        self.assertIsNone(load_port_cache(BOARD, self.cache_path))
+        save_port_cache(BOARD, PortIdentity("/dev/ttyACM0", 0x239A, 0x80CB, None), self.cache_path)
+        with open(self.cache_path) as f:
+            self.assertEqual(json.load(f)[BOARD]["device"], "/dev/ttyACM0")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,10 +18,23 @@
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
 import serial
+import json
 import time
+import threading
+import tempfile
+import os
 from hackerbot.utils.serial_helper import SerialHelper
+from hackerbot.utils.serial_recorder import read_recording, TX, RX
 
 class TestSerialHelper(unittest.TestCase):
+
+    def setUp(self):
+        # Keep auto-detected ports out of the user's port cache
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        cache_patcher = patch.object(SerialHelper, 'PORT_CACHE_PATH', os.path.join(tmp_dir.name, "port_cache.json"))
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
     
 #### INITIALIZATION TESTS
     @patch('serial.Serial')
@@ -54,7 +67,7 @@ class TestSerialHelper(unittest.TestCase):
         mock_port = MagicMock()
         mock_port.device = 'MOCK_PORT'
         mock_port.name = 'MOCK_PORT'
-        mock_port.description = "QT Py"
+        mock_port.vid, mock_port.pid, mock_port.serial_number = 0x239A, 0x80CB, "MOCK_SERIAL"
 
         # Set mock_comports to return a list containing the mock port
         mock_comports.return_value = [mock_port]
@@ -68,6 +81,15 @@ class TestSerialHelper(unittest.TestCase):
             # Assert that the correct port is returned
             self.assertEqual(port, 'MOCK_PORT')
 
+    @patch('hackerbot.utils.serial_helper.discover_port', return_value='/dev/ttyACM2')
+    def test_find_port_serial_number(self, mock_discover):
+        with patch('serial.Serial') as mock_serial:
+            mock_serial.return_value.is_open = True
+            controller = SerialHelper(serial_number="B2")
+            self.assertEqual(controller.port, '/dev/ttyACM2')
+            mock_discover.assert_called_with(controller.board, "B2", cache_path=SerialHelper.PORT_CACHE_PATH)
+            controller.disconnect_serial()
+
 
 ##### COMMAND TESTS
 
@@ -87,16 +109,167 @@ class TestSerialHelper(unittest.TestCase):
         with self.assertRaises(ConnectionError):
             controller.send_raw_command("PING")
 
+    @patch('serial.Serial')
+    def test_write_thread_coalesces_and_prioritizes(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        release = threading.Event()
+        writes = []
+        def write(data):
+            writes.append(data)
+            if len(writes) == 1:
+                release.wait(1)  # Hold the writer so the next commands queue up
+        mock_serial.return_value.write = MagicMock(side_effect=write)
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+
+        senders = [threading.Thread(target=controller.send_raw_command, args=(command,))
+                   for command in ("H_IDLE, 1", "B_DRIVE,100,0", "H_LOOK, 180, 200, 50")]
+        senders[0].start()
+        time.sleep(0.05)
+        for sender in senders[1:]:
+            sender.start()
+        time.sleep(0.05)
+        killer = threading.Thread(target=controller.send_raw_command, args=("B_KILL",))
+        killer.start()
+        time.sleep(0.05)
+        release.set()
+        for sender in senders + [killer]:
+            sender.join()
+
+        self.assertEqual(writes[0], b'H_IDLE, 1\r\n')
+        self.assertEqual(len(writes), 2)
+        self.assertTrue(writes[1].startswith(b'B_KILL\r\n'))
+        self.assertIn(b'B_DRIVE,100,0\r\n', writes[1])
+        self.assertIn(b'H_LOOK, 180, 200, 50\r\n', writes[1])
+
+    @patch('serial.Serial')
+    def test_write_latency_recorded(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.send_raw_command("B_DRIVE,100,0")
+        controller.send_raw_command("B_DRIVE,0,0")
+        latency = controller.get_write_latency()
+        self.assertEqual(latency["B_DRIVE"]["count"], 2)
+        self.assertGreaterEqual(latency["B_DRIVE"]["max"], latency["B_DRIVE"]["mean"])
+
+    @patch('serial.Serial')
+    def test_latency_stats(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        controller.send_raw_command("PING")
+        controller._handle_rx_data(b'{"command": "ping", "success": "true"}\r\n')
+        stats = controller.get_latency_stats("PING")
+        self.assertEqual(stats["write"]["count"], 1)
+        self.assertEqual(stats["first_byte"]["count"], 1)
+        self.assertEqual(stats["response"]["count"], 1)
+        self.assertGreaterEqual(stats["response"]["p99"], stats["write"]["max"])
+
+        with self.assertRaises(TimeoutError):
+            controller.send_command_and_wait("B_STATUS", "status", timeout=0.05)
+        controller.send_raw_command("B_MAPDATA,7")
+        controller._handle_rx_data(b'{"command": "mapdata", "success": "false"}\r\n')
+        with self.assertRaises(Exception):
+            controller.get_json_from_command("mapdata")
+        self.assertEqual(controller.get_latency_stats("B_STATUS")["timeouts"], 1)
+        self.assertEqual(controller.get_latency_stats("B_MAPDATA")["failures"], 1)
+        self.assertEqual(set(controller.get_latency_stats()), {"PING", "B_STATUS", "B_MAPDATA"})
+
+        # Bytes after a command without a response are not its first byte
+        controller.send_raw_command("H_LOOK, 180, 180, 70")
+        controller._handle_rx_data(b'{"command": "status", "left_speed": 0}\r\n')
+        self.assertEqual(controller.get_latency_stats("H_LOOK")["first_byte"]["count"], 0)
+
+        controller.send_raw_command("PING")
+        controller.reset_latency_stats()
+        self.assertEqual(controller.get_latency_stats(), {})
+        self.assertIsNone(controller.get_latency_stats("PING"))
+        self.assertEqual(controller._inflight, {})
+        # The response to a command sent before the reset is not counted
+        controller._handle_rx_data(b'{"command": "ping", "success": "true"}\r\n')
+        self.assertIsNone(controller.get_latency_stats("PING"))
+
+    @patch('serial.Serial')
+    def test_counters(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+        controller.MAX_LINE_SIZE = 64
+
+        controller.send_raw_command("PING")
+        controller._handle_rx_data(b'{"command": "ping", "success": "true"}\r\n{"command": "status", broken}\r\n')
+        controller.get_latest_response("status")
+        controller._handle_rx_data(b"x" * 100)
+        controller._register_waiter("pose")
+
+        counters = controller.get_counters()
+        self.assertEqual(counters["bytes_out"], 6)
+        self.assertEqual(counters["bytes_in"], 171)
+        self.assertEqual(counters["lines"], 2)
+        self.assertEqual(counters["responses"], 2)
+        self.assertEqual(counters["decode_failures"], 1)
+        self.assertEqual(counters["dropped_frames"], 1)
+        self.assertEqual(counters["write_queue_depth"], 0)
+        self.assertEqual(counters["pending_responses"], 1)
+        self.assertEqual(counters["reconnects"], 0)
+
+    @patch('serial.Serial')
+    def test_malformed_line_counted_once(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        controller._handle_rx_data(b'{"command": "status", broken}\r\n')
+        self.assertIsNone(controller.get_latest_response("status"))
+        self.assertIsNone(controller.get_latest_response("status"))
+        self.assertEqual(controller.get_counters()["decode_failures"], 1)
+
+    @patch('serial.Serial')
+    def test_send_raw_command_write_error(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        mock_serial.return_value.write = MagicMock(side_effect=serial.SerialException("write failed"))
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        with self.assertRaises(IOError):
+            controller.send_raw_command("PING")
+
 ##### JSON TESTS
 
     @patch("serial.Serial", autospec=True)  # Mock Serial to prevent real connection
     def test_get_json_from_command_found(self, mock_serial):
         controller = SerialHelper(port="/dev/MOCK_PORT")
 
-        controller.json_entries.append({"command": "TEST", "success": "true"})
+        controller._store_response("TEST", {"command": "TEST", "success": "true"})
         result = controller.get_json_from_command("TEST")
         self.assertEqual(result, {"command": "TEST", "success": "true"})
 
+    @patch("serial.Serial", autospec=True)  # Mock Serial to prevent real connection
+    def test_get_json_from_command_newer_than(self, mock_serial):
+        controller = SerialHelper(port="/dev/MOCK_PORT")
+        controller._store_response("status", {"command": "status", "success": "true", "left_speed": 0})
+        seq = controller.get_response_seq()
+
+        # The stale entry is not returned once the caller asks for something newer
+        with self.assertRaises(Exception):
+            controller.get_json_from_command("status", newer_than=seq, timeout=0.05)
+
+        threading.Timer(0.05, controller._store_response,
+                        args=("status", {"command": "status", "success": "true", "left_speed": 10})).start()
+        result = controller.get_json_from_command("status", newer_than=seq, timeout=1)
+        self.assertEqual(result["left_speed"], 10)
+
+    @patch("serial.Serial", autospec=True)  # Mock Serial to prevent real connection
+    def test_latest_response_survives_telemetry(self, mock_serial):
+        controller = SerialHelper(port="/dev/MOCK_PORT")
+        controller._store_response("pose", {"command": "pose", "success": "true"})
+        for _ in range(100):
+            controller._store_response("status", {"command": "status", "success": "true"})
+
+        pose = controller.get_latest_response("pose")
+        self.assertEqual(pose.seq, 1)
+        self.assertEqual(pose.entry, {"command": "pose", "success": "true"})
+        self.assertEqual(controller.get_latest_response("status").seq, 101)
+        self.assertIsNone(controller.get_latest_response("maplist"))
+
     @patch("serial.Serial", autospec=True)  # Mock Serial to prevent real connection
     def test_get_json_from_command_not_found(self, mock_serial):
         controller = SerialHelper(port="/dev/MOCK_PORT")
@@ -109,7 +282,136 @@ class TestSerialHelper(unittest.TestCase):
         with self.assertRaises(ValueError):
             controller.get_json_from_command()
 
-##### STATE AND ERROR TESTS 
+##### RESPONSE WAITER TESTS
+
+    @patch('serial.Serial')
+    def test_send_command_and_wait_resolved_by_reader(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        def reply(data):
+            controller._resolve_waiter({"command": "ping", "success": "true"})
+        mock_serial.return_value.write = MagicMock(side_effect=reply)
+
+        result = controller.send_command_and_wait("PING", "ping", timeout=1)
+        self.assertEqual(result, {"command": "ping", "success": "true"})
+        self.assertEqual(controller._waiters, {})
+
+    @patch('serial.Serial')
+    def test_send_command_and_wait_timeout(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+        with self.assertRaises(TimeoutError):
+            controller.send_command_and_wait("PING", "ping", timeout=0.05)
+        self.assertEqual(controller._waiters, {})
+
+    @patch('serial.Serial')
+    def test_send_command_and_wait_retries(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+        writes = []
+
+        def reply(data):
+            writes.append(data)
+            if len(writes) == 3:
+                controller._resolve_waiter({"command": "ping", "success": "true"})
+        mock_serial.return_value.write = MagicMock(side_effect=reply)
+
+        controller.set_command_policy("PING", deadline=0.02, retries=2, backoff=0.01)
+        self.assertEqual(controller.send_command_and_wait("PING", "ping")["success"], "true")
+        self.assertEqual(writes, [b"PING\r\n"] * 3)
+
+        writes.clear()
+        with self.assertRaises(TimeoutError):
+            controller.send_command_and_wait("PING", "ping", retries=1)
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(controller.get_latency_stats("PING")["timeouts"], 1)
+        self.assertEqual(controller._waiters, {})
+
+    @patch('serial.Serial')
+    def test_command_policies(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        self.assertEqual(controller.get_command_policy("B_MAPDATA,1").deadline, 8.0)
+        self.assertEqual(controller.get_command_policy("H_LOOK").deadline, controller.RESPONSE_TIMEOUT)
+        self.assertEqual(controller.get_command_policy("H_LOOK").retries, 0)
+
+        policy = controller.set_command_policy("B_MAPDATA", deadline=0.05)
+        self.assertEqual((policy.deadline, policy.retries), (0.05, 1))
+        with self.assertRaises(ValueError):
+            controller.set_command_policy("B_MAPDATA", retries=-1)
+
+        # get_json_from_command waits the deadline of the command last sent for the response
+        controller.send_raw_command("B_MAPDATA,1")
+        start = time.monotonic()
+        with self.assertRaises(Exception):
+            controller.get_json_from_command("mapdata")
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    @patch('serial.Serial')
+    def test_send_command_and_wait_failed_response(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        def reply(data):
+            controller._resolve_waiter({"command": "ping", "success": "false"})
+        mock_serial.return_value.write = MagicMock(side_effect=reply)
+
+        with self.assertRaises(Exception) as cm:
+            controller.send_command_and_wait("PING", "ping", timeout=1)
+        self.assertIn("Fail to fetch", str(cm.exception))
+
+    @patch('serial.Serial')
+    def test_send_command_batch_single_write(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        futures = controller.send_command_batch([("B_STATUS", "status"), ("PING", "ping"), ("B_STATUS", "status")])
+        mock_serial.return_value.write.assert_called_once_with(b'B_STATUS\r\nPING\r\nB_STATUS\r\n')
+
+        controller._resolve_waiter({"command": "status", "success": "true", "seq": 1})
+        controller._resolve_waiter({"command": "ping", "success": "true"})
+        controller._resolve_waiter({"command": "status", "success": "true", "seq": 2})
+        self.assertEqual(futures[0].result(timeout=1)["seq"], 1)
+        self.assertEqual(futures[1].result(timeout=1)["command"], "ping")
+        self.assertEqual(futures[2].result(timeout=1)["seq"], 2)
+        self.assertEqual(controller.get_state(), "B_STATUS")
+
+    @patch('serial.Serial')
+    def test_send_command_batch_skips_cancelled_waiter(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        stale, fresh = controller.send_command_batch([("PING", "ping"), ("PING", "ping")])
+        stale.cancel()
+        controller._resolve_waiter({"command": "ping", "success": "true"})
+        self.assertTrue(fresh.done())
+
+    @patch('serial.Serial')
+    def test_send_commands_and_wait(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+
+        def reply(data):
+            controller._resolve_waiter({"command": "pose", "success": "true"})
+            controller._resolve_waiter({"command": "ping", "success": "true"})
+        mock_serial.return_value.write = MagicMock(side_effect=reply)
+
+        pose, ping = controller.send_commands_and_wait([("B_POSE", "pose"), ("PING", "ping")], timeout=1)
+        self.assertEqual(pose["command"], "pose")
+        self.assertEqual(ping["command"], "ping")
+        self.assertEqual(controller._waiters, {})
+
+##### STATE AND ERROR TESTS
     @patch("serial.Serial", autospec=True)  # Mock Serial to prevent real connection
     def test_get_state(self, mock_serial):
         controller = SerialHelper(port="/dev/MOCK_PORT")
@@ -142,7 +444,7 @@ class TestSerialHelper(unittest.TestCase):
         # Mock serial port behavior
         mock_serial.return_value.is_open = True
         mock_serial.return_value.in_waiting = 1
-        mock_serial.return_value.readline = MagicMock(return_value=b'{"command": "MOVE", "success": "true"}\n')
+        mock_serial.return_value.read = MagicMock(return_value=b'{"command": "MOVE", "success": "true"}\n')
 
         # Create controller instance
         controller = SerialHelper(port='/dev/ttyUSB0')
@@ -152,12 +454,97 @@ class TestSerialHelper(unittest.TestCase):
 
         # Verify JSON was parsed and stored
         expected_entry = {"command": "MOVE", "success": "true"}
-        self.assertIn(expected_entry, controller.json_entries)
+        self.assertEqual(controller.get_latest_response("MOVE").entry, expected_entry)
 
         # Verify log file write
         # mock_file().write.assert_called_with('{"command": "MOVE", "success": "true"}\n')
 
     
+    # Test that lines split across reads are joined before being parsed.
+    @patch('serial.Serial')
+    def test_read_serial_joins_partial_lines(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/ttyUSB0')
+        controller.stop_read_thread()
+        controller._responses.clear()
+
+        chunks = iter([b'{"command": "MOVE", ', b'', b'"success": "true"}\r\n{"command": "PI', b'NG", "success": "true"}\n'])
+        def read(size):
+            try:
+                return next(chunks)
+            except StopIteration:
+                controller.read_thread_stop_event.set()
+                return b''
+        mock_serial.return_value.in_waiting = 0
+        mock_serial.return_value.read = MagicMock(side_effect=read)
+        controller.read_thread_stop_event.clear()
+        controller.read_serial()
+
+        self.assertEqual(controller.get_latest_response("MOVE").entry, {"command": "MOVE", "success": "true"})
+        self.assertEqual(controller.get_latest_response("PING").entry, {"command": "PING", "success": "true"})
+        self.assertEqual(controller._rx_buffer, bytearray())
+
+    # Test that blank lines, invalid JSON and entries without a command are skipped.
+    @patch('serial.Serial')
+    def test_handle_rx_data_skips_non_command_lines(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/ttyUSB0')
+        controller.stop_read_thread()
+
+        controller._handle_rx_data(b'\r\n\nBooting...\r\n[1, 2]\r\n{"success": "true"}\r\n{"command": "ping", "success": "true"}\r\n{"comm')
+        self.assertEqual(controller.get_response_seq(), 1)
+        self.assertEqual(controller._rx_buffer, bytearray(b'{"comm'))
+
+    # Test that lines nobody waits for are indexed raw and only decoded when looked up.
+    @patch('serial.Serial')
+    def test_handle_line_defers_decoding(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/ttyUSB0')
+        controller.stop_read_thread()
+        decoder = MagicMock(side_effect=json.loads)
+        controller.set_json_decoder(decoder)
+
+        controller._handle_rx_data(b'{"command": "status", "success": "true", "left_speed": 1}\r\n' * 50)
+        decoder.assert_not_called()
+        self.assertEqual(controller.get_response_seq(), 50)
+
+        self.assertEqual(controller.get_json_from_command("status")["left_speed"], 1)
+        self.assertEqual(controller.get_json_from_command("status")["left_speed"], 1)
+        decoder.assert_called_once()
+
+    # Test that a line with a waiter is decoded immediately and resolves the waiter.
+    @patch('serial.Serial')
+    def test_handle_line_decodes_for_waiter(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/ttyUSB0')
+        controller.stop_read_thread()
+
+        future = controller._register_waiter("pose")
+        controller._handle_rx_data(b'{"command": "pose", "success": "true", "pose_x": 1.5}\r\n')
+        self.assertEqual(future.result(timeout=1)["pose_x"], 1.5)
+        self.assertIsInstance(controller._responses["pose"].entry, dict)
+
+    @patch('serial.Serial')
+    def test_extract_command(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/ttyUSB0')
+        controller.stop_read_thread()
+
+        self.assertEqual(controller._extract_command(b'{"command":"ping","success":"true"}'), "ping")
+        self.assertEqual(controller._extract_command(b'{"success": "true", "command" : "status"}\r'), "status")
+        self.assertIsNone(controller._extract_command(b'{"success": "true"}'))
+        self.assertIsNone(controller._extract_command(b'{"command": 5, "x": "y"}'))
+        self.assertIsNone(controller._extract_command(b'{"command": ""}'))
+
+    @patch('serial.Serial')
+    def test_set_json_decoder(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/ttyUSB0')
+        controller.set_json_decoder("json")
+        self.assertIs(controller._json_loads, json.loads)
+        with self.assertRaises(ValueError):
+            controller.set_json_decoder("simdjson-nonexistent")
+
     # Test that the read_serial method sets the correct error message when it has insufficient permissions to write to the log file.
     @patch('os.access', return_value=False)
     @patch('serial.Serial', autospec=True)
@@ -173,6 +560,92 @@ class TestSerialHelper(unittest.TestCase):
         # Now check if the permission error message was set
         self.assertIn("read error", controller.get_ser_error())
 
+##### RECONNECT TESTS
+
+    @patch('serial.Serial')
+    def test_reconnect_after_link_drop(self, mock_serial):
+        dead_port = MagicMock()
+        dead_port.is_open = True
+        dead_port.in_waiting = 0
+        dropped = threading.Event()
+        def read(size):
+            dropped.wait(1)
+            raise serial.SerialException("device disconnected")
+        dead_port.read = MagicMock(side_effect=read)
+
+        new_port = MagicMock()
+        new_port.is_open = True
+        new_port.in_waiting = 0
+        new_port.read = MagicMock(side_effect=lambda size: time.sleep(0.01) or b'')
+        mock_serial.side_effect = [dead_port, serial.SerialException("not back yet"), new_port]
+
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.RECONNECT_BACKOFF = 0.01
+        restored = threading.Event()
+        controller._on_reconnect = restored.set
+        in_flight = controller._register_waiter("ping")
+        dropped.set()
+
+        self.assertTrue(restored.wait(2))
+        with self.assertRaises(ConnectionError):
+            in_flight.result(timeout=1)
+        self.assertIs(controller.ser, new_port)
+        dead_port.close.assert_called_once()
+        stats = controller.get_reconnect_stats()
+        self.assertEqual(stats["count"], 1)
+        self.assertGreater(stats["last_duration"], 0)
+        self.assertIsNone(controller.get_ser_error())
+        controller.disconnect_serial()
+
+    @patch('serial.tools.list_ports.comports')
+    @patch('serial.Serial')
+    def test_reconnect_reruns_find_port(self, mock_serial, mock_comports):
+        mock_port = MagicMock()
+        mock_port.device = '/dev/ttyACM1'
+        mock_port.vid, mock_port.pid, mock_port.serial_number = 0x239A, 0x80CB, "MOCK_SERIAL"
+        mock_comports.return_value = [mock_port]
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper()
+        controller.stop_read_thread()
+        controller.read_thread_stop_event.clear()
+        controller._on_reconnect = MagicMock()
+
+        mock_port.device = '/dev/ttyACM2'  # Re-enumerated under a new name
+        controller._reconnect(serial.SerialException("device disconnected"))
+        self.assertEqual(controller.port, '/dev/ttyACM2')
+        mock_serial.assert_called_with(port='/dev/ttyACM2', baudrate=230400, timeout=controller.READ_TIMEOUT)
+
+    @patch('serial.Serial')
+    def test_disconnect_fails_pending_waiters(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        future = controller._register_waiter("status")
+        controller.disconnect_serial()
+        with self.assertRaises(ConnectionError):
+            future.result(timeout=1)
+
+##### RECORDING TESTS
+
+    @patch('serial.Serial')
+    def test_recording_captures_tx_and_rx(self, mock_serial):
+        mock_serial.return_value.is_open = True
+        controller = SerialHelper(port='/dev/MOCK_PORT')
+        controller.stop_read_thread()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "serial.bin")
+            controller.start_recording(path)
+            controller.send_raw_command("PING")
+            controller._handle_rx_data(b'{"command": "ping", "success": "true"}\r\n')
+            controller.disconnect_serial()
+
+            frames = list(read_recording(path))
+            self.assertEqual([(frame.direction, frame.data) for frame in frames], [
+                (TX, b"PING\r\n"),
+                (RX, b'{"command": "ping", "success": "true"}\r\n'),
+            ])
+            self.assertLessEqual(frames[0].timestamp_ns, frames[1].timestamp_ns)
+            self.assertIsNone(controller._recorder)
+
 ##### THREAD TESTS
     
     @patch('serial.Serial')
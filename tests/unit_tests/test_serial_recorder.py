@@ -0,0 +1,90 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the SerialRecorder class.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import tempfile
+import unittest
+from hackerbot.utils.serial_recorder import SerialRecorder, read_recording, recording_files, TX, RX, FILE_MAGIC
+
+class TestSerialRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "logs", "serial.bin")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_record_and_read_back(self):
+        recorder = SerialRecorder(self.path)
+        recorder.record(TX, 100, b"PING\r\n")
+        recorder.record(RX, 250, b'{"command": "ping"}\r\n')
+        recorder.close()
+
+        frames = list(read_recording(self.path))
+        self.assertEqual(frames[0], (TX, 100, b"PING\r\n"))
+        self.assertEqual(frames[1], (RX, 250, b'{"command": "ping"}\r\n'))
+        self.assertEqual(recorder.written, 2)
+
+    def test_appends_to_existing_recording(self):
+        for timestamp in (1, 2):
+            recorder = SerialRecorder(self.path)
+            recorder.record(TX, timestamp, b"B_STATUS\r\n")
+            recorder.close()
+        self.assertEqual([frame.timestamp_ns for frame in read_recording(self.path)], [1, 2])
+
+    def test_rotation(self):
+        recorder = SerialRecorder(self.path, max_bytes=len(FILE_MAGIC) + 2 * (13 + 10), backup_count=2)
+        for timestamp in range(7):
+            recorder.record(RX, timestamp, b"0123456789")
+        recorder.close()
+
+        files = recording_files(self.path)
+        self.assertEqual(files, [self.path + ".2", self.path + ".1", self.path])
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        for file in files:
+            self.assertLessEqual(os.path.getsize(file), recorder.max_bytes)
+        timestamps = [frame.timestamp_ns for file in files for frame in read_recording(file)]
+        self.assertEqual(timestamps, [2, 3, 4, 5, 6])  # The oldest file was rotated out
+
+    def test_drops_when_queue_full(self):
+        recorder = SerialRecorder(self.path)
+        recorder.MAX_PENDING = 1
+        recorder.record(TX, 1, b"A")
+        recorder.record(TX, 2, b"B")
+        recorder.close()
+        self.assertEqual(recorder.dropped, 1)
+        self.assertEqual(len(list(read_recording(self.path))), 1)
+
+    def test_truncated_record_ignored(self):
+        recorder = SerialRecorder(self.path)
+        recorder.record(RX, 1, b"complete\r\n")
+        recorder.record(RX, 2, b"cut short\r\n")
+        recorder.close()
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 3)
+        self.assertEqual([frame.data for frame in read_recording(self.path)], [b"complete\r\n"])
+
+    def test_read_rejects_other_files(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as file:
+            file.write("not a recording")
+        with self.assertRaises(ValueError):
+            list(read_recording(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
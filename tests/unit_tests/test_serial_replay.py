@@ -0,0 +1,169 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the session replay engine.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import json
+import time
+import tempfile
+import unittest
+from hackerbot import Hackerbot
+from hackerbot.utils.emulator import HackerbotEmulator
+from hackerbot.utils.serial_helper import SerialHelper
+from hackerbot.utils.serial_recorder import Frame, TX, RX
+from hackerbot.utils.serial_replay import SessionReplay, ReplayTransport
+
+MS = 1000000 # Nanoseconds per millisecond
+
+class RecordedHackerbot(Hackerbot):
+    """Hackerbot recording from the moment its port is open, so the setup handshake is captured."""
+    recording_path = None
+
+    def _open_port(self, port):
+        ser = super()._open_port(port)
+        self.start_recording(self.recording_path)
+        return ser
+
+def session():
+    return [
+        Frame(RX, 0, b'{"command": "status", "success": "true", "left_encoder": 1}\r\n'),
+        Frame(TX, 10 * MS, b"PING\r\n"),
+        Frame(RX, 110 * MS, b'{"command": "ping", "success": "true", "main_controller": "attached"}\r\n'),
+        Frame(RX, 120 * MS, b'{"command": "status", "success": "true", "left_encoder": 2}\r\n'),
+    ]
+
+class TestSessionReplay(unittest.TestCase):
+
+    def test_invalid_timing(self):
+        with self.assertRaises(ValueError):
+            ReplayTransport(session(), timing="slow")
+
+    def test_invalid_speed(self):
+        for speed in (0, -1.0):
+            with self.assertRaises(ValueError):
+                ReplayTransport(session(), speed=speed)
+            with self.assertRaises(ValueError):
+                SessionReplay(session(), speed=speed)
+
+    def test_responses_wait_for_commands(self):
+        replay = SessionReplay(session(), timing="fast")
+        helper = SerialHelper(port=replay.transport)
+        time.sleep(0.05)
+        self.assertIsNotNone(helper.get_latest_response("status"))
+        self.assertIsNone(helper.get_latest_response("ping"))  # Held until PING is sent
+
+        response = helper.send_command_and_wait("PING", "ping", timeout=1)
+        self.assertEqual(response["main_controller"], "attached")
+        self.assertTrue(replay.wait(1))
+
+        report = replay.report(helper)
+        self.assertEqual(report["responses_expected"], 3)
+        self.assertEqual(report["responses_parsed"], 3)
+        self.assertEqual(report["rx_lines"], 3)
+        self.assertEqual(report["tx_divergences"], [])
+        self.assertEqual(report["response_divergences"], [])
+        self.assertEqual(report["gate_timeouts"], 0)
+        helper.disconnect_serial()
+
+    def test_original_timing(self):
+        replay = SessionReplay(session(), timing="original", speed=2.0)
+        helper = SerialHelper(port=replay.transport)
+        start = time.monotonic()
+        helper.send_command_and_wait("PING", "ping", timeout=1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)  # 100 ms recorded gap at 2x speed
+        helper.disconnect_serial()
+
+    def test_ungated_original_timing(self):
+        frames = []
+        for i in range(3):
+            frames.append(Frame(TX, i * 1000 * MS, b"B_STATUS\r\n"))
+            frames.append(Frame(RX, i * 1000 * MS + (100 if i == 2 else 50) * MS,
+                                b'{"command": "status", "left_encoder": %d}\r\n' % i))
+        transport = ReplayTransport(frames, timing="original", speed=4.0, gate_on_tx=False, timeout=2.0)
+        start = time.monotonic()
+        arrivals = []
+        for _ in range(3):
+            transport.read(1024)
+            arrivals.append(time.monotonic() - start)
+        # Recorded at 0.05, 1.05 and 2.1 s, played at 4x speed
+        for arrival, expected in zip(arrivals, (0.0125, 0.2625, 0.525)):
+            self.assertAlmostEqual(arrival, expected, delta=0.05)
+        transport.close()
+
+    def test_divergence_reported(self):
+        replay = SessionReplay(session(), timing="fast")
+        replay.transport.GATE_TIMEOUT = 0.05
+        helper = SerialHelper(port=replay.transport)
+        helper.send_raw_command("ID")  # Fewer bytes than PING, so the ping response stays gated
+        self.assertTrue(replay.wait(1))
+
+        report = replay.report(helper)
+        self.assertEqual(report["tx_divergences"], [{"index": 0, "expected": "PING", "observed": "ID"}])
+        self.assertEqual(report["gate_timeouts"], 1)
+        helper.disconnect_serial()
+
+    def test_earlier_response_divergence_reported(self):
+        frames = session()
+        replay = SessionReplay(frames, timing="fast", gate_on_tx=False)
+        # The helper sees a different first status, the last one per command still matches
+        replay.expected_responses[0] = dict(replay.expected_responses[0], left_encoder=0)
+        helper = SerialHelper(port=replay.transport)
+        self.assertTrue(replay.wait(1))
+
+        report = replay.report(helper)
+        self.assertEqual(report["response_divergences"], [{
+            "index": 0,
+            "expected": {"command": "status", "success": "true", "left_encoder": 0},
+            "observed": {"command": "status", "success": "true", "left_encoder": 1},
+        }])
+        helper.disconnect_serial()
+
+    def test_ungated_throughput(self):
+        frames = [Frame(RX, i * MS, b'{"command": "status", "success": "true", "left_encoder": %d}\r\n' % i)
+                  for i in range(1000)]
+        replay = SessionReplay(frames, timing="fast", gate_on_tx=False)
+        helper = SerialHelper(port=replay.transport)
+        self.assertTrue(replay.wait(5))
+
+        report = replay.report(helper)
+        self.assertEqual(report["responses_parsed"], 1000)
+        self.assertGreater(report["lines_per_second"], 0)
+        self.assertEqual(report["response_divergences"], [])
+        helper.disconnect_serial()
+
+    def test_replay_recorded_hackerbot_session(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "serial.bin")
+            with HackerbotEmulator(latency=0.001, attached={"arm_controller": False}) as emulator:
+                RecordedHackerbot.recording_path = path
+                bot = RecordedHackerbot(port=emulator.port)
+                recorded = (bot.core.ping(), bot.base.maps.position(), bot.base.maps.list())
+                bot.disconnect_serial()
+
+            replay = SessionReplay(path, timing="fast")
+            bot = Hackerbot(port=replay.transport)
+            replayed = (bot.core.ping(), bot.base.maps.position(), bot.base.maps.list())
+            self.assertTrue(replay.wait(1))
+            report = replay.report(bot)
+            bot.disconnect_serial()
+
+        self.assertEqual(replayed, recorded)
+        self.assertFalse(json.loads(replayed[0])["arm_control_attached"])
+        self.assertEqual(report["tx_divergences"], [])
+        self.assertEqual(report["response_divergences"], [])
+
+if __name__ == '__main__':
+    unittest.main()
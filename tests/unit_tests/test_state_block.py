@@ -0,0 +1,128 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the shared-memory state block.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import math
+import time
+import tempfile
+import threading
+import unittest
+from hackerbot.utils.state_block import StateBlockWriter, StateBlockReader, STATUS_FIELDS, HEADER
+from hackerbot.utils.serial_helper import SerialHelper
+from hackerbot.utils.emulator import HackerbotEmulator
+
+class TestStateBlock(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "state")
+
+    def test_publish_and_read(self):
+        writer = StateBlockWriter(self.path)
+        with StateBlockReader(self.path) as reader:
+            self.assertEqual(reader.read(), {"seq": 0, "status": None, "pose": None, "components": None})
+
+            writer.update_status({"command": "status", "left_encoder": 10, "right_encoder": 12, "wall_tof": None})
+            writer.update_pose({"command": "pose", "map_id": 2, "pose_x": 1.5, "pose_y": -0.5, "pose_angle": 90})
+            writer.update_components({"command": "ping", "main_controller": "attached", "arm_controller": "not attached"})
+
+            snapshot = reader.read()
+            self.assertEqual(snapshot["seq"], 6)
+            self.assertEqual(snapshot["status"]["left_encoder"], 10.0)
+            self.assertEqual(snapshot["status"]["right_encoder"], 12.0)
+            self.assertTrue(math.isnan(snapshot["status"]["wall_tof"]))
+            self.assertEqual(snapshot["pose"]["map_id"], 2)
+            self.assertEqual((snapshot["pose"]["x"], snapshot["pose"]["y"], snapshot["pose"]["angle"]), (1.5, -0.5, 90.0))
+            self.assertTrue(snapshot["components"]["main_controller"])
+            self.assertFalse(snapshot["components"]["arm_controller"])
+            self.assertLessEqual(snapshot["status"]["updated"], time.time())
+
+        writer.close()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_not_a_state_block(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 4096)
+        with self.assertRaises(ValueError):
+            StateBlockReader(self.path)
+
+    def test_snapshots_are_consistent(self):
+        writer = StateBlockWriter(self.path)
+        self.addCleanup(writer.close)
+        stop = threading.Event()
+
+        def publish():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                writer.update_status({field: i for field in STATUS_FIELDS})
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        try:
+            with StateBlockReader(self.path) as reader:
+                for _ in range(2000):
+                    status = reader.read()["status"]
+                    if status is not None:
+                        self.assertEqual(len({status[field] for field in STATUS_FIELDS}), 1)
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_torn_payload_is_retried(self):
+        writer = StateBlockWriter(self.path)
+        self.addCleanup(writer.close)
+        writer.update_status({"left_encoder": 1})
+        with open(self.path, "r+b") as f:
+            f.seek(HEADER.size + 8)
+            f.write(b"\xff" * 8)  # Payload changed under an even sequence number, as a reordered store would
+
+        with StateBlockReader(self.path) as reader:
+            results = []
+            thread = threading.Thread(target=lambda: results.append(reader.read()))
+            thread.start()
+            time.sleep(0.05)
+            self.assertTrue(thread.is_alive())  # The checksum does not match, so the copy is not accepted
+            writer.update_status({"left_encoder": 2})
+            thread.join(1)
+            self.assertEqual(results[0]["status"]["left_encoder"], 2.0)
+
+    def test_helper_publishes_responses(self):
+        with HackerbotEmulator(latency=0.001) as emulator:
+            helper = SerialHelper(port=emulator.port)
+            try:
+                helper.send_command_and_wait("JSON, 1", "json", timeout=1)
+                helper.start_state_block(self.path)
+                helper.send_command_and_wait("PING", "ping", timeout=1)
+                helper.send_command_and_wait("B_POSE", "pose", timeout=1)
+                helper.send_command_and_wait("B_STATUS", "status", timeout=1)
+
+                with StateBlockReader(self.path) as reader:
+                    deadline = time.monotonic() + 1
+                    while reader.read()["status"] is None and time.monotonic() < deadline:
+                        time.sleep(0.005)
+                    snapshot = reader.read()
+                self.assertEqual(snapshot["status"]["left_set_speed"], 0.0)
+                self.assertEqual(snapshot["pose"]["map_id"], 1)
+                self.assertTrue(snapshot["components"]["main_controller"])
+            finally:
+                helper.disconnect_serial()
+        self.assertFalse(os.path.exists(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for SerialHelper.subscribe.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import time
+import threading
+import unittest
+from unittest.mock import patch
+from hackerbot.utils.serial_helper import SerialHelper
+
+STATUS = b'{"command": "status", "success": "true", "left_speed": %d}\r\n'
+PING = b'{"command": "ping", "success": "true"}\r\n'
+
+class TestSubscriptions(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch('serial.Serial')
+        mock_serial = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_serial.return_value.is_open = True
+        self.controller = SerialHelper(port='/dev/MOCK_PORT')
+        self.controller.stop_read_thread()
+        self.addCleanup(self.controller._close_subscriptions)
+
+    def feed(self, *speeds):
+        self.controller._handle_rx_data(b"".join(STATUS % speed for speed in speeds))
+
+    def wait_for(self, condition, timeout=1):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertTrue(condition())
+
+    def test_callback(self):
+        received = []
+        done = threading.Event()
+
+        def on_status(entry):
+            received.append(entry["left_speed"])
+            if len(received) == 3:
+                done.set()
+
+        self.controller.subscribe("status", callback=on_status)
+        self.feed(1, 2)
+        self.controller._handle_rx_data(PING)
+        self.feed(3)
+        self.assertTrue(done.wait(1))
+        self.assertEqual(received, [1, 2, 3])
+        # Subscribed entries are still indexed
+        self.assertEqual(self.controller.get_latest_response("status").entry["left_speed"], 3)
+
+    def test_queue_and_iteration(self):
+        with self.controller.subscribe("status") as subscription:
+            self.feed(1, 2)
+            self.assertEqual(subscription.get(timeout=1)["left_speed"], 1)
+            self.assertEqual(subscription.get(timeout=1)["left_speed"], 2)
+            with self.assertRaises(TimeoutError):
+                subscription.get(timeout=0.01)
+            self.feed(3)
+            self.assertEqual(subscription.get(timeout=1)["left_speed"], 3)
+        self.assertEqual(list(subscription), [])
+        self.feed(4)
+        self.assertEqual(self.controller._subscriptions, {})
+
+    def test_predicate(self):
+        subscription = self.controller.subscribe(predicate=lambda entry: entry.get("left_speed", 0) > 1)
+        self.controller._handle_rx_data(PING)
+        self.feed(1, 2)
+        self.assertEqual(subscription.get(timeout=1)["left_speed"], 2)
+        with self.assertRaises(TimeoutError):
+            subscription.get(timeout=0.05)
+
+        broken = self.controller.subscribe("status", predicate=lambda entry: entry["missing"])
+        self.feed(5)
+        self.assertEqual(subscription.get(timeout=1)["left_speed"], 5)
+        self.assertEqual(broken.errors, 1)
+        self.assertIsInstance(broken.last_error, KeyError)
+
+    def test_drop_oldest(self):
+        subscription = self.controller.subscribe("status", queue_size=2)
+        self.feed(1, 2, 3, 4)
+        self.wait_for(lambda: subscription.dropped == 2)
+        subscription.close()
+        self.assertEqual([entry["left_speed"] for entry in subscription], [3, 4])
+        self.assertEqual(subscription.dropped, 2)
+
+    def test_slow_callback_drops_oldest(self):
+        started = threading.Event()
+        release = threading.Event()
+        received = []
+
+        def slow(entry):
+            started.set()
+            release.wait(1)
+            received.append(entry["left_speed"])
+
+        subscription = self.controller.subscribe("status", callback=slow, queue_size=2)
+        self.feed(0)
+        self.assertTrue(started.wait(1))
+        self.feed(*range(1, 10))
+        release.set()
+        self.wait_for(lambda: len(received) == 3)
+        self.assertEqual(received, [0, 8, 9])
+        self.assertEqual(subscription.dropped, 7)
+
+    def test_block_does_not_stall_reader(self):
+        blocked = self.controller.subscribe("status", queue_size=1, policy="block")
+        other = self.controller.subscribe("ping")
+        self.assertIsNot(blocked._worker, other._worker)
+
+        self.feed(1, 2, 3)
+        self.controller._handle_rx_data(PING)
+        self.assertEqual(other.get(timeout=1)["command"], "ping")
+        self.assertEqual([blocked.get(timeout=1)["left_speed"] for _ in range(3)], [1, 2, 3])
+        self.assertEqual(blocked.dropped, 0)
+
+    def test_unread_block_subscriber_does_not_stall_others(self):
+        stuck = self.controller.subscribe("status", queue_size=1, policy="block")  # Never read
+        received = [[], []]
+        for speeds in received:  # Would share a worker with stuck if it were round-robin
+            self.controller.subscribe("status", callback=lambda entry, speeds=speeds: speeds.append(entry["left_speed"]))
+
+        self.feed(*range(5))
+        self.wait_for(lambda: received == [[0, 1, 2, 3, 4]] * 2)
+        self.assertEqual(stuck.get(timeout=1)["left_speed"], 0)
+
+        worker = stuck._worker
+        stuck.close()
+        self.wait_for(lambda: not worker._thread.is_alive())
+
+    def test_callback_errors_are_counted(self):
+        done = threading.Event()
+
+        def failing(entry):
+            done.set()
+            raise RuntimeError("boom")
+
+        subscription = self.controller.subscribe("status", callback=failing)
+        self.feed(1)
+        self.assertTrue(done.wait(1))
+        self.controller._close_subscriptions()
+        self.assertEqual(subscription.errors, 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.controller.subscribe()
+        with self.assertRaises(ValueError):
+            self.controller.subscribe("status", policy="newest")
+        with self.assertRaises(ValueError):
+            self.controller.subscribe("status", queue_size=0)
+
+    def test_disconnect_closes_subscriptions(self):
+        subscription = self.controller.subscribe("status")
+        self.controller.disconnect_serial()
+        self.assertTrue(subscription.closed)
+        self.assertIsNone(subscription.get(timeout=1))
+        self.assertEqual(self.controller._dispatch_workers, [])
+
+if __name__ == '__main__':
+    unittest.main()
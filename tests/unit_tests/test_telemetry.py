@@ -0,0 +1,108 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the base telemetry history.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import math
+import time
+import unittest
+import numpy as np
+from hackerbot import Hackerbot
+from hackerbot.base.telemetry import TelemetryRing, TelemetrySampler
+from hackerbot.utils.emulator import HackerbotEmulator
+
+def status(i, **fields):
+    return {"command": "status", "timestamp": i * 50, "left_encoder": i, "right_encoder": i,
+            "left_speed": 10.0 * i, "right_speed": 20.0 * i, "left_set_speed": 0, "right_set_speed": 0,
+            "wall_tof": 500, **fields}
+
+class TestTelemetryRing(unittest.TestCase):
+
+    def test_latest_wraps_without_copying(self):
+        ring = TelemetryRing(capacity=4)
+        self.assertEqual(len(ring.latest()), 0)
+        for i in range(10):
+            ring.append(status(i), now=float(i))
+
+        self.assertEqual(len(ring), 4)
+        latest = ring.latest()
+        self.assertEqual(list(latest["left_encoder"]), [6, 7, 8, 9])
+        self.assertEqual(list(ring.latest(2)["time"]), [8.0, 9.0])
+        self.assertTrue(np.shares_memory(latest, ring._buffer))
+        self.assertIsNotNone(latest.base)
+
+    def test_windowed_queries(self):
+        ring = TelemetryRing(capacity=100)
+        for i in range(10):
+            ring.append(status(i, wall_tof=500 - (30 if i == 7 else 0)), now=float(i))
+
+        window = ring.window(3.0, now=9.0)
+        self.assertEqual(list(window["time"]), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(ring.mean_speed(3.0, now=9.0), (75.0, 150.0))
+        self.assertEqual(ring.max_tof_delta(3.0, now=9.0), 30.0)
+        self.assertTrue(math.isnan(ring.max_tof_delta(0.5, now=9.0)))
+        self.assertTrue(all(math.isnan(v) for v in ring.mean_speed(1.0, now=100.0)))
+
+    def test_missing_values_are_nan(self):
+        ring = TelemetryRing(capacity=2)
+        ring.append({"command": "status", "left_speed": 5, "wall_tof": None})
+        sample = ring.latest(1)[0]
+        self.assertEqual(sample["left_speed"], 5.0)
+        self.assertTrue(math.isnan(sample["wall_tof"]))
+        self.assertTrue(math.isnan(sample["right_speed"]))
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            TelemetryRing(capacity=0)
+
+class TestTelemetrySampler(unittest.TestCase):
+
+    def test_polls_at_rate(self):
+        with HackerbotEmulator(latency=0.001) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            self.assertTrue(bot.base.start_telemetry(rate=50))
+            self.assertFalse(bot.base.start_telemetry())  # Already running
+            time.sleep(0.5)
+            ring = bot.base.telemetry
+            self.assertGreater(len(ring), 15)
+            self.assertLess(len(ring), 35)
+            self.assertEqual(ring.mean_speed(1.0), (0.0, 0.0))
+            bot.base.stop_telemetry()
+            self.assertIsNone(bot.base.telemetry)
+
+    def test_streamed_status_is_not_polled(self):
+        with HackerbotEmulator(latency=0.001, telemetry_rate=100) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            self.addCleanup(bot.disconnect_serial)
+            sampler = TelemetrySampler(bot, rate=20)
+            sent = len(emulator.received)
+            sampler.start()
+            time.sleep(0.5)
+            sampler.stop()
+            self.assertGreater(len(sampler.ring), 25)
+            self.assertLessEqual(emulator.received[sent:].count("B_STATUS"), 1)
+
+    def test_stops_on_disconnect(self):
+        with HackerbotEmulator(latency=0.001) as emulator:
+            bot = Hackerbot(port=emulator.port)
+            sampler = TelemetrySampler(bot, rate=50)
+            sampler.start()
+            bot.disconnect_serial()
+            sampler._thread.join(timeout=1)
+            self.assertFalse(sampler._thread.is_alive())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This module contains the unit tests for the transports in utils/transport.py.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from hackerbot.utils.serial_helper import SerialHelper
+from hackerbot.utils.transport import open_transport, TcpTransport, UnixSocketTransport
+
+class FakeController(threading.Thread):
+    """Accepts one connection and answers PING like the main controller."""
+
+    def __init__(self, server_socket):
+        super().__init__(daemon=True)
+        self.server_socket = server_socket
+        self.received = b""
+        self.conn = None
+
+    def run(self):
+        self.conn, _ = self.server_socket.accept()
+        while True:
+            data = self.conn.recv(1024)
+            if not data:
+                break
+            self.received += data
+            if b"PING\r\n" in data:
+                self.conn.sendall(b'{"command": "ping", "success": "true", "main_controller": "attached"}\r\n')
+
+class TestTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.url = "tcp://127.0.0.1:{0}".format(self.server.getsockname()[1])
+
+    def tearDown(self):
+        self.server.close()
+
+    @patch('serial.Serial')
+    def test_open_transport_device_path(self, mock_serial):
+        transport = open_transport("/dev/ttyACM0", 230400, 0.5)
+        mock_serial.assert_called_once_with(port="/dev/ttyACM0", baudrate=230400, timeout=0.5)
+        self.assertIs(transport, mock_serial.return_value)
+
+    def test_open_transport_tcp(self):
+        transport = open_transport(self.url, 230400, 0.5)
+        self.assertIsInstance(transport, TcpTransport)
+        self.assertTrue(transport.is_open)
+        transport.close()
+        self.assertFalse(transport.is_open)
+
+    def test_open_transport_invalid_tcp(self):
+        with self.assertRaises(ValueError):
+            open_transport("tcp://localhost", 230400, 0.5)
+
+    def test_read_write(self):
+        controller = FakeController(self.server)
+        controller.start()
+        transport = TcpTransport("127.0.0.1", self.server.getsockname()[1], 1.0)
+
+        transport.write(b"PING\r\n")
+        data = transport.read(1)
+        time.sleep(0.05)
+        data += transport.read(transport.in_waiting)
+        self.assertTrue(data.startswith(b'{"command": "ping"'))
+        self.assertTrue(data.endswith(b"\r\n"))
+        transport.close()
+
+    def test_read_timeout_and_cancel(self):
+        transport = TcpTransport("127.0.0.1", self.server.getsockname()[1], 0.05)
+        self.assertEqual(transport.read(1), b"")
+
+        transport.timeout = 5
+        threading.Timer(0.05, transport.cancel_read).start()
+        start = time.monotonic()
+        self.assertEqual(transport.read(1), b"")
+        self.assertLess(time.monotonic() - start, 1)
+        transport.close()
+
+    def test_read_after_remote_close(self):
+        transport = TcpTransport("127.0.0.1", self.server.getsockname()[1], 1.0)
+        conn, _ = self.server.accept()
+        conn.close()
+        with self.assertRaises(ConnectionError):
+            transport.read(1)
+        transport.close()
+
+    def test_serial_helper_over_tcp(self):
+        controller = FakeController(self.server)
+        controller.start()
+        helper = SerialHelper(port=self.url)
+
+        response = helper.send_command_and_wait("PING", "ping", timeout=2)
+        self.assertEqual(response["main_controller"], "attached")
+        self.assertEqual(helper.get_board_and_port()[1], self.url)
+        helper.disconnect_serial()
+
+    def test_serial_helper_over_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "hackerbot.sock")
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(path)
+            server.listen(1)
+            controller = FakeController(server)
+            controller.start()
+
+            helper = SerialHelper(port="unix://" + path)
+            self.assertIsInstance(helper.ser, UnixSocketTransport)
+            response = helper.send_command_and_wait("PING", "ping", timeout=2)
+            self.assertEqual(response["command"], "ping")
+            helper.disconnect_serial()
+            server.close()
+
+if __name__ == '__main__':
+    unittest.main()